@@ -0,0 +1 @@
+"""성능 측정 스크립트 (agent 디렉토리에서 `python -m bench.<name>`으로 실행)"""
@@ -0,0 +1,155 @@
+"""렌터카 가용성 엔진 측정 (버킷 비트셋 색인 vs 예약 전체 선형 검사, 동시 예약)
+
+지점별 차량 N대와 기존 예약(가동률 목표)을 만든 뒤 무작위 조건(지점, 차종, 옵션, [픽업, 반납)) 조회의 지연(p50/p95)과 QPS를 측정한다.
+일부 조회는 모든 예약을 하나씩 검사하는 방식으로도 구해 빈 차량 목록이 같은지 확인한다.
+마지막으로 여러 스레드가 겹치는 시간대를 동시에 예약해 이중 예약이 없는지와 초당 예약 처리량을 확인하고,
+예약/취소 후에도 색인 조회가 선형 검사와 같은지 확인한다.
+실행: python -m bench.bench_car_availability [queries] [vehicles_per_location] [threads]
+"""
+
+import sys
+import time
+import random
+import threading
+from datetime import timedelta
+
+from src.search.car_availability import CAR_BASE_PRICES, CAR_OPTIONS, LOCATIONS, CarAvailability, search_cars
+
+
+OPTION_SETS = [[], ["gps"], ["childseat"], ["childseat", "wifi"]]
+
+
+def linear_free(fleet, car_type: str, start: int, end: int, options: int) -> list[int]:
+    """모든 예약을 하나씩 검사해 빈 차량 번호 (가격순)"""
+    return [
+        vehicle for vehicle in fleet.by_type[car_type]
+        if fleet.options[vehicle] & options == options
+        and all(e <= start or s >= end for s, e in fleet.reservations[vehicle])
+    ]
+
+
+def check_index(fleet, rng: random.Random, rounds: int = 200) -> None:
+    """색인 조회 = 선형 검사 (무작위 시간대/차종/옵션)"""
+    for _ in range(rounds):
+        start = rng.randrange(-24, 24 * 30) * 60
+        end = start + rng.randint(1, 24 * 7) * 60
+        car_type = rng.choice(["", *CAR_BASE_PRICES])
+        options = rng.choice([0, 1, 2, 6])
+        assert fleet.free_vehicles(car_type, start, end, options) == linear_free(fleet, car_type, start, end, options)
+
+
+def check_no_overlap(fleet) -> None:
+    for intervals in fleet.reservations:
+        for (s1, e1), (s2, e2) in zip(intervals, intervals[1:]):
+            assert s1 < e1 <= s2 < e2, "overlapping reservations"
+
+
+def main() -> None:
+    queries = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    per_location = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    threads = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+
+    start = time.perf_counter()
+    availability = CarAvailability(count=per_location)
+    reservations = sum(len(r) for fleet in availability.fleets.values() for r in fleet.reservations)
+    print(
+        f"vehicles={len(availability):,} ({per_location:,}/location × {len(LOCATIONS)}) reservations={reservations:,} "
+        f"build={(time.perf_counter() - start) * 1000:.0f}ms"
+    )
+
+    rng = random.Random(0)
+    cases = []
+    for _ in range(queries):
+        pickup = availability.epoch + timedelta(days=rng.randrange(1, 80), hours=rng.randrange(7, 21))
+        cases.append({
+            "pickupLocation": rng.choice(LOCATIONS),
+            "pickupDateTime": pickup.isoformat(timespec="minutes"),
+            "dropoffDateTime": (pickup + timedelta(days=rng.randint(1, 7), hours=rng.randrange(-3, 4))).isoformat(timespec="minutes"),
+            "type": rng.choice(["", *CAR_BASE_PRICES]),
+            "options": rng.choice(OPTION_SETS),
+            "insurance": rng.choice([[], ["basic"], ["full", "super"]]),
+        })
+
+    latencies = []
+    matched = 0
+    wall = time.perf_counter()
+    for params in cases:
+        start = time.perf_counter()
+        matched += len(search_cars(params, availability))
+        latencies.append((time.perf_counter() - start) * 1000)
+    wall = time.perf_counter() - wall
+    latencies.sort()
+    print(
+        f"search: {queries} in {wall:.2f}s → {queries / wall:,.0f} qps, "
+        f"p50={latencies[len(latencies) // 2]:.3f}ms p95={latencies[int(len(latencies) * 0.95)]:.3f}ms "
+        f"max={latencies[-1]:.2f}ms, avg {matched / queries:.1f} vehicles"
+    )
+
+    # 전체 빈 차량 목록 비교 (limit 없음)
+    sample = cases[:100]
+    indexed_s = linear_s = 0.0
+    for params in sample:
+        fleet = availability.fleets[params["pickupLocation"]]
+        start_min = availability.minutes(availability.epoch.fromisoformat(params["pickupDateTime"]))
+        end_min = availability.minutes(availability.epoch.fromisoformat(params["dropoffDateTime"]))
+        options = sum(CAR_OPTIONS[name][0] for name in params["options"])
+        t = time.perf_counter()
+        indexed = fleet.free_vehicles(params["type"], start_min, end_min, options)
+        indexed_s += time.perf_counter() - t
+        t = time.perf_counter()
+        expected = linear_free(fleet, params["type"], start_min, end_min, options)
+        linear_s += time.perf_counter() - t
+        assert indexed == expected, f"mismatch: {params}"
+    print(
+        f"full free list: index {indexed_s / len(sample) * 1000:.2f}ms vs linear {linear_s / len(sample) * 1000:.2f}ms "
+        f"({linear_s / indexed_s:.1f}x)"
+    )
+
+    # 예약하면 조회에서 빠지고, 취소하면 다시 나옴
+    params = {**cases[0], "type": "", "options": [], "insurance": []}
+    first = search_cars(params, availability)[0]
+    pickup = availability.epoch.fromisoformat(params["pickupDateTime"])
+    dropoff = availability.epoch.fromisoformat(params["dropoffDateTime"])
+    assert availability.reserve(first["id"], pickup, dropoff)
+    assert not availability.reserve(first["id"], pickup + timedelta(hours=1), dropoff + timedelta(hours=1))
+    assert first["id"] not in [row["id"] for row in search_cars(params, availability)]
+    assert availability.release(first["id"], pickup, dropoff)
+    assert search_cars(params, availability)[0]["id"] == first["id"]
+
+    # 동시 예약: 같은 지점 차량 50대에 겹치는 시간대 예약을 여러 스레드가 동시에 시도
+    fleet = availability.fleets["CJU"]
+    vehicles = fleet.by_type[""][:50]
+    attempts_per_thread = 20000
+    results = [0] * threads
+
+    def worker(index: int) -> None:
+        local = random.Random(index)
+        for _ in range(attempts_per_thread):
+            begin = (100 + local.randrange(0, 24 * 14)) * 60
+            if fleet.reserve(local.choice(vehicles), begin, begin + local.randint(2, 48) * 60):
+                results[index] += 1
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    check_no_overlap(fleet)
+    check_index(fleet, rng)
+    # 예약 일부 취소 후에도 색인 일치
+    for vehicle in vehicles:
+        for interval in fleet.reservations[vehicle][::3]:
+            assert fleet.release(vehicle, *interval)
+    check_index(fleet, rng)
+    total = threads * attempts_per_thread
+    print(
+        f"concurrent reserve: {threads} threads × {attempts_per_thread} attempts in {elapsed:.2f}s "
+        f"→ {total / elapsed:,.0f} attempts/s, {sum(results):,} accepted, no overlaps, index consistent"
+    )
+    print("checks passed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""체크포인터 턴당 오버헤드 벤치마크 (MemorySaver vs SQLite)
+
+한 턴 = 최신 체크포인트 조회 + 체크포인트 저장 + pending writes 저장.
+실행: python -m bench.bench_checkpointer [turns] [threads]
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from langchain_core.messages import HumanMessage, AIMessage
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.memory import MemorySaver
+
+from src.graph.checkpoint import SqliteCheckpointSaver
+
+
+def _make_checkpoint(turn: int, history: list) -> dict:
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {
+        "chat_history": list(history),
+        "entities": {"departure": "ICN", "arrival": "KIX", "adults": 2},
+        "current_surface_id": "flight-booking",
+    }
+    checkpoint["channel_versions"] = {k: turn + 1 for k in checkpoint["channel_values"]}
+    return checkpoint
+
+
+def run(saver, turns: int, threads: int) -> float:
+    """턴당 평균 소요 시간(ms) 반환"""
+    histories = {f"t{i}": [] for i in range(threads)}
+    configs = {t: {"configurable": {"thread_id": t, "checkpoint_ns": ""}} for t in histories}
+
+    start = time.perf_counter()
+    for turn in range(turns):
+        for thread_id, history in histories.items():
+            config = configs[thread_id]
+            saver.get_tuple(config)
+
+            history.append(HumanMessage(content=f"메시지 {turn}"))
+            history.append(AIMessage(content=f"응답 {turn}"))
+            checkpoint = _make_checkpoint(turn, history)
+            new_config = saver.put(
+                config, checkpoint, {"source": "loop", "step": turn}, checkpoint["channel_versions"]
+            )
+            saver.put_writes(new_config, [("messages", [{"assistantMessage": "ok"}])], task_id=f"task-{turn}")
+            configs[thread_id] = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    elapsed = time.perf_counter() - start
+    return elapsed / (turns * threads) * 1000
+
+
+def main() -> None:
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    print(f"turns={turns}, threads={threads}")
+    print(f"MemorySaver: {run(MemorySaver(), turns, threads):.3f} ms/turn")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.sqlite")
+        for batch in (1, 64):
+            saver = SqliteCheckpointSaver(path=path, flush_batch=batch)
+            print(f"SQLite (batch={batch}): {run(saver, turns, threads):.3f} ms/turn")
+            saver.close()
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""SSE 답변 토큰 묶음 전송 벤치마크
+
+동시 스트림 S개가 각각 토큰 N개를 생성(토큰 간격 ~1ms, 버스트 포함)할 때
+토큰마다 전송 vs coalesce_answers 적용 시 SSE 쓰기(syscall) 횟수와 CPU 시간 비교.
+실행: python -m bench.bench_coalesce [streams] [tokens]
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+
+from src.payload import encode_response
+from src.streaming import coalesce_answers
+
+
+async def fake_stream(tokens: int, seed: int):
+    """conversation_stream과 같은 형식의 이벤트 (status → thought → answer 토큰들 → done)"""
+    rng = random.Random(seed)
+    yield {"type": "status", "text": "생각하는 중"}
+    yield {"type": "thought", "text": "여행지 정보를 정리하고 있어요"}
+    for i in range(tokens):
+        yield {"type": "answer", "text": rng.choice(["안녕", "하세요", " 후쿠오카", "는", " 3월", "에", " 좋아요", "."])}
+        # 모델 토큰은 버스트로 도착하는 경우가 많음
+        if rng.random() < 0.5:
+            await asyncio.sleep(0.001)
+    yield {"type": "done", "messages": [{"assistantMessage": "..."}]}
+
+
+async def write_stream(fd: int, tokens: int, seed: int, max_delay_ms: float) -> tuple[int, str]:
+    """SSE 쓰기 횟수와 재구성한 답변 반환"""
+    writes = 0
+    answer = []
+    async for event in coalesce_answers(fake_stream(tokens, seed), max_delay_ms=max_delay_ms):
+        if event["type"] == "answer":
+            answer.append(event["text"])
+        os.write(fd, b"data: " + encode_response(event) + b"\n\n")
+        writes += 1
+    return writes, "".join(answer)
+
+
+async def run(streams: int, tokens: int, max_delay_ms: float) -> tuple[int, float, float, list]:
+    fd = os.open(os.devnull, os.O_WRONLY)
+    try:
+        cpu, wall = time.process_time(), time.perf_counter()
+        results = await asyncio.gather(*(write_stream(fd, tokens, i, max_delay_ms) for i in range(streams)))
+        cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    finally:
+        os.close(fd)
+    return sum(writes for writes, _ in results), cpu, wall, [answer for _, answer in results]
+
+
+def main() -> None:
+    streams = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    tokens = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    print(f"streams={streams}, tokens/stream={tokens}")
+
+    baseline = None
+    for max_delay_ms in (0, 30):
+        writes, cpu, wall, answers = asyncio.run(run(streams, tokens, max_delay_ms))
+        if baseline is None:
+            baseline = (writes, cpu, answers)
+        else:
+            # 묶어도 답변 내용과 순서는 같아야 함
+            assert answers == baseline[2]
+        label = "per-token" if max_delay_ms == 0 else f"coalesced {max_delay_ms:.0f}ms"
+        print(
+            f"{label:15s} writes={writes:7d} ({writes / streams:6.1f}/stream) "
+            f"cpu={cpu * 1000:7.1f} ms ({cpu / streams * 1000:.2f} ms/stream) wall={wall:.2f} s"
+        )
+    print(f"writes -{(1 - writes / baseline[0]) * 100:.0f}%, cpu -{(1 - cpu / baseline[1]) * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""항공편 인벤토리 조회 성능 측정 (색인 조회 vs 선형 탐색)
+
+인벤토리 생성 시간/레그 수/메모리, 저장·불러오기 시간, 무작위 노선·날짜 조회의 초당 처리량(QPS)을 측정한다.
+같은 조건을 전체 레그 선형 탐색으로도 구해 결과가 같은지 확인한다 (선형 탐색은 일부 조회만).
+마지막으로 노선당 하루 최대 편수를 늘린 수백만 레그 규모(기본 96편 ≈ 260만 레그)에서도 생성 시간/크기/QPS를 측정한다.
+실행: python -m bench.bench_flight_inventory [queries] [days] [large_max_daily]
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+from datetime import timedelta
+
+from src.search.flight_inventory import CABINS, FlightInventory, search_flights
+
+
+def linear_query(inventory: FlightInventory, origin: str, dest: str, on, cabin: str, seats: int) -> list[tuple]:
+    """이분 탐색 없이 전체 그룹/레그를 순서대로 훑어 같은 조건의 (편명, 출발 시각, 운임) 목록"""
+    o, d = inventory.airports.index(origin), inventory.airports.index(dest)
+    key = (o * len(inventory.airports) + d) * inventory.days + (on - inventory.start).days
+    cabin_index = CABINS.index(cabin)
+    rows = []
+    for group, start in enumerate(inventory.group_starts[:-1]):
+        if inventory.group_keys[group] != key:
+            continue
+        for i in range(start, inventory.group_starts[group + 1]):
+            if inventory.seats[cabin_index][i] >= seats:
+                rows.append((inventory.number[i], inventory.dep[i], inventory.fares[cabin_index][i]))
+    return rows
+
+
+def random_cases(inventory: FlightInventory, queries: int, days: int) -> list[tuple]:
+    rng = random.Random(0)
+    cases = []
+    for _ in range(queries):
+        origin, dest = rng.sample(inventory.airports, 2)
+        cases.append((origin, dest, inventory.start + timedelta(days=rng.randrange(days)), rng.choice(CABINS), rng.randint(1, 4)))
+    return cases
+
+
+def measure_queries(inventory: FlightInventory, cases: list[tuple]) -> float:
+    """조회 처리량 출력, 조회당 평균 소요 시간(초) 반환"""
+    start = time.perf_counter()
+    matched = 0
+    for origin, dest, on, cabin, seats in cases:
+        matched += len(inventory.query(origin, dest, on, cabin, seats))
+    elapsed = time.perf_counter() - start
+    queries = len(cases)
+    print(f"query: {queries} in {elapsed:.2f}s → {queries / elapsed:,.0f} qps, {elapsed / queries * 1e6:.0f}µs/query, avg {matched / queries:.1f} legs")
+    return elapsed / queries
+
+
+def main() -> None:
+    queries = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 365
+    large_max_daily = int(sys.argv[3]) if len(sys.argv) > 3 else 96
+
+    start = time.perf_counter()
+    inventory = FlightInventory.build(days=days)
+    build_s = time.perf_counter() - start
+    print(f"legs={len(inventory):,} groups={len(inventory.group_keys):,} size={inventory.nbytes / 1e6:.1f}MB build={build_s:.2f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "flights.bin")
+        start = time.perf_counter()
+        inventory.save(path)
+        save_s = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded = FlightInventory.load(path)
+        load_s = time.perf_counter() - start
+        assert len(loaded) == len(inventory) and loaded.fare_first == inventory.fare_first
+        print(f"save={save_s * 1000:.0f}ms load={load_s * 1000:.0f}ms ({os.path.getsize(path) / 1e6:.1f}MB)")
+
+    cases = random_cases(inventory, queries, days)
+    per_query = measure_queries(inventory, cases)
+
+    # 조회 결과 검증 + 선형 탐색 비교 (일부만)
+    sample = cases[:50]
+    start = time.perf_counter()
+    for origin, dest, on, cabin, seats in sample:
+        expected = linear_query(inventory, origin, dest, on, cabin, seats)
+        rows = inventory.query(origin, dest, on, cabin, seats)
+        assert [(int(r["flightNo"][2:]), r["price"]) for r in rows] == [(n, fare) for n, _, fare in expected]
+        times = [r["departureTime"] for r in rows]
+        assert times == sorted(times), "not sorted by departure"
+        assert all(r["seatsLeft"] >= seats for r in rows)
+    linear_s = (time.perf_counter() - start) / len(sample)
+    print(f"linear scan (no bisect): {linear_s * 1000:.1f}ms/query ({linear_s / per_query:,.0f}x slower)")
+
+    # 출발 시각 범위 조회
+    origin, dest, on = "ICN", "KIX", inventory.start + timedelta(days=1)
+    morning = inventory.query(origin, dest, on, depart_after=6 * 60, depart_before=12 * 60)
+    assert all("06:00" <= r["departureTime"] < "12:00" for r in morning)
+
+    # 왕복 조회 (/flight 데이터 모델)
+    params = {
+        "departure": origin, "arrival": dest, "tripType": "roundtrip", "class": "economy",
+        "departureDate": on.isoformat(), "returnDate": (on + timedelta(days=3)).isoformat(),
+        "passengers": {"adults": 2, "children": 1, "infants": 1},
+    }
+    start = time.perf_counter()
+    for _ in range(1000):
+        roundtrip = search_flights(params, inventory)
+    print(f"roundtrip search_flights: {(time.perf_counter() - start) * 1000:.0f}µs/query, {len(roundtrip)} itineraries")
+    assert all(r["returnFlight"]["departureDate"] == params["returnDate"] and r["seatsLeft"] >= 3 for r in roundtrip)
+
+    # 수백만 레그 규모
+    del inventory, loaded
+    start = time.perf_counter()
+    large = FlightInventory.build(days=days, max_daily=large_max_daily)
+    print(
+        f"[max_daily={large_max_daily}] legs={len(large):,} size={large.nbytes / 1e6:.1f}MB "
+        f"build={time.perf_counter() - start:.2f}s"
+    )
+    large_cases = random_cases(large, queries, days)
+    measure_queries(large, large_cases)
+    for origin, dest, on, cabin, seats in large_cases[:20]:
+        expected = linear_query(large, origin, dest, on, cabin, seats)
+        assert [(int(r["flightNo"][2:]), r["price"]) for r in large.query(origin, dest, on, cabin, seats)] == [
+            (n, fare) for n, _, fare in expected
+        ]
+    print("checks passed")
+
+
+if __name__ == "__main__":
+    main()
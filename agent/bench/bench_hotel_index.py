@@ -0,0 +1,103 @@
+"""호텔 색인 조회 성능 측정 (NumPy 벡터 연산 vs 순수 Python 반복)
+
+도시별 숙소 N개 색인의 생성 시간/메모리, 무작위 조건(도시, 날짜, 객실/인원, 조식·수영장 필터, 가격/평점 정렬) 조회 지연(p50/p95)과
+QPS를 측정한다. 같은 조건을 숙소별 Python 반복으로도 구해 상위 결과가 같은지 확인한다 (일부 조회만).
+실행: python -m bench.bench_hotel_index [queries] [hotels_per_city]
+"""
+
+import sys
+import time
+import random
+from datetime import timedelta
+
+from src.search.hotel_index import AMENITY_BITS, HOTEL_AREAS, HotelIndex, search_hotels
+
+
+FILTERS = [[], ["조식"], ["수영장"], ["조식", "수영장"], ["조식", "피트니스", "스파"]]
+
+
+def python_search(index: HotelIndex, city, checkin, checkout, rooms, guests, amenities, sort, limit) -> list[str]:
+    """같은 조건을 숙소 하나씩 검사해 상위 limit개 id"""
+    hotels = index.cities[city]
+    first, last = (checkin - index.start).days, (checkout - index.start).days
+    weekday_factor = sum(float(hotels.demand[d]) for d in range(first, last) if not hotels.weekend[d])
+    weekend_factor = sum(float(hotels.demand[d]) for d in range(first, last) if hotels.weekend[d])
+    required = 0
+    for name in amenities:
+        required |= AMENITY_BITS[name]
+    per_room = -(-guests // rooms)
+
+    amenity_bits, rooms_left, max_guests = hotels.amenities.tolist(), hotels.rooms_left.tolist(), hotels.max_guests.tolist()
+    weekday_rate, weekend_rate, rating = hotels.weekday_rate.tolist(), hotels.weekend_rate.tolist(), hotels.rating.tolist()
+    matched = []
+    for i in range(len(hotels)):
+        if amenity_bits[i] & required != required or rooms_left[i] < rooms or max_guests[i] < per_room:
+            continue
+        total = round(weekday_rate[i] * weekday_factor + weekend_rate[i] * weekend_factor)
+        matched.append(((50 - rating[i]) if sort == "rating" else 0, total, i))
+    matched.sort()
+    return [f"{city}-{i:05d}" for _, _, i in matched[:limit]]
+
+
+def main() -> None:
+    queries = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    per_city = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    start = time.perf_counter()
+    index = HotelIndex(list(HOTEL_AREAS), count=per_city)
+    print(f"hotels={len(index):,} ({per_city:,}/city × {len(index.cities)}) size={index.nbytes / 1e6:.1f}MB build={(time.perf_counter() - start) * 1000:.0f}ms")
+
+    rng = random.Random(0)
+    cases = []
+    for _ in range(queries):
+        checkin = index.start + timedelta(days=rng.randrange(1, index.days - 14))
+        rooms = rng.randint(1, 3)
+        cases.append((
+            rng.choice(list(HOTEL_AREAS)), checkin, checkin + timedelta(days=rng.randint(1, 7)),
+            rooms, rng.randint(rooms, rooms * 3), rng.choice(FILTERS), rng.choice(("price", "rating")), 60,
+        ))
+
+    latencies = []
+    wall = time.perf_counter()
+    for case in cases:
+        start = time.perf_counter()
+        index.search(*case)
+        latencies.append((time.perf_counter() - start) * 1000)
+    wall = time.perf_counter() - wall
+    latencies.sort()
+    print(
+        f"search: {queries} in {wall:.2f}s → {queries / wall:,.0f} qps, "
+        f"p50={latencies[len(latencies) // 2]:.2f}ms p95={latencies[int(len(latencies) * 0.95)]:.2f}ms max={latencies[-1]:.2f}ms"
+    )
+
+    # 결과 검증 + Python 반복 비교 (일부만)
+    sample = cases[:30]
+    start = time.perf_counter()
+    for case in sample:
+        city, checkin, checkout, rooms, guests, amenities, sort, limit = case
+        rows = index.search(*case)
+        assert [row["id"] for row in rows] == python_search(index, *case), f"mismatch: {case}"
+        assert all(set(amenities) <= set(row["amenities"]) for row in rows)
+        assert all(row["nights"] == (checkout - checkin).days and row["rooms"] == rooms for row in rows)
+        if sort == "rating":
+            ratings = [row["rating"] for row in rows]
+            assert ratings == sorted(ratings, reverse=True), "not sorted by rating"
+    python_ms = (time.perf_counter() - start) / len(sample) * 1000
+    print(f"python loop: {python_ms:.1f}ms/query ({python_ms / (wall / queries * 1000):,.0f}x slower)")
+
+    # /hotel 데이터 모델 조회
+    checkin = index.start + timedelta(days=10)
+    params = {
+        "destination": "TYO", "checkinDate": checkin.isoformat(), "checkoutDate": (checkin + timedelta(days=3)).isoformat(),
+        "rooms": 2, "guests": {"adults": 3, "children": 1}, "breakfast": True,
+    }
+    rows = search_hotels(params, index)
+    assert rows and all("조식" in row["amenities"] for row in rows)
+    prices = [row["pricePerNight"] for row in rows]
+    assert prices == sorted(prices)
+    assert search_hotels({**params, "destination": "XXX"}, index) == []
+    print("checks passed")
+
+
+if __name__ == "__main__":
+    main()
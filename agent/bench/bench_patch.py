@@ -0,0 +1,124 @@
+"""JSON Patch diff 검증 + 벤치마크
+
+1) 속성 검증: 무작위 JSON 쌍 (a, b)에 대해 apply_patch(a, make_patch(a, b)) == b, make_patch(a, a) == []
+2) 대용량 모델: 결과 목록 N행 + 옵션 데이터에서 일부 값만 바뀐 경우 diff 시간과 전송 크기 비교
+실행: python -m bench.bench_patch [cases] [rows]
+"""
+
+import sys
+import copy
+import random
+import timeit
+
+from src.forms.patch import make_patch, apply_patch, same
+from src.payload import dumps
+
+
+KEYS = ["a", "b", "c", "d", "e", "x/y", "t~1", ""]
+
+
+def random_value(rng: random.Random, depth: int = 0):
+    roll = rng.random()
+    if depth < 4 and roll < 0.3:
+        return {rng.choice(KEYS): random_value(rng, depth + 1) for _ in range(rng.randint(0, 5))}
+    if depth < 4 and roll < 0.5:
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 6))]
+    return rng.choice([0, 1, 2, 1.5, True, False, None, "", "ICN", "호텔", [], {}])
+
+
+def mutate(rng: random.Random, value, depth: int = 0):
+    """값 일부를 바꾼 새 값 (원본은 그대로)"""
+    if isinstance(value, dict) and value and rng.random() < 0.8:
+        result = dict(value)
+        for _ in range(rng.randint(1, 3)):
+            roll = rng.random()
+            key = rng.choice(list(result) or KEYS)
+            if roll < 0.2 and key in result:
+                del result[key]
+            elif roll < 0.4:
+                result[rng.choice(KEYS)] = random_value(rng, depth + 1)
+            elif key in result:
+                result[key] = mutate(rng, result[key], depth + 1)
+        return result
+    if isinstance(value, list) and value and rng.random() < 0.8:
+        result = list(value)
+        for _ in range(rng.randint(1, 3)):
+            roll = rng.random()
+            if roll < 0.25 and result:
+                del result[rng.randrange(len(result))]
+            elif roll < 0.5:
+                result.insert(rng.randint(0, len(result)), random_value(rng, depth + 1))
+            elif result:
+                i = rng.randrange(len(result))
+                result[i] = mutate(rng, result[i], depth + 1)
+        return result
+    return random_value(rng, depth)
+
+
+def check_properties(cases: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    total_ops = 0
+    for case in range(cases):
+        a = {"root": random_value(rng)}
+        b = mutate(rng, a)
+        a_before = copy.deepcopy(a)
+        ops = make_patch(a, b)
+        assert same(apply_patch(a, ops), b), f"case {case}: {a} → {b}: {ops}"
+        assert same(a, a_before), f"case {case}: source modified"
+        assert make_patch(a, copy.deepcopy(a)) == [], f"case {case}: non-empty self diff"
+        total_ops += len(ops)
+    print(f"properties: {cases} cases ok (avg {total_ops / cases:.2f} ops)")
+
+
+def _large_model(rows: int) -> dict:
+    return {
+        "flight": {
+            "tripType": "roundtrip", "departure": "ICN", "arrival": "KIX",
+            "departureDate": "2026-03-01", "returnDate": "2026-03-05",
+            "passengers": {"adults": 2, "children": 0, "infants": 0}, "class": "economy",
+        },
+        "results": [
+            {"id": f"F{i}", "airline": "대한항공", "price": 300000 + i, "departureTime": "09:00",
+             "arrivalTime": "11:20", "seats": i % 9, "tags": ["direct", "meal"]}
+            for i in range(rows)
+        ],
+        "airports": [{"value": f"A{i:03d}", "label": f"공항 {i}"} for i in range(200)],
+    }
+
+
+def bench_large(rows: int) -> None:
+    source = _large_model(rows)
+    target = copy.deepcopy(source)
+    target["flight"]["arrival"] = "FUK"
+    target["flight"]["passengers"]["adults"] = 3
+    target["results"][rows // 2]["price"] = 1
+    del target["results"][rows - 1]
+    target["results"].insert(0, {"id": "NEW", "price": 0})
+
+    ops = make_patch(source, target)
+    assert same(apply_patch(source, ops), target)
+    full = [{"op": "add", "path": f"/{key}", "value": value} for key, value in target.items()]
+
+    number = 20
+    deep_ms = min(timeit.repeat(lambda: make_patch(source, target), number=number, repeat=3)) / number * 1000
+
+    # copy-on-write 목표 데이터 (바뀌지 않은 하위 트리 공유)
+    shared = dict(source)
+    shared["flight"] = dict(source["flight"], arrival="FUK")
+    cow_ms = min(timeit.repeat(lambda: make_patch(source, shared), number=number, repeat=3)) / number * 1000
+
+    print(f"large model: rows={rows}, {len(dumps(source))} bytes")
+    print(f"  ops={len(ops)}, patch {len(dumps(ops))} bytes vs full add {len(dumps(full))} bytes")
+    print(f"  make_patch (deep copy target): {deep_ms:.2f} ms")
+    print(f"  make_patch (copy-on-write target): {cow_ms:.4f} ms")
+
+
+def main() -> None:
+    cases = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    check_properties(cases)
+    bench_large(rows)
+
+
+if __name__ == "__main__":
+    main()
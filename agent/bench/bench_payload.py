@@ -0,0 +1,57 @@
+"""폼 응답 직렬화 벤치마크 (전체 json.dumps vs 사전 인코딩 메시지 삽입)
+
+응답 = {"messages": [assistantMessage, createSurface, updateComponents, updateDataModel]}
+실행: python -m bench.bench_payload [iterations]
+"""
+
+import sys
+import json
+import timeit
+
+from src.forms import get_form_generator
+from src.forms.results import get_results_generator
+from src.payload import EncodedPayload, encode_response
+
+
+ENTITIES = {
+    "flight": {"departure": "ICN", "arrival": "KIX", "departureDate": "2026-03-01", "adults": 2},
+    "hotel": {"arrival": "FUK", "departureDate": "2026-03-01", "returnDate": "2026-03-03"},
+    "car": {"departureDate": "2026-03-01T10:00", "returnDate": "2026-03-03T10:00"},
+}
+
+
+def _plain(messages: list) -> list:
+    """사전 인코딩 없이 매번 새로 만든 것과 같은 일반 dict"""
+    return [dict(msg) if isinstance(msg, EncodedPayload) else msg for msg in messages]
+
+
+def _measure(fn, iterations: int) -> float:
+    """1회 평균 소요 시간(us) 반환 (5회 반복 중 최소값)"""
+    return min(timeit.repeat(fn, number=iterations, repeat=5)) / iterations * 1_000_000
+
+
+def run(name: str, messages: list, iterations: int) -> None:
+    response = {"messages": [{"assistantMessage": "항공권 예약을 도와드릴게요!"}, *messages]}
+    plain = {"messages": _plain(response["messages"])}
+
+    spliced = encode_response(response)
+    assert json.loads(spliced) == json.loads(json.dumps(plain, ensure_ascii=False))
+
+    full_us = _measure(lambda: json.dumps(plain, ensure_ascii=False).encode("utf-8"), iterations)
+    spliced_us = _measure(lambda: encode_response(response), iterations)
+    print(
+        f"{name:16s} {len(spliced):7d} bytes | json.dumps {full_us:8.1f} us | "
+        f"spliced {spliced_us:8.1f} us | saved {full_us - spliced_us:8.1f} us ({(1 - spliced_us / full_us) * 100:.0f}%)"
+    )
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"iterations={iterations}")
+    for form_type, entities in ENTITIES.items():
+        run(f"{form_type}-form", get_form_generator(form_type).generate(entities), iterations)
+        run(f"{form_type}-results", get_results_generator(f"{form_type}s").generate(entities), iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""검색 파이프라인 오프라인 부하 테스트 (합성 공급자 3개 fan-out)
+
+동시 검색 C개를 R회 반복하며 검색 지연(p50/p95/max), 공급자 상태(ok/timeout/error), 결과 수, 중복 제거 비율 측정.
+공급자 지연을 순차 합산한 값과 비교해 fan-out 효과를 확인하고, 병합 결과의 성질(id 유일, 최저가 유지, 가격순)을 검증한다.
+실행: python -m bench.bench_search [concurrency] [rounds]
+"""
+
+import sys
+import time
+import asyncio
+from collections import Counter
+from datetime import date, timedelta
+
+from src.search import SearchQuery, SearchAggregator, get_flight_inventory, get_hotel_index, get_car_availability
+from src.search.aggregator import default_providers
+from src.search.base import PRICE_FIELDS
+from src.forms.results import get_results_generator
+
+
+# 항공편 인벤토리 기간 안의 날짜 (오늘 기준)
+DAY = [(date.today() + timedelta(days=n)).isoformat() for n in range(10)]
+
+QUERIES = [
+    ("flights", {"flight": {"departure": "ICN", "arrival": "KIX", "departureDate": DAY[3], "returnDate": DAY[6], "class": "economy"}}),
+    ("flights", {"flight": {"departure": "GMP", "arrival": "CJU", "departureDate": DAY[5], "tripType": "oneway", "class": "business"}}),
+    ("hotels", {"hotel": {"destination": "TYO", "checkinDate": DAY[3], "checkoutDate": DAY[6]}}),
+    ("hotels", {"hotel": {"destination": "SEL"}}),
+    ("cars", {"car": {"pickupLocation": "CJU", "type": "mid"}}),
+    ("cars", {"car": {"pickupLocation": "ICN", "type": ""}}),
+]
+
+
+def check_response(aggregator: SearchAggregator, query: SearchQuery, response, outcomes_results: list) -> None:
+    """병합 결과 검증: id 유일, 각 id는 받은 결과 중 최저가, 가격순, 최대 개수"""
+    price_field = PRICE_FIELDS[query.kind]
+    ids = [result["id"] for result in response.results]
+    assert len(ids) == len(set(ids)), "duplicate ids"
+    prices = [result[price_field] for result in response.results]
+    assert prices == sorted(prices), "not sorted by price"
+    assert len(ids) <= aggregator.max_results
+    cheapest = {}
+    for result in outcomes_results:
+        cheapest[result["id"]] = min(cheapest.get(result["id"], result[price_field]), result[price_field])
+    for result in response.results:
+        assert result[price_field] == cheapest[result["id"]], "kept a more expensive duplicate"
+
+
+async def run(concurrency: int, rounds: int) -> None:
+    aggregator = SearchAggregator(default_providers())
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    received = kept = 0
+    sequential_ms = 0.0
+
+    # 원래 _collect를 감싸 공급자별 원본 결과도 보관 (검증용)
+    collect = aggregator._collect
+    raw: dict[int, list] = {}
+
+    async def recording_collect(provider, query):
+        outcome = await collect(provider, query)
+        raw.setdefault(id(query), []).extend(outcome.results)
+        return outcome
+
+    aggregator._collect = recording_collect
+
+    async def one(kind: str, form_data: dict) -> None:
+        nonlocal received, kept, sequential_ms
+        query = SearchQuery.from_form(kind, form_data)
+        start = time.perf_counter()
+        response = await aggregator.search(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results = raw.pop(id(query), [])
+        check_response(aggregator, query, response, results)
+        # 결과 화면 메시지까지 생성 (카드 변환 포함)
+        get_results_generator(kind).generate(form_data, response.results)
+        for info in response.providers.values():
+            statuses[info["status"]] += 1
+            sequential_ms += info["latencyMs"]
+        received += len(results)
+        kept += len(response.results)
+
+    wall = time.perf_counter()
+    for round_index in range(rounds):
+        await asyncio.gather(*(
+            one(*QUERIES[(round_index * concurrency + i) % len(QUERIES)]) for i in range(concurrency)
+        ))
+    wall = time.perf_counter() - wall
+
+    latencies.sort()
+    total = len(latencies)
+    print(
+        f"searches={total} wall={wall:.2f}s throughput={total / wall:.1f}/s\n"
+        f"latency p50={latencies[total // 2]:.0f}ms p95={latencies[int(total * 0.95)]:.0f}ms max={latencies[-1]:.0f}ms "
+        f"(sequential provider sum avg={sequential_ms / total:.0f}ms)\n"
+        f"providers {dict(statuses)}\n"
+        f"results received={received} kept={kept} ({(1 - kept / received) * 100 if received else 0:.0f}% deduplicated/trimmed)"
+    )
+
+
+async def check_deterministic() -> None:
+    """같은 조건이면 공급자 인벤토리/가격이 같아야 함 (지연만 달라짐)"""
+    first = await SearchAggregator(default_providers(timeout=60)).search(SearchQuery.from_form(*QUERIES[0]))
+    second = await SearchAggregator(default_providers(timeout=60)).search(SearchQuery.from_form(*QUERIES[0]))
+    error_free = all(info["status"] == "ok" for response in (first, second) for info in response.providers.values())
+    if error_free:
+        assert [(r["id"], r["price"]) for r in first.results] == [(r["id"], r["price"]) for r in second.results]
+
+
+def main() -> None:
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print(f"concurrency={concurrency}, rounds={rounds}")
+    # 서버 시작 시와 같이 색인을 미리 생성
+    get_flight_inventory()
+    get_hotel_index()
+    get_car_availability()
+    asyncio.run(check_deterministic())
+    asyncio.run(run(concurrency, rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""SSE(/chat/stream) vs WebSocket(/ws) 부하 테스트
+
+클라이언트 C개가 각각 폼 상호작용(userAction) R개를 순서대로 보낼 때 요청당 지연(p50/p95)과 처리량 비교.
+- SSE: 브라우저처럼 요청마다 POST + 새 SSE 응답 (HTTP keep-alive 연결은 재사용)
+- WebSocket: 클라이언트당 연결 하나에서 요청 프레임 전송, 같은 id의 done 이벤트까지 대기
+기본 액션(select-flight)은 LLM을 호출하지 않으므로 전송 계층 오버헤드 비교에 적합하다.
+실행 (서버 실행 중): python -m bench.bench_ws [base_url] [clients] [requests]
+"""
+
+import sys
+import json
+import time
+import uuid
+import asyncio
+
+import httpx
+import websockets
+
+
+ACTION = {
+    "surfaceId": "travel-type-selector",
+    "componentId": "flight-button",
+    "action": "select-flight",
+    "data": {},
+}
+
+
+async def sse_client(base_url: str, requests: int, latencies: list) -> int:
+    """SSE 클라이언트 하나 (받은 바이트 수 반환)"""
+    received = 0
+    headers = {"X-Client-ID": str(uuid.uuid4())}
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, timeout=30) as client:
+        for _ in range(requests):
+            start = time.perf_counter()
+            async with client.stream("POST", "/chat/stream", json={"userAction": ACTION}) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    received += len(chunk)
+            latencies.append(time.perf_counter() - start)
+    return received
+
+
+async def ws_client(base_url: str, requests: int, latencies: list) -> int:
+    """WebSocket 클라이언트 하나 (받은 바이트 수 반환)"""
+    received = 0
+    url = base_url.replace("http", "ws", 1) + f"/ws?clientId={uuid.uuid4()}"
+    async with websockets.connect(url, max_size=None) as websocket:
+        for i in range(requests):
+            request_id = f"r{i}"
+            start = time.perf_counter()
+            await websocket.send(json.dumps({"id": request_id, "userAction": ACTION}))
+            while True:
+                frame = await websocket.recv()
+                received += len(frame)
+                event = json.loads(frame)
+                if event.get("type") == "ping":
+                    await websocket.send('{"type":"pong"}')
+                elif event.get("id") == request_id and event.get("type") in ("done", "error"):
+                    break
+            latencies.append(time.perf_counter() - start)
+    return received
+
+
+async def run(client, base_url: str, clients: int, requests: int) -> tuple[list, float, int]:
+    latencies: list[float] = []
+    start = time.perf_counter()
+    received = await asyncio.gather(*(client(base_url, requests, latencies) for _ in range(clients)))
+    return sorted(latencies), time.perf_counter() - start, sum(received)
+
+
+def main() -> None:
+    base_url = sys.argv[1] if len(sys.argv) > 1 else "http://localhost:8003"
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    requests = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    print(f"{base_url}: clients={clients}, requests/client={requests}")
+
+    for label, client in (("sse", sse_client), ("websocket", ws_client)):
+        latencies, elapsed, received = asyncio.run(run(client, base_url, clients, requests))
+        p50 = latencies[len(latencies) // 2] * 1000
+        p95 = latencies[int(len(latencies) * 0.95)] * 1000
+        print(
+            f"{label:10s} p50={p50:6.1f} ms p95={p95:6.1f} ms "
+            f"throughput={len(latencies) / elapsed:7.1f} req/s received={received / len(latencies):.0f} B/req"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,43 @@
 """여행 예약 에이전트 - LangGraph 기반"""
 
+import asyncio
 from typing import AsyncIterator
 from langchain_core.messages import HumanMessage, AIMessage
 from .graph import get_travel_graph
-from .nodes import get_initial_ui, intent_node
+from .nodes import get_initial_ui, astream_intent, form_scaffold_messages
 from .nodes.llm import LLM_MODEL
 from .nodes.conversation import conversation_stream
+from .nodes.history import plan_history, afold_history
 
 # GPT-5 모델 여부 (thinking 스트리밍 지원)
 IS_REASONING_MODEL = LLM_MODEL.startswith("gpt-5") or "o1" in LLM_MODEL or "o3" in LLM_MODEL
 
+# 플로우별 상태 텍스트 (라우팅이 결정되는 즉시 전송)
+FLOW_STATUS = {
+    "booking": "예약 폼 생성 중",
+    "modify": "수정 처리 중",
+    "clarify": "확인 중",
+    "conversation": "생각하는 중",
+}
+
+
+def resolve_action_status(action: str) -> str:
+    """userAction → 상태 텍스트 (그래프 실행 전에 바로 전송)"""
+    if action.startswith("search-"):
+        return "검색 중"
+    if action.startswith("select-"):
+        return FLOW_STATUS["booking"]
+    return "처리 중"
+
+
+def resolve_flow(intent_type: str) -> str:
+    """의도 타입 → 처리 플로우"""
+    if intent_type in ("flight", "hotel", "car", "package"):
+        return "booking"
+    if intent_type in ("modify", "clarify"):
+        return intent_type
+    return "conversation"
+
 
 class TravelAgent:
     """LangGraph 기반 여행 예약 챗봇 에이전트"""
@@ -21,6 +49,8 @@ class TravelAgent:
         self.thread_id = thread_id
         # 현재 Surface
         self.current_surface: str | None = None
+        # 진행 중인 히스토리 요약 (응답 후 백그라운드 실행, 한 번에 하나만)
+        self._history_fold: asyncio.Task | None = None
 
     def get_initial_ui(self) -> list[dict]:
         """초기 여행 타입 선택 UI 반환"""
@@ -39,6 +69,9 @@ class TravelAgent:
             "user_message": "",
             "current_data": {},
             "current_surface_id": "",
+            # intent_type이 비어 있어야 그래프가 intent 노드부터 실행됨
+            "intent_type": None,
+            "entities": {},
         }
 
         # 입력 타입 설정
@@ -54,9 +87,9 @@ class TravelAgent:
         else:
             return []
 
-        # 그래프 실행 (thread_id로 세션 구분)
+        # 그래프 실행 (thread_id로 세션 구분, 비동기 실행으로 이벤트 루프 블로킹 방지)
         config = {"configurable": {"thread_id": self.thread_id}}
-        result = self.graph.invoke(state, config)
+        result = await self.graph.ainvoke(state, config)
 
         # 메시지 반환
         return result.get("messages", [])
@@ -66,6 +99,7 @@ class TravelAgent:
 
         이벤트 타입:
         - status: 현재 상태 텍스트 (동적으로 변하는 제목)
+        - message: 완료 전에 먼저 적용할 A2UI 메시지 (폼 골격, 노드가 만든 안내 문구/폼/데이터 변경)
         - thought: 사고 로그 (아코디언에 추가)
         - answer: 답변 토큰 (스트리밍)
         - done: 완료
@@ -77,14 +111,17 @@ class TravelAgent:
             "user_message": "",
             "current_data": {},
             "current_surface_id": "",
+            # intent_type이 비어 있어야 그래프가 intent 노드부터 실행됨
+            "intent_type": None,
+            "entities": {},
         }
 
-        # userAction 처리 (스트리밍 없이)
+        # userAction 처리 (의도 분석 없이 바로 그래프 실행)
         if "userAction" in message:
             state["user_action"] = message["userAction"]
-            config = {"configurable": {"thread_id": self.thread_id}}
-            result = self.graph.invoke(state, config)
-            yield {"type": "done", "messages": result.get("messages", [])}
+            yield {"type": "status", "text": resolve_action_status(message["userAction"].get("action", ""))}
+            async for event in self._stream_graph(state):
+                yield event
             return
 
         # 텍스트 메시지 처리
@@ -98,36 +135,56 @@ class TravelAgent:
             yield {"type": "done", "messages": []}
             return
 
-        # 1단계: intent 분석
+        # 1단계: intent 분석 (스트리밍 - "type"이 확정되는 즉시 라우팅)
         yield {"type": "status", "text": "요청 분석 중"}
 
-        intent_result = intent_node(state)
+        routed_flow = None
+        routed_type = None
+        scaffold = []
+        intent_result = {"intent_type": "unknown", "entities": {}}
+        async for event in astream_intent(state):
+            if event["type"] == "route":
+                routed_type = event["intent_type"]
+                routed_flow = resolve_flow(routed_type)
+                print(f"[Stream] routed: {event['intent_type']} → {routed_flow}")
+                yield {"type": "status", "text": FLOW_STATUS[routed_flow]}
+                # 엔티티를 기다리는 동안 폼 골격을 먼저 그림
+                if routed_flow == "booking":
+                    scaffold = form_scaffold_messages(event["intent_type"], state["current_data"])
+                    for msg in scaffold:
+                        yield {"type": "message", "message": msg}
+            elif event["type"] == "result":
+                intent_result = event["result"]
+
         intent_type = intent_result.get("intent_type", "unknown")
         print(f"[Stream] intent_type: {intent_type}")
 
-        # 플로우 결정
-        if intent_type in ("flight", "hotel", "car", "package"):
-            flow = "booking"
-        elif intent_type == "modify":
-            flow = "modify"
-        elif intent_type == "clarify":
-            flow = "clarify"
-        else:
-            flow = "conversation"
+        # 플로우 결정 (최종 결과가 조기 라우팅과 다르면 상태 갱신)
+        flow = resolve_flow(intent_type)
+        if flow != routed_flow:
+            yield {"type": "status", "text": FLOW_STATUS[flow]}
+        # 조기 라우팅으로 그린 폼 골격이 최종 결과와 맞지 않으면 삭제 (클라이언트에 빈 Surface가 남지 않도록)
+        if scaffold and (flow != routed_flow or intent_type != routed_type):
+            for msg in scaffold:
+                if "createSurface" in msg:
+                    yield {"type": "message", "message": {"deleteSurface": {"surfaceId": msg["createSurface"]["surfaceId"]}}}
+            scaffold = []
 
         # 2단계: 플로우별 처리
         if flow == "conversation":
             # conversation: 스트리밍으로 처리
-            yield {"type": "status", "text": "생각하는 중"}
-
             # 체크포인터에서 대화 히스토리 가져오기
             config = {"configurable": {"thread_id": self.thread_id}}
-            graph_state = self.graph.get_state(config)
-            chat_history = graph_state.values.get("chat_history", []) if graph_state.values else []
+            graph_state = await self.graph.aget_state(config)
+            values = graph_state.values or {}
+
+            # 토큰 예산 윈도우 + 누적 요약으로 컨텍스트 구성 (요약 LLM 호출은 응답 후로 미룸)
+            summary = values.get("history_summary", "")
+            context, fold = plan_history(values.get("chat_history", []), summary)
 
             # conversation_stream으로 스트리밍 (모든 이벤트 전달)
             new_chat_history = None
-            async for event in conversation_stream(state["user_message"], chat_history):
+            async for event in conversation_stream(state["user_message"], context):
                 event_type = event.get("type")
 
                 if event_type in ("status", "thought", "answer"):
@@ -148,18 +205,57 @@ class TravelAgent:
                         new_messages.append(HumanMessage(content=msg["content"]))
                     elif msg.get("type") == "ai":
                         new_messages.append(AIMessage(content=msg["content"]))
-                self.graph.update_state(config, {"chat_history": new_messages})
+                await self.graph.aupdate_state(config, {"chat_history": new_messages})
+            # 예산 초과분은 응답을 다 보낸 뒤 백그라운드에서 요약에 합침
+            if fold:
+                self._schedule_history_fold(config, fold, summary)
             return
 
         else:
             # 다른 플로우: LangGraph로 처리
-            if flow == "booking":
-                yield {"type": "status", "text": "예약 폼 생성 중"}
-            elif flow == "modify":
-                yield {"type": "status", "text": "수정 처리 중"}
-            elif flow == "clarify":
-                yield {"type": "status", "text": "확인 중"}
+            # 이미 분석한 의도를 주입해 intent LLM 호출이 중복되지 않도록 함
+            state["intent_type"] = intent_type
+            state["entities"] = intent_result.get("entities", {})
 
-            config = {"configurable": {"thread_id": self.thread_id}}
-            result = self.graph.invoke(state, config)
-            yield {"type": "done", "messages": result.get("messages", [])}
+            # 이미 보낸 폼 골격은 다시 보내지 않음 (createSurface 재처리 시 화면이 초기화됨)
+            async for event in self._stream_graph(state, sent=scaffold):
+                yield event
+
+    def _schedule_history_fold(self, config: dict, older: list, summary: str) -> None:
+        """히스토리 요약을 백그라운드 태스크로 실행 (이미 진행 중이면 다음 턴에 다시 시도)"""
+        if self._history_fold and not self._history_fold.done():
+            return
+        self._history_fold = asyncio.create_task(self._fold_history(config, older, summary))
+
+    async def _fold_history(self, config: dict, older: list, summary: str) -> None:
+        """older를 요약에 합치고 RemoveMessage + history_summary로 체크포인트 갱신"""
+        try:
+            await self.graph.aupdate_state(config, await afold_history(older, summary))
+        except Exception as e:
+            print(f"[History] Background fold failed: {e}")
+
+    async def _stream_graph(self, state: dict, sent: list | None = None) -> AsyncIterator[dict]:
+        """그래프 실행 - 노드가 만든 A2UI 메시지를 만드는 즉시 message 이벤트로 전달
+
+        안내 문구, createSurface, updateComponents, updateDataModel이 각각 따로 전송되므로
+        클라이언트는 체크포인트 저장 등 그래프 마무리를 기다리지 않고 화면을 그린다.
+        done 이벤트에는 스트리밍으로 보내지 않은 나머지 메시지만 담는다.
+
+        Args:
+            sent: 이미 보낸 메시지 (다시 보내지 않음)
+        """
+        config = {"configurable": {"thread_id": self.thread_id}}
+        sent = list(sent or [])
+        final_state = {}
+        async for mode, chunk in self.graph.astream(state, config, stream_mode=["custom", "values"]):
+            if mode == "values":
+                final_state = chunk
+            elif chunk.get("type") == "message":
+                msg = chunk["message"]
+                if msg in sent:
+                    continue
+                sent.append(msg)
+                yield {"type": "message", "message": msg}
+
+        messages = [msg for msg in final_state.get("messages", []) if msg not in sent]
+        yield {"type": "done", "messages": messages}
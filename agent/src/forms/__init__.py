@@ -5,6 +5,8 @@ forms/config/*.json 파일을 추가하면 자동으로 새 폼 타입이 등록
 """
 
 from .generator import DynamicFormGenerator, get_form_generator
+from .registry import FormRegistry, FormConfigError, get_form_registry
+from .patch import make_patch, apply_patch, set_values
 
 # 레거시 호환성을 위해 기존 클래스도 export (추후 삭제 예정)
 from .base import BaseFormGenerator
@@ -12,5 +14,11 @@ from .base import BaseFormGenerator
 __all__ = [
     "DynamicFormGenerator",
     "get_form_generator",
+    "FormRegistry",
+    "FormConfigError",
+    "get_form_registry",
+    "make_patch",
+    "apply_patch",
+    "set_values",
     "BaseFormGenerator",
 ]
@@ -1,12 +1,18 @@
 """기본 폼 생성기"""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, Optional
+
+from ..payload import get_payload_cache
+from ..surfaces import get_surface_registry
 
 
 class BaseFormGenerator(ABC):
     """폼 생성기 기본 클래스"""
 
+    # 정적 레이아웃(_get_components) 버전 - 컴포넌트를 바꾸면 올려서 사전 인코딩 캐시 갱신
+    LAYOUT_VERSION = 1
+
     @abstractmethod
     def generate(self, entities: Optional[dict] = None) -> list[dict]:
         """A2UI 메시지 리스트 반환
@@ -32,3 +38,15 @@ class BaseFormGenerator(ABC):
                 "surfaceId": surface_id
             }
         }
+
+    def layout_messages(self, surface_id: str, build_components: Callable[[], list[dict]]) -> list[dict]:
+        """정적 레이아웃 메시지 [createSurface, updateComponents] (사전 인코딩, 버전 참조 가능)"""
+        definition = get_surface_registry().define(
+            "travel-booking", surface_id, self.LAYOUT_VERSION, build_components
+        )
+        return [
+            get_payload_cache().get(
+                surface_id, "createSurface", self.LAYOUT_VERSION, lambda: self.create_surface(surface_id)
+            ),
+            definition.message,
+        ]
@@ -0,0 +1,27 @@
+"""옵션 카탈로그 - 폼 설정의 options 목록(airports, cities, locations)을 버전 관리
+
+폼 데이터 모델에는 목록 대신 {"$catalog": 이름, "version": 해시} 참조만 넣고,
+목록 자체는 GET /options/{이름}에서 ETag/Cache-Control과 함께 내려준다.
+클라이언트는 버전별로 한 번만 받으면 되므로 응답 크기가 턴 수에 비례해 늘지 않는다.
+"""
+
+import hashlib
+
+from ..payload import dumps
+
+
+class OptionCatalog:
+    """버전(내용 해시)이 붙은 옵션 목록"""
+
+    def __init__(self, name: str, options: list):
+        self.name = name
+        self.options = options
+        self.version = hashlib.sha256(dumps(options)).hexdigest()[:16]
+        self.etag = f'"{self.version}"'
+        # 응답 본문은 한 번만 인코딩
+        self.encoded = dumps({"catalog": name, "version": self.version, "options": options})
+
+    @property
+    def ref(self) -> dict:
+        """데이터 모델에 넣을 카탈로그 참조"""
+        return {"$catalog": self.name, "version": self.version}
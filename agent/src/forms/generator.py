@@ -1,15 +1,17 @@
 """동적 폼 생성기 - JSON 설정 기반"""
 
-import json
-import copy
-from pathlib import Path
-from typing import Optional, Any
+from typing import Optional
+
+from .registry import CONFIG_DIR, get_form_registry
 
 
 class DynamicFormGenerator:
-    """JSON 설정 파일을 읽어서 A2UI 메시지를 생성하는 동적 폼 생성기"""
+    """JSON 설정 파일 기반으로 A2UI 메시지를 생성하는 동적 폼 생성기
+
+    설정은 FormRegistry가 시작 시 한 번 로드/검증해 둔 것을 사용한다.
+    """
 
-    CONFIG_DIR = Path(__file__).parent / "config"
+    CONFIG_DIR = CONFIG_DIR
 
     def __init__(self, form_type: str):
         """
@@ -17,16 +19,10 @@ class DynamicFormGenerator:
             form_type: 폼 타입 (flight, hotel, car 등)
         """
         self.form_type = form_type
-        self.config = self._load_config(form_type)
-
-    def _load_config(self, form_type: str) -> dict:
-        """JSON 설정 파일 로드"""
-        config_path = self.CONFIG_DIR / f"{form_type}.json"
-        if not config_path.exists():
-            raise FileNotFoundError(f"Form config not found: {config_path}")
-
-        with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        self.form = get_form_registry().get(form_type)
+        if self.form is None:
+            raise FileNotFoundError(f"Form config not found: {self.CONFIG_DIR / f'{form_type}.json'}")
+        self.config = self.form.config
 
     def generate(self, entities: Optional[dict] = None) -> list[dict]:
         """A2UI 메시지 리스트 생성
@@ -38,114 +34,64 @@ class DynamicFormGenerator:
             A2UI 메시지 리스트 [createSurface, updateComponents, updateDataModel]
         """
         entities = entities or {}
-        messages = []
-
-        # 1. Surface 생성
-        messages.append({
-            "createSurface": {
-                "surfaceId": self.config["surfaceId"],
-                "catalogId": self.config.get("catalogId", "travel-booking")
-            }
-        })
-
-        # 2. 컴포넌트 업데이트
-        messages.append({
-            "updateComponents": {
-                "surfaceId": self.config["surfaceId"],
-                "components": self.config["components"]
-            }
-        })
+        # 1~2. Surface 생성 + 컴포넌트 업데이트
+        messages = self.scaffold()
 
         # 3. 데이터 모델 업데이트
         messages.append({
             "updateDataModel": {
-                "surfaceId": self.config["surfaceId"],
+                "surfaceId": self.form.surface_id,
                 "operations": self._build_data_operations(entities)
             }
         })
 
         return messages
 
+    def update(self, entities: dict, current_data: dict) -> list[dict]:
+        """이미 활성화된 폼의 데이터만 갱신하는 메시지 (바뀐 값이 없으면 빈 리스트)
+
+        Args:
+            entities: 추출된 엔티티
+            current_data: 클라이언트의 현재 dataModel (e.g., {"flight": {...}, "airports": [...]})
+
+        Returns:
+            [updateDataModel] (바뀐 경로만의 JSON Patch 연산)
+        """
+        operations = self.form.build_update_operations(entities, current_data)
+        if not operations:
+            return []
+        return [{
+            "updateDataModel": {
+                "surfaceId": self.form.surface_id,
+                "operations": operations
+            }
+        }]
+
+    @property
+    def surface_id(self) -> str:
+        return self.form.surface_id
+
+    def scaffold(self) -> list[dict]:
+        """엔티티와 무관한 폼 골격 메시지 [createSurface, updateComponents]
+
+        의도 분석이 끝나기 전에 먼저 화면을 그릴 때 사용한다.
+        """
+        return list(self.form.scaffold_messages)
+
     def _build_data_operations(self, entities: dict) -> list[dict]:
-        """데이터 모델 초기화 연산 생성"""
-        operations = []
-
-        # 기본 데이터 모델 복사 (원본 수정 방지)
-        data_model = copy.deepcopy(self.config.get("dataModel", {}))
-
-        # entities를 데이터 모델에 매핑
-        entity_mapping = self.config.get("entityMapping", {})
-        for entity_key, model_path in entity_mapping.items():
-            if entity_key in entities:
-                self._set_nested_value(data_model, model_path, entities[entity_key])
-
-        # 각 최상위 키를 별도 operation으로 추가
-        for key, value in data_model.items():
-            operations.append({
-                "op": "add",
-                "path": f"/{key}",
-                "value": value
-            })
-
-        # 옵션 데이터 추가 (airports, cities 등)
-        options = self.config.get("options", {})
-        for option_key, option_value in options.items():
-            operations.append({
-                "op": "add",
-                "path": f"/{option_key}",
-                "value": option_value
-            })
-
-        return operations
-
-    def _set_nested_value(self, obj: dict, path: str, value: Any) -> None:
-        """중첩 객체에 값 설정 (예: "flight.passengers.adults")"""
-        keys = path.split(".")
-        current = obj
-
-        for key in keys[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
-
-        # 타입 검증
-        final_key = keys[-1]
-        if final_key in current:
-            expected_type = type(current[final_key])
-            if expected_type == int and isinstance(value, str):
-                try:
-                    value = int(value)
-                except ValueError:
-                    pass
-            elif expected_type == bool and isinstance(value, str):
-                value = value.lower() in ("true", "1", "yes")
-
-        current[final_key] = value
+        """데이터 모델 초기화 연산 생성 (최상위 키별 add + 옵션 데이터)"""
+        return self.form.build_data_operations(entities)
 
     @classmethod
     def get_available_forms(cls) -> list[str]:
         """사용 가능한 폼 타입 목록 반환"""
-        forms = []
-        for config_file in cls.CONFIG_DIR.glob("*.json"):
-            forms.append(config_file.stem)
-        return forms
+        return get_form_registry().form_types()
 
     @classmethod
     def get_form_metadata(cls, form_type: str) -> dict:
         """폼 메타데이터 반환 (id, label, icon)"""
-        config_path = cls.CONFIG_DIR / f"{form_type}.json"
-        if not config_path.exists():
-            return {}
-
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
-
-        return {
-            "id": config.get("id", form_type),
-            "label": config.get("label", form_type),
-            "icon": config.get("icon", "default"),
-            "surfaceId": config.get("surfaceId", f"{form_type}-booking")
-        }
+        form = get_form_registry().get(form_type)
+        return dict(form.metadata) if form else {}
 
     @classmethod
     def get_all_form_metadata(cls) -> list[dict]:
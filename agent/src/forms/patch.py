@@ -0,0 +1,185 @@
+"""JSON Patch (RFC 6902) diff/apply - updateDataModel 최소 연산 생성
+
+make_patch(현재 데이터, 목표 데이터)는 클라이언트 dataModel을 목표로 바꾸는 add/remove/replace 연산을 만든다.
+- 객체: 삭제된 키 remove, 바뀐 키 재귀 비교, 새 키 add
+- 배열: 공통 앞/뒤 구간은 건너뛰고 가운데 구간을 정렬(SequenceMatcher)해 원소별 비교/remove/add
+- 하위 연산들이 해당 값을 통째로 replace하는 것보다 길면 replace 하나로 합침
+같은 객체를 공유하는 하위 트리(copy-on-write로 만든 목표 데이터)는 비교 없이 건너뛴다.
+"""
+
+import copy
+from difflib import SequenceMatcher
+from typing import Any
+
+from ..payload import dumps
+
+
+def escape_pointer(key: str) -> str:
+    """JSON Pointer(RFC 6901) 토큰 이스케이프"""
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape_pointer(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def same(a: Any, b: Any) -> bool:
+    """JSON 값 동일 여부 (True/1, 1/1.0처럼 인코딩이 다른 값은 다르게 취급)"""
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(same(value, b[key]) for key, value in a.items())
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _collapse(ops: list, start: int, path: str, target: Any) -> None:
+    """ops[start:]가 replace 하나보다 길면 replace로 교체"""
+    if len(ops) - start <= 1 or not path:
+        return
+    replace = {"op": "replace", "path": path, "value": target}
+    if len(dumps(ops[start:])) > len(dumps(replace)):
+        del ops[start:]
+        ops.append(replace)
+
+
+def _diff(source: Any, target: Any, path: str, ops: list) -> None:
+    if source is target:
+        return
+    if isinstance(source, dict) and isinstance(target, dict):
+        start = len(ops)
+        for key in source:
+            if key not in target:
+                ops.append({"op": "remove", "path": f"{path}/{escape_pointer(key)}"})
+        for key, value in target.items():
+            child = f"{path}/{escape_pointer(key)}"
+            if key in source:
+                _diff(source[key], value, child, ops)
+            else:
+                ops.append({"op": "add", "path": child, "value": value})
+        _collapse(ops, start, path, target)
+    elif isinstance(source, list) and isinstance(target, list):
+        start = len(ops)
+        _diff_list(source, target, path, ops)
+        _collapse(ops, start, path, target)
+    elif not same(source, target):
+        ops.append({"op": "replace", "path": path, "value": target})
+
+
+def _diff_list(source: list, target: list, path: str, ops: list) -> None:
+    # 공통 앞/뒤 구간 제외
+    head = 0
+    limit = min(len(source), len(target))
+    while head < limit and same(source[head], target[head]):
+        head += 1
+    source_end, target_end = len(source), len(target)
+    while source_end > head and target_end > head and same(source[source_end - 1], target[target_end - 1]):
+        source_end -= 1
+        target_end -= 1
+
+    source_mid = source[head:source_end]
+    target_mid = target[head:target_end]
+    if not source_mid or not target_mid:
+        _diff_span(source_mid, target_mid, head, path, ops)
+        return
+
+    # 가운데 구간은 원소 인코딩 기준으로 정렬해 삽입/삭제를 찾음 (앞에 끼워 넣은 원소 등)
+    matcher = SequenceMatcher(
+        None, [dumps(item) for item in source_mid], [dumps(item) for item in target_mid], autojunk=False
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            # 앞 구간은 이미 target[:j1]과 같아졌으므로 현재 위치는 head + j1
+            _diff_span(source_mid[i1:i2], target_mid[j1:j2], head + j1, path, ops)
+
+
+def _diff_span(source: list, target: list, offset: int, path: str, ops: list) -> None:
+    """배열의 offset 위치에서 source 구간을 target 구간으로 바꾸는 연산"""
+    common = min(len(source), len(target))
+    for i in range(common):
+        _diff(source[i], target[i], f"{path}/{offset + i}", ops)
+    # 남는 원소는 뒤에서부터 제거 (인덱스가 밀리지 않도록)
+    for i in range(len(source) - 1, common - 1, -1):
+        ops.append({"op": "remove", "path": f"{path}/{offset + i}"})
+    for i in range(common, len(target)):
+        ops.append({"op": "add", "path": f"{path}/{offset + i}", "value": target[i]})
+
+
+def make_patch(source: dict, target: dict) -> list[dict]:
+    """source를 target으로 바꾸는 최소 RFC 6902 연산 목록
+
+    연산 value는 target의 하위 객체를 그대로 참조하므로 읽기 전용으로 다룬다.
+    최상위(문서 전체) replace는 만들지 않는다.
+    """
+    ops: list[dict] = []
+    _diff(source, target, "", ops)
+    return ops
+
+
+def _parent(doc: Any, path: str) -> tuple[Any, str]:
+    tokens = [_unescape_pointer(token) for token in path.split("/")[1:]]
+    node = doc
+    for token in tokens[:-1]:
+        node = node[int(token)] if isinstance(node, list) else node[token]
+    return node, tokens[-1]
+
+
+def apply_patch(doc: Any, ops: list[dict]) -> Any:
+    """RFC 6902 add/remove/replace 적용 (원본은 수정하지 않고 새 문서 반환)"""
+    doc = copy.deepcopy(doc)
+    for op in ops:
+        kind, path = op["op"], op["path"]
+        if not path:
+            if kind not in ("add", "replace"):
+                raise ValueError(f"Unsupported root operation: {kind}")
+            doc = copy.deepcopy(op["value"])
+            continue
+        parent, key = _parent(doc, path)
+        if isinstance(parent, list):
+            index = len(parent) if key == "-" else int(key)
+            if kind == "add":
+                parent.insert(index, copy.deepcopy(op["value"]))
+            elif kind == "replace":
+                parent[index] = copy.deepcopy(op["value"])
+            elif kind == "remove":
+                del parent[index]
+            else:
+                raise ValueError(f"Unsupported operation: {kind}")
+        else:
+            if kind in ("add", "replace"):
+                if kind == "replace" and key not in parent:
+                    raise KeyError(path)
+                parent[key] = copy.deepcopy(op["value"])
+            elif kind == "remove":
+                del parent[key]
+            else:
+                raise ValueError(f"Unsupported operation: {kind}")
+    return doc
+
+
+def set_values(doc: dict, values: dict[str, Any]) -> dict:
+    """JSON Pointer 경로별 값을 설정한 새 문서 반환 (copy-on-write, 없는 중간 객체는 생성)
+
+    Args:
+        doc: 원본 문서 (수정하지 않음)
+        values: {"/flight/departure": "ICN", ...}
+    """
+    root = dict(doc)
+    copied = {id(root)}
+    for path, value in values.items():
+        tokens = [_unescape_pointer(token) for token in path.split("/")[1:]]
+        node = root
+        for token in tokens[:-1]:
+            child = node.get(token)
+            if not isinstance(child, dict):
+                child = {}
+            elif id(child) not in copied:
+                child = dict(child)
+            copied.add(id(child))
+            node[token] = child
+            node = child
+        node[tokens[-1]] = value
+    return root
@@ -0,0 +1,287 @@
+"""폼 설정 레지스트리 - 시작 시 로드/검증, mtime 기반 핫 리로드
+
+forms/config/*.json을 한 번만 읽어 CompiledForm으로 컴파일해 두고,
+요청 처리 경로에서는 디스크를 읽거나 dataModel 전체를 deepcopy하지 않는다.
+
+주의: 생성된 메시지/operation의 value는 설정 객체와 하위 트리를 공유하므로 읽기 전용으로 다룬다.
+"""
+
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Any
+
+from ..payload import EncodedPayload
+from ..surfaces import SurfaceDefinition
+from .patch import make_patch
+from .catalog import OptionCatalog
+
+
+CONFIG_DIR = Path(__file__).parent / "config"
+
+# 설정 파일 변경 확인 주기 (초, 0이면 핫 리로드 비활성화)
+FORM_CONFIG_RELOAD_INTERVAL = float(os.getenv("FORM_CONFIG_RELOAD_INTERVAL", "2"))
+
+REQUIRED_KEYS = ("surfaceId", "components", "dataModel")
+
+
+class FormConfigError(ValueError):
+    """폼 설정 검증 실패"""
+
+
+def _coerce(value: Any, expected_type: type | None) -> Any:
+    """기본값 타입에 맞춰 엔티티 값 변환 (문자열 → int/bool)"""
+    if expected_type is int and isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return value
+    if expected_type is bool and isinstance(value, str):
+        return value.lower() in ("true", "1", "yes")
+    return value
+
+
+class CompiledForm:
+    """검증/컴파일된 폼 설정
+
+    Attributes:
+        setters: (엔티티 키, 경로 키 튜플, 기본값 타입) 튜플 목록
+        definition: 컴포넌트 트리 SurfaceDefinition (버전/참조 메시지 포함)
+        scaffold_messages: [createSurface, updateComponents] (미리 생성/인코딩)
+        catalogs: 옵션 이름별 OptionCatalog
+        option_operations: 옵션 카탈로그 참조 add operation (미리 생성)
+    """
+
+    def __init__(self, form_type: str, config: dict, mtime: float):
+        self.form_type = form_type
+        self.config = config
+        self.mtime = mtime
+        self.surface_id = config["surfaceId"]
+        self.data_model = config["dataModel"]
+        self.metadata = {
+            "id": config.get("id", form_type),
+            "label": config.get("label", form_type),
+            "icon": config.get("icon", "default"),
+            "surfaceId": config.get("surfaceId", f"{form_type}-booking"),
+        }
+        # 설정 버전(mtime)별로 한 번만 인코딩
+        catalog_id = config.get("catalogId", "travel-booking")
+        self.definition = SurfaceDefinition(catalog_id, self.surface_id, config["components"])
+        self.scaffold_messages = [
+            EncodedPayload({
+                "createSurface": {
+                    "surfaceId": self.surface_id,
+                    "catalogId": catalog_id,
+                }
+            }),
+            self.definition.message,
+        ]
+        # 옵션 목록은 카탈로그로 분리하고 데이터 모델에는 버전 참조만 넣음
+        self.catalogs = {key: OptionCatalog(key, value) for key, value in config.get("options", {}).items()}
+        self.catalog_refs = {key: catalog.ref for key, catalog in self.catalogs.items()}
+        self.option_operations = [
+            {"op": "add", "path": f"/{key}", "value": ref} for key, ref in self.catalog_refs.items()
+        ]
+        self.setters = self._compile_setters(config.get("entityMapping", {}))
+
+    def _compile_setters(self, entity_mapping: dict) -> tuple:
+        setters = []
+        for entity_key, model_path in entity_mapping.items():
+            keys = tuple(model_path.split("."))
+            node = self.data_model
+            for key in keys[:-1]:
+                node = node.get(key) if isinstance(node, dict) else None
+                if not isinstance(node, dict):
+                    raise FormConfigError(
+                        f"{self.form_type}: entityMapping '{entity_key}' → '{model_path}' is not a dataModel object path"
+                    )
+            default = node.get(keys[-1])
+            expected_type = type(default) if default is not None and keys[-1] in node else None
+            setters.append((entity_key, keys, expected_type))
+        return tuple(setters)
+
+    def apply_entities(self, base: dict, entities: dict) -> dict:
+        """base에 엔티티를 매핑한 새 데이터 모델 반환 (copy-on-write)
+
+        엔티티가 설정되는 경로의 dict만 얕은 복사하고 나머지 하위 트리는 base를 그대로 참조한다.
+        """
+        root = base
+        copied = None
+        for entity_key, keys, expected_type in self.setters:
+            if entity_key not in entities:
+                continue
+            if copied is None:
+                copied = set()
+                root = dict(root)
+                copied.add(id(root))
+            node = root
+            for key in keys[:-1]:
+                child = node.get(key)
+                if not isinstance(child, dict):
+                    child = {}
+                elif id(child) not in copied:
+                    child = dict(child)
+                copied.add(id(child))
+                node[key] = child
+                node = child
+            node[keys[-1]] = _coerce(entities[entity_key], expected_type)
+        return root
+
+    def build_data_operations(self, entities: dict) -> list[dict]:
+        """새 Surface용 데이터 모델 초기화 operation 생성 (최상위 키별 add + 옵션 데이터)"""
+        root = self.apply_entities(self.data_model, entities)
+        operations = [{"op": "add", "path": f"/{key}", "value": value} for key, value in root.items()]
+        operations.extend(self.option_operations)
+        return operations
+
+    def build_update_operations(self, entities: dict, current_data: dict) -> list[dict]:
+        """클라이언트에 이미 있는 데이터 모델 대비 바뀐 부분만 JSON Patch로 생성
+
+        카탈로그 참조는 클라이언트가 다른 버전의 참조를 가진 경우(설정 변경)에만 갱신하고,
+        그 밖에는(같은 버전, 누락, 해석된 목록) 보내지 않는다.
+        """
+        target = self.apply_entities(current_data, entities)
+        stale = [
+            key for key, ref in self.catalog_refs.items()
+            if isinstance(current_data.get(key), dict) and "$catalog" in current_data[key] and current_data[key] != ref
+        ]
+        if stale:
+            target = dict(target)
+            for key in stale:
+                target[key] = self.catalog_refs[key]
+        return make_patch(current_data, target)
+
+
+def validate_config(form_type: str, config: Any) -> None:
+    """폼 설정 구조 검증 (실패 시 FormConfigError)"""
+    if not isinstance(config, dict):
+        raise FormConfigError(f"{form_type}: config must be an object")
+    missing = [key for key in REQUIRED_KEYS if key not in config]
+    if missing:
+        raise FormConfigError(f"{form_type}: missing keys {missing}")
+    if not isinstance(config["dataModel"], dict):
+        raise FormConfigError(f"{form_type}: dataModel must be an object")
+    options = config.get("options", {})
+    if not isinstance(options, dict) or not all(isinstance(value, list) for value in options.values()):
+        raise FormConfigError(f"{form_type}: options must be an object of lists")
+    if not isinstance(config.get("entityMapping", {}), dict):
+        raise FormConfigError(f"{form_type}: entityMapping must be an object")
+
+    components = config["components"]
+    if not isinstance(components, list):
+        raise FormConfigError(f"{form_type}: components must be a list")
+    seen = set()
+    for component in components:
+        component_id = component.get("id") if isinstance(component, dict) else None
+        if not component_id:
+            raise FormConfigError(f"{form_type}: component without id")
+        if component_id in seen:
+            raise FormConfigError(f"{form_type}: duplicate component id '{component_id}'")
+        seen.add(component_id)
+
+
+def _compile_file(path: Path) -> CompiledForm:
+    mtime = path.stat().st_mtime
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    validate_config(path.stem, config)
+    return CompiledForm(path.stem, config, mtime)
+
+
+class FormRegistry:
+    """폼 설정 레지스트리 (프로세스 단위)"""
+
+    def __init__(self, config_dir: Path = CONFIG_DIR, reload_interval: float = FORM_CONFIG_RELOAD_INTERVAL):
+        self.config_dir = config_dir
+        self.reload_interval = reload_interval
+        self._forms: dict[str, CompiledForm] = {}
+        # 로드 실패한 파일의 mtime (같은 버전을 반복해서 다시 읽지 않음)
+        self._failed: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._last_check = 0.0
+
+    def load_all(self) -> None:
+        """모든 설정 로드 및 검증 (하나라도 잘못되면 예외)"""
+        forms = {path.stem: _compile_file(path) for path in sorted(self.config_dir.glob("*.json"))}
+        with self._lock:
+            self._forms = forms
+            self._last_check = time.monotonic()
+        print(f"[FormRegistry] Loaded {len(forms)} forms: {', '.join(forms)}")
+
+    def _maybe_reload(self) -> None:
+        """확인 주기가 지났으면 mtime 비교로 변경/추가/삭제된 설정만 다시 로드"""
+        if self.reload_interval <= 0:
+            return
+        now = time.monotonic()
+        if now - self._last_check < self.reload_interval:
+            return
+        with self._lock:
+            if now - self._last_check < self.reload_interval:
+                return
+            self._last_check = now
+            forms = dict(self._forms)
+            paths = {path.stem: path for path in self.config_dir.glob("*.json")}
+            changed = False
+            for form_type in set(forms) - set(paths):
+                del forms[form_type]
+                changed = True
+                print(f"[FormRegistry] Removed {form_type}")
+            for form_type, path in paths.items():
+                current = forms.get(form_type)
+                mtime = None
+                try:
+                    mtime = path.stat().st_mtime
+                    if current is not None and mtime == current.mtime:
+                        continue
+                    if self._failed.get(form_type) == mtime:
+                        continue
+                    forms[form_type] = _compile_file(path)
+                    self._failed.pop(form_type, None)
+                    changed = True
+                    print(f"[FormRegistry] Reloaded {form_type}")
+                except (OSError, json.JSONDecodeError, FormConfigError) as e:
+                    # 잘못된 설정은 적용하지 않고 이전 버전 유지
+                    self._failed[form_type] = mtime
+                    print(f"[FormRegistry] Reload failed for {form_type}: {e}")
+            if changed:
+                self._forms = forms
+
+    def get(self, form_type: str) -> CompiledForm | None:
+        self._maybe_reload()
+        return self._forms.get(form_type)
+
+    def get_by_surface(self, surface_id: str) -> CompiledForm | None:
+        """surfaceId로 폼 조회"""
+        self._maybe_reload()
+        for form in self._forms.values():
+            if form.surface_id == surface_id:
+                return form
+        return None
+
+    def get_catalog(self, name: str) -> OptionCatalog | None:
+        """옵션 카탈로그 조회 (폼 설정의 options 키 기준)"""
+        self._maybe_reload()
+        for form in self._forms.values():
+            catalog = form.catalogs.get(name)
+            if catalog is not None:
+                return catalog
+        return None
+
+    def form_types(self) -> list[str]:
+        self._maybe_reload()
+        return list(self._forms)
+
+
+_registry: FormRegistry | None = None
+
+
+def get_form_registry() -> FormRegistry:
+    """폼 레지스트리 싱글톤 (최초 호출 시 전체 로드)"""
+    global _registry
+    if _registry is None:
+        registry = FormRegistry()
+        registry.load_all()
+        _registry = registry
+    return _registry
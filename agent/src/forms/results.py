@@ -1,32 +1,107 @@
-"""검색 결과 UI 생성기"""
+"""검색 결과 UI 생성기
 
+레이아웃은 정적(사전 인코딩), 결과 목록은 검색 공급자(search 패키지)가 반환한 결과를 카드 데이터로 변환해 채운다.
+"""
+
+from abc import abstractmethod
 from typing import Optional
+
 from .base import BaseFormGenerator
+from .registry import get_form_registry
 
 
-class FlightResultsGenerator(BaseFormGenerator):
-    """항공편 검색 결과 생성"""
+# 렌터카 차종 코드 → 표시명 (car.json 차종 선택지와 동일)
+CAR_TYPE_LABELS = {
+    "compact": "소형", "mid": "중형", "full": "대형",
+    "suv": "SUV", "van": "밴/미니밴", "luxury": "프리미엄",
+}
 
-    SURFACE_ID = "flight-results"
 
-    def generate(self, form_data: Optional[dict] = None) -> list[dict]:
-        messages = []
-        form_data = form_data or {}
+def _option_labels(catalog_name: str) -> dict:
+    """옵션 카탈로그의 코드 → 표시명 (e.g., airports: {"ICN": "인천국제공항 (ICN)"})"""
+    catalog = get_form_registry().get_catalog(catalog_name)
+    if catalog is None:
+        return {}
+    return {option["value"]: option["label"] for option in catalog.options}
 
-        messages.append(self.create_surface(self.SURFACE_ID))
-        messages.append({
-            "updateComponents": {
-                "surfaceId": self.SURFACE_ID,
-                "components": self._get_components()
-            }
-        })
-        messages.append({
+
+def _format_duration(minutes: int) -> str:
+    hours, minutes = divmod(minutes, 60)
+    if not minutes:
+        return f"{hours}시간"
+    return f"{hours}시간 {minutes}분" if hours else f"{minutes}분"
+
+
+def _format_return(leg: dict | None) -> str | None:
+    """왕복 귀국편 요약 (예: "귀국 OZ319 · 10/25 10:50 → 17:25")"""
+    if not leg:
+        return None
+    month, day = leg["departureDate"][5:7], leg["departureDate"][8:10]
+    if leg.get("unavailable"):
+        return f"귀국 {int(month)}/{int(day)} 예약 가능한 편 없음 · 편도 가격"
+    return f"귀국 {leg['flightNo']} · {int(month)}/{int(day)} {leg['departureTime']} → {leg['arrivalTime']}"
+
+
+def _format_stay(result: dict) -> str | None:
+    """숙박 요약 (예: "3박 · 객실 2개 · 총 225,600원")"""
+    nights, rooms = result.get("nights"), result.get("rooms")
+    if not nights or not rooms:
+        return None
+    return f"{nights}박 · 객실 {rooms}개 · 총 {result['pricePerNight'] * nights * rooms:,}원"
+
+
+def _format_rental(result: dict) -> str | None:
+    """대여 요약 (예: "3일 · 완전 자차 보험 · 총 257,700원")"""
+    days = result.get("days")
+    if not days:
+        return None
+    parts = [f"{days}일", result.get("insurance"), f"총 {result['pricePerDay'] * days:,}원"]
+    return " · ".join(part for part in parts if part)
+
+
+class BaseResultsGenerator(BaseFormGenerator):
+    """검색 결과 화면 공통 (정적 레이아웃 + 결과 목록 데이터)"""
+
+    SURFACE_ID = ""
+    # 검색 조건 폼 데이터 키 (검색 조건 수정 시 유지)
+    FORM_KEY = ""
+
+    def generate(self, form_data: Optional[dict] = None, results: Optional[list[dict]] = None) -> list[dict]:
+        """[createSurface, updateComponents, updateDataModel]"""
+        return self.layout() + [self.data_message(form_data or {}, results or [])]
+
+    def layout(self) -> list[dict]:
+        """정적 레이아웃 메시지 (사전 인코딩 캐시 사용, 검색 결과를 기다리기 전에 먼저 보낼 수 있음)"""
+        return self.layout_messages(self.SURFACE_ID, self._get_components)
+
+    def data_message(self, form_data: dict, results: list[dict]) -> dict:
+        """검색 결과 목록 updateDataModel"""
+        operations = [{"op": "add", "path": "/results", "value": self._to_cards(results)}]
+        # 원래 폼 데이터 복사 (검색 조건 수정 시 유지)
+        if self.FORM_KEY in form_data:
+            operations.append({"op": "add", "path": f"/{self.FORM_KEY}", "value": form_data[self.FORM_KEY]})
+        return {
             "updateDataModel": {
                 "surfaceId": self.SURFACE_ID,
-                "operations": self._get_initial_data(form_data)
+                "operations": operations
             }
-        })
-        return messages
+        }
+
+    @abstractmethod
+    def _get_components(self) -> list[dict]:
+        pass
+
+    @abstractmethod
+    def _to_cards(self, results: list[dict]) -> list[dict]:
+        """공급자 결과 → 결과 카드 데이터"""
+        pass
+
+
+class FlightResultsGenerator(BaseResultsGenerator):
+    """항공편 검색 결과 생성"""
+
+    SURFACE_ID = "flight-results"
+    FORM_KEY = "flight"
 
     def _get_components(self) -> list[dict]:
         return [
@@ -61,80 +136,32 @@ class FlightResultsGenerator(BaseFormGenerator):
             }
         ]
 
-    def _get_initial_data(self, form_data: dict) -> list[dict]:
-        # Mock 항공편 검색 결과
-        operations = [
+    def _to_cards(self, results: list[dict]) -> list[dict]:
+        airports = _option_labels("airports")
+        return [
             {
-                "op": "add",
-                "path": "/results",
-                "value": [
-                    {
-                        "id": "fl1",
-                        "airline": "대한항공",
-                        "flightNo": "KE1201",
-                        "departure": "인천(ICN)",
-                        "arrival": "오사카(KIX)",
-                        "departureTime": "08:30",
-                        "arrivalTime": "10:30",
-                        "price": 189000,
-                        "duration": "2시간"
-                    },
-                    {
-                        "id": "fl2",
-                        "airline": "아시아나항공",
-                        "flightNo": "OZ112",
-                        "departure": "인천(ICN)",
-                        "arrival": "오사카(KIX)",
-                        "departureTime": "10:15",
-                        "arrivalTime": "12:15",
-                        "price": 175000,
-                        "duration": "2시간"
-                    },
-                    {
-                        "id": "fl3",
-                        "airline": "진에어",
-                        "flightNo": "LJ201",
-                        "departure": "인천(ICN)",
-                        "arrival": "오사카(KIX)",
-                        "departureTime": "14:00",
-                        "arrivalTime": "16:00",
-                        "price": 129000,
-                        "duration": "2시간"
-                    }
-                ]
+                "id": result["id"],
+                "airline": result["airline"],
+                "flightNo": result["flightNo"],
+                "departure": airports.get(result["departure"], result["departure"]),
+                "arrival": airports.get(result["arrival"], result["arrival"]),
+                "departureTime": result["departureTime"],
+                "arrivalTime": result["arrivalTime"],
+                "price": result["price"],
+                "duration": _format_duration(result["durationMinutes"]),
+                "seatsLeft": result.get("seatsLeft"),
+                "returnFlight": _format_return(result.get("returnFlight")),
+                "provider": result.get("provider")
             }
+            for result in results
         ]
-        # 원래 폼 데이터 복사 (검색 조건 수정 시 유지)
-        if "flight" in form_data:
-            operations.append({"op": "add", "path": "/flight", "value": form_data["flight"]})
-        if "airports" in form_data:
-            operations.append({"op": "add", "path": "/airports", "value": form_data["airports"]})
-        return operations
 
 
-class HotelResultsGenerator(BaseFormGenerator):
+class HotelResultsGenerator(BaseResultsGenerator):
     """호텔 검색 결과 생성"""
 
     SURFACE_ID = "hotel-results"
-
-    def generate(self, form_data: Optional[dict] = None) -> list[dict]:
-        messages = []
-        form_data = form_data or {}
-
-        messages.append(self.create_surface(self.SURFACE_ID))
-        messages.append({
-            "updateComponents": {
-                "surfaceId": self.SURFACE_ID,
-                "components": self._get_components()
-            }
-        })
-        messages.append({
-            "updateDataModel": {
-                "surfaceId": self.SURFACE_ID,
-                "operations": self._get_initial_data(form_data)
-            }
-        })
-        return messages
+    FORM_KEY = "hotel"
 
     def _get_components(self) -> list[dict]:
         return [
@@ -169,74 +196,28 @@ class HotelResultsGenerator(BaseFormGenerator):
             }
         ]
 
-    def _get_initial_data(self, form_data: dict) -> list[dict]:
-        # Mock 호텔 검색 결과
-        operations = [
+    def _to_cards(self, results: list[dict]) -> list[dict]:
+        cities = _option_labels("cities")
+        return [
             {
-                "op": "add",
-                "path": "/results",
-                "value": [
-                    {
-                        "id": "ht1",
-                        "name": "신라스테이 삼성",
-                        "rating": 4.5,
-                        "location": "서울 강남구",
-                        "pricePerNight": 120000,
-                        "amenities": ["조식", "피트니스", "무료 WiFi"],
-                        "image": "hotel1.jpg"
-                    },
-                    {
-                        "id": "ht2",
-                        "name": "노보텔 앰배서더 강남",
-                        "rating": 4.3,
-                        "location": "서울 강남구",
-                        "pricePerNight": 150000,
-                        "amenities": ["조식", "수영장", "피트니스"],
-                        "image": "hotel2.jpg"
-                    },
-                    {
-                        "id": "ht3",
-                        "name": "이비스 스타일 강남",
-                        "rating": 4.0,
-                        "location": "서울 강남구",
-                        "pricePerNight": 85000,
-                        "amenities": ["무료 WiFi", "조식 별도"],
-                        "image": "hotel3.jpg"
-                    }
-                ]
+                "id": result["id"],
+                "name": result["name"],
+                "rating": result["rating"],
+                "location": f"{cities.get(result['city'], result['city'])} {result['area']}",
+                "pricePerNight": result["pricePerNight"],
+                "stay": _format_stay(result),
+                "amenities": result["amenities"],
+                "provider": result.get("provider")
             }
+            for result in results
         ]
-        # 원래 폼 데이터 복사 (검색 조건 수정 시 유지)
-        if "hotel" in form_data:
-            operations.append({"op": "add", "path": "/hotel", "value": form_data["hotel"]})
-        if "cities" in form_data:
-            operations.append({"op": "add", "path": "/cities", "value": form_data["cities"]})
-        return operations
 
 
-class CarResultsGenerator(BaseFormGenerator):
+class CarResultsGenerator(BaseResultsGenerator):
     """렌터카 검색 결과 생성"""
 
     SURFACE_ID = "car-results"
-
-    def generate(self, form_data: Optional[dict] = None) -> list[dict]:
-        messages = []
-        form_data = form_data or {}
-
-        messages.append(self.create_surface(self.SURFACE_ID))
-        messages.append({
-            "updateComponents": {
-                "surfaceId": self.SURFACE_ID,
-                "components": self._get_components()
-            }
-        })
-        messages.append({
-            "updateDataModel": {
-                "surfaceId": self.SURFACE_ID,
-                "operations": self._get_initial_data(form_data)
-            }
-        })
-        return messages
+    FORM_KEY = "car"
 
     def _get_components(self) -> list[dict]:
         return [
@@ -271,52 +252,23 @@ class CarResultsGenerator(BaseFormGenerator):
             }
         ]
 
-    def _get_initial_data(self, form_data: dict) -> list[dict]:
-        # Mock 렌터카 검색 결과
-        operations = [
+    def _to_cards(self, results: list[dict]) -> list[dict]:
+        return [
             {
-                "op": "add",
-                "path": "/results",
-                "value": [
-                    {
-                        "id": "car1",
-                        "model": "현대 아반떼",
-                        "type": "중형",
-                        "company": "롯데렌터카",
-                        "pricePerDay": 55000,
-                        "features": ["네비게이션", "후방카메라", "블루투스"],
-                        "image": "avante.jpg"
-                    },
-                    {
-                        "id": "car2",
-                        "model": "기아 K5",
-                        "type": "중형",
-                        "company": "SK렌터카",
-                        "pricePerDay": 65000,
-                        "features": ["네비게이션", "후방카메라", "통풍시트"],
-                        "image": "k5.jpg"
-                    },
-                    {
-                        "id": "car3",
-                        "model": "현대 투싼",
-                        "type": "SUV",
-                        "company": "쏘카",
-                        "pricePerDay": 75000,
-                        "features": ["네비게이션", "360도 카메라", "4WD"],
-                        "image": "tucson.jpg"
-                    }
-                ]
+                "id": result["id"],
+                "model": result["model"],
+                "type": CAR_TYPE_LABELS.get(result["type"], result["type"]),
+                "company": result["company"],
+                "pricePerDay": result["pricePerDay"],
+                "rental": _format_rental(result),
+                "features": result["features"],
+                "provider": result.get("provider")
             }
+            for result in results
         ]
-        # 원래 폼 데이터 복사 (검색 조건 수정 시 유지)
-        if "car" in form_data:
-            operations.append({"op": "add", "path": "/car", "value": form_data["car"]})
-        if "locations" in form_data:
-            operations.append({"op": "add", "path": "/locations", "value": form_data["locations"]})
-        return operations
 
 
-def get_results_generator(result_type: str) -> BaseFormGenerator | None:
+def get_results_generator(result_type: str) -> BaseResultsGenerator | None:
     """결과 타입에 맞는 생성기 반환"""
     generators = {
         "flights": FlightResultsGenerator,
@@ -328,3 +280,9 @@ def get_results_generator(result_type: str) -> BaseFormGenerator | None:
     if generator_class:
         return generator_class()
     return None
+
+
+def warm_results_layouts() -> None:
+    """결과 화면 레이아웃을 미리 생성/등록 (Surface 정의 조회용)"""
+    for generator_class in (FlightResultsGenerator, HotelResultsGenerator, CarResultsGenerator):
+        generator_class().layout()
@@ -1,5 +1,5 @@
 """LangGraph 기반 여행 예약 에이전트 그래프"""
 
-from .graph import create_travel_graph, get_travel_graph
+from .graph import create_travel_graph, get_travel_graph, get_checkpointer
 
-__all__ = ["create_travel_graph", "get_travel_graph"]
+__all__ = ["create_travel_graph", "get_travel_graph", "get_checkpointer"]
@@ -0,0 +1,587 @@
+"""체크포인터 백엔드 - 환경변수로 선택 (memory | sqlite)
+
+CHECKPOINTER=memory (기본): 프로세스 메모리 (재시작 시 대화 기록 유실)
+CHECKPOINTER=sqlite: 로컬 SQLite 파일 (WAL 모드, 여러 워커가 공유 가능)
+  기본은 쓰기마다 커밋. 그룹 커밋(CHECKPOINT_FLUSH_BATCH > 1)은 단일 프로세스 전용이며
+  WEB_CONCURRENCY > 1이면 꺼진다 (열린 쓰기 트랜잭션이 다른 워커의 쓰기를 막고, 커밋 전 체크포인트가 보이지 않음).
+"""
+
+import os
+import asyncio
+import atexit
+import sqlite3
+import threading
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+)
+from langgraph.checkpoint.memory import MemorySaver
+
+from .. import metrics
+from .state import EPHEMERAL_CHANNELS
+
+
+CHECKPOINTER = os.getenv("CHECKPOINTER", "memory")
+CHECKPOINT_DB_PATH = os.getenv("CHECKPOINT_DB_PATH", "checkpoints.sqlite")
+# 그룹 커밋 (단일 프로세스 전용, 1 = 쓰기마다 커밋): 이 간격(ms)마다 또는 쓰기 횟수가 배치 크기에 도달하면 한 번에 커밋
+CHECKPOINT_FLUSH_INTERVAL_MS = int(os.getenv("CHECKPOINT_FLUSH_INTERVAL_MS", "50"))
+CHECKPOINT_FLUSH_BATCH = int(os.getenv("CHECKPOINT_FLUSH_BATCH", "1"))
+# uvicorn 워커 수 (여러 워커가 같은 DB를 쓰면 그룹 커밋 비활성화)
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+# 보존 정책: thread별 최신 N개 체크포인트만 유지 (1 = 최신만, 0 = 무제한)
+CHECKPOINT_KEEP_LAST = int(os.getenv("CHECKPOINT_KEEP_LAST", "2"))
+# 백그라운드 compaction 주기 (초)
+CHECKPOINT_COMPACT_INTERVAL = float(os.getenv("CHECKPOINT_COMPACT_INTERVAL", "60"))
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT,
+    checkpoint BLOB,
+    metadata_type TEXT,
+    metadata BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT,
+    value BLOB,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+
+def _strip_ephemeral(checkpoint: Checkpoint) -> Checkpoint:
+    """요청 단위 채널(A2UI 출력, 폼 데이터 등)을 제외한 체크포인트 사본 반환"""
+    channel_values = checkpoint.get("channel_values", {})
+    if not any(channel in channel_values for channel in EPHEMERAL_CHANNELS):
+        return checkpoint
+    stripped = dict(checkpoint)
+    stripped["channel_values"] = {
+        k: v for k, v in channel_values.items() if k not in EPHEMERAL_CHANNELS
+    }
+    return stripped
+
+
+def _strip_ephemeral_writes(writes: Sequence[tuple[str, Any]]) -> list[tuple[str, Any]]:
+    """pending writes에서 요청 단위 채널 제외"""
+    return [w for w in writes if w[0] not in EPHEMERAL_CHANNELS]
+
+
+class SqliteCheckpointSaver(BaseCheckpointSaver):
+    """SQLite 기반 체크포인터 (MemorySaver 대체용)
+
+    - WAL 모드로 읽기/쓰기 동시성 확보
+    - 기본은 put/put_writes가 반환하기 전에 커밋 (다른 워커가 바로 조회 가능)
+    - flush_batch > 1이면 쓰기를 하나의 트랜잭션에 모아 주기적으로 커밋 (group commit, 단일 프로세스 전용)
+      같은 커넥션에서 읽으므로 커밋 전 데이터도 즉시 조회된다.
+    - thread_id별 최신 체크포인트는 PK 인덱스 역순 조회 1건으로 읽는다.
+    """
+
+    def __init__(
+        self,
+        path: str = CHECKPOINT_DB_PATH,
+        flush_interval_ms: int = CHECKPOINT_FLUSH_INTERVAL_MS,
+        flush_batch: int = CHECKPOINT_FLUSH_BATCH,
+    ):
+        super().__init__()
+        self.path = path
+        self.flush_interval = flush_interval_ms / 1000
+        self.flush_batch = max(1, flush_batch)
+
+        # isolation_level=None: 트랜잭션을 직접 BEGIN/COMMIT으로 관리
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._closed = False
+
+        # 백그라운드 flush 스레드 (그룹 커밋일 때만)
+        self._stop = threading.Event()
+        if self.flush_batch > 1:
+            threading.Thread(target=self._flush_loop, name="checkpoint-flusher", daemon=True).start()
+        atexit.register(self.close)
+
+    # ----- group commit -----
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """대기 중인 쓰기 커밋"""
+        with self._lock:
+            self._commit_locked()
+
+    def _commit_locked(self) -> None:
+        if not self._closed and self._conn.in_transaction:
+            self._conn.execute("COMMIT")
+        self._pending = 0
+
+    def _write(self, sql: str, rows: Sequence[tuple]) -> None:
+        """열린 트랜잭션에 쓰기 추가, 배치 크기 도달 시 즉시 커밋"""
+        with self._lock:
+            if not self._conn.in_transaction:
+                self._conn.execute("BEGIN")
+            self._conn.executemany(sql, rows)
+            self._pending += 1
+            if self._pending >= self.flush_batch:
+                self._commit_locked()
+
+    def close(self) -> None:
+        """남은 쓰기 커밋 후 커넥션 종료"""
+        self._stop.set()
+        with self._lock:
+            if self._closed:
+                return
+            self._commit_locked()
+            self._conn.close()
+            self._closed = True
+
+    # ----- 조회 -----
+
+    def _load_writes(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> list[tuple[str, str, Any]]:
+        rows = self._conn.execute(
+            "SELECT task_id, channel, type, value FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        return [(task_id, channel, self.serde.loads_typed((type_, value))) for task_id, channel, type_, value in rows]
+
+    def _to_tuple(self, thread_id: str, checkpoint_ns: str, row: tuple) -> CheckpointTuple:
+        checkpoint_id, parent_id, type_, checkpoint, metadata_type, metadata = row
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self.serde.loads_typed((type_, checkpoint)),
+            metadata=self.serde.loads_typed((metadata_type, metadata)),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=self._load_writes(thread_id, checkpoint_ns, checkpoint_id),
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+
+        columns = "checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type, metadata"
+        with self._lock:
+            if checkpoint_id:
+                row = self._conn.execute(
+                    f"SELECT {columns} FROM checkpoints "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, checkpoint_ns, checkpoint_id),
+                ).fetchone()
+            else:
+                # 최신 체크포인트만 조회 (checkpoint_id는 시간순 정렬되는 uuid6)
+                row = self._conn.execute(
+                    f"SELECT {columns} FROM checkpoints "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
+                    (thread_id, checkpoint_ns),
+                ).fetchone()
+            if row is None:
+                return None
+            return self._to_tuple(thread_id, checkpoint_ns, row)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        where, params = [], []
+        if config:
+            where.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            checkpoint_ns = config["configurable"].get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                where.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                where.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before and (before_id := get_checkpoint_id(before)):
+            where.append("checkpoint_id < ?")
+            params.append(before_id)
+
+        sql = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+            "type, checkpoint, metadata_type, metadata FROM checkpoints"
+        )
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY checkpoint_id DESC"
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+            results = []
+            for thread_id, checkpoint_ns, *row in rows:
+                item = self._to_tuple(thread_id, checkpoint_ns, tuple(row))
+                # metadata 필터는 역직렬화 후 적용
+                if filter and not all(item.metadata.get(k) == v for k, v in filter.items()):
+                    continue
+                results.append(item)
+                if limit is not None and len(results) >= limit:
+                    break
+
+        yield from results
+
+    # ----- 저장 -----
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        type_, serialized = self.serde.dumps_typed(_strip_ephemeral(checkpoint))
+        metadata_type, serialized_metadata = self.serde.dumps_typed(metadata)
+
+        self._write(
+            "INSERT OR REPLACE INTO checkpoints "
+            "(thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata_type, metadata) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(
+                thread_id,
+                checkpoint_ns,
+                checkpoint["id"],
+                config["configurable"].get("checkpoint_id"),
+                type_,
+                serialized,
+                metadata_type,
+                serialized_metadata,
+            )],
+        )
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        writes = _strip_ephemeral_writes(writes)
+        if not writes:
+            return
+
+        # 특수 채널(에러/인터럽트 등)만 있는 경우 덮어쓰기, 그 외에는 최초 기록 유지
+        verb = "INSERT OR REPLACE" if all(w[0] in WRITES_IDX_MAP for w in writes) else "INSERT OR IGNORE"
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            type_, serialized = self.serde.dumps_typed(value)
+            rows.append((
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                WRITES_IDX_MAP.get(channel, idx),
+                channel,
+                type_,
+                serialized,
+                task_path,
+            ))
+        self._write(
+            f"{verb} INTO writes "
+            "(thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value, task_path) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            if not self._conn.in_transaction:
+                self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+            self._conn.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
+            self._commit_locked()
+
+    # ----- 보존 정책 -----
+
+    def prune(self, keep_last: int) -> int:
+        """thread/namespace별 최신 keep_last개를 제외한 체크포인트 삭제, 삭제 건수 반환"""
+        with self._lock:
+            if not self._conn.in_transaction:
+                self._conn.execute("BEGIN")
+            deleted = self._conn.execute(
+                "DELETE FROM checkpoints WHERE rowid IN ("
+                "  SELECT rowid FROM ("
+                "    SELECT rowid, ROW_NUMBER() OVER ("
+                "      PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC"
+                "    ) AS rn FROM checkpoints"
+                "  ) WHERE rn > ?"
+                ")",
+                (keep_last,),
+            ).rowcount
+            # 삭제된 체크포인트에 딸린 pending writes 정리
+            self._conn.execute(
+                "DELETE FROM writes WHERE NOT EXISTS ("
+                "  SELECT 1 FROM checkpoints c WHERE c.thread_id = writes.thread_id"
+                "  AND c.checkpoint_ns = writes.checkpoint_ns AND c.checkpoint_id = writes.checkpoint_id"
+                ")"
+            )
+            self._commit_locked()
+        return deleted
+
+    def thread_sizes(self) -> dict[str, int]:
+        """thread별 보존 중인 직렬화 바이트 수"""
+        sizes: dict[str, int] = {}
+        with self._lock:
+            for thread_id, size in self._conn.execute(
+                "SELECT thread_id, SUM(LENGTH(checkpoint) + LENGTH(metadata)) FROM checkpoints GROUP BY thread_id"
+            ):
+                sizes[thread_id] = sizes.get(thread_id, 0) + (size or 0)
+            for thread_id, size in self._conn.execute(
+                "SELECT thread_id, SUM(LENGTH(value)) FROM writes GROUP BY thread_id"
+            ):
+                sizes[thread_id] = sizes.get(thread_id, 0) + (size or 0)
+        return sizes
+
+    # ----- 비동기 (스레드 오프로딩) -----
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+class CompactingMemorySaver(MemorySaver):
+    """보존 정책(prune)과 크기 측정을 지원하는 MemorySaver
+
+    MemorySaver 내부 저장소 구조:
+    - storage[thread_id][checkpoint_ns][checkpoint_id] = (checkpoint, metadata, parent_id)
+    - writes[(thread_id, checkpoint_ns, checkpoint_id)] = {...}
+    - blobs[(thread_id, checkpoint_ns, channel, version)] = 채널 값
+
+    요청 단위 채널(EPHEMERAL_CHANNELS)은 저장하지 않는다.
+    prune은 백그라운드 스레드에서 실행되므로 저장소를 읽고 바꾸는 메서드는 모두 같은 락을 잡는다
+    (put은 blob을 먼저 쓰고 체크포인트를 나중에 기록하므로, 락 없이 정리하면 방금 쓴 blob이 삭제될 수 있음).
+    비동기 메서드(aput 등)는 MemorySaver가 동기 메서드를 그대로 호출하므로 함께 보호된다.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # 상위 구현이 내부에서 다른 공개 메서드를 호출해도 교착되지 않도록 재진입 락
+        self._lock = threading.RLock()
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        with self._lock:
+            return super().get_tuple(config)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        with self._lock:
+            items = list(super().list(config, filter=filter, before=before, limit=limit))
+        yield from items
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        with self._lock:
+            return super().put(config, _strip_ephemeral(checkpoint), metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        writes = _strip_ephemeral_writes(writes)
+        if writes:
+            with self._lock:
+                super().put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            super().delete_thread(thread_id)
+
+    def prune(self, keep_last: int) -> int:
+        """thread/namespace별 최신 keep_last개를 제외한 체크포인트 삭제, 삭제 건수 반환
+
+        락은 namespace 하나를 정리하는 동안만 잡는다 (요청 처리의 put이 전체 pass를 기다리지 않도록).
+        """
+        deleted = 0
+        # (thread_id, checkpoint_ns)별 blob 키 (정리할 namespace가 처음 나올 때 한 번만 전체 순회)
+        # 스냅샷 이후 추가된 blob은 목록에 없으므로 삭제되지 않고, 목록의 blob은 락 안에서 참조 여부를 다시 계산해 판단한다.
+        blob_keys: dict[tuple[str, str], list] | None = None
+        with self._lock:
+            targets = [
+                (thread_id, checkpoint_ns)
+                for thread_id, namespaces in self.storage.items()
+                for checkpoint_ns, checkpoints in namespaces.items()
+                if len(checkpoints) > keep_last
+            ]
+        for thread_id, checkpoint_ns in targets:
+            if blob_keys is None:
+                with self._lock:
+                    keys = list(self.blobs)
+                blob_keys = {}
+                for key in keys:
+                    blob_keys.setdefault((key[0], key[1]), []).append(key)
+            with self._lock:
+                checkpoints = self.storage.get(thread_id, {}).get(checkpoint_ns)
+                if not checkpoints or len(checkpoints) <= keep_last:
+                    continue
+
+                # checkpoint_id는 시간순 정렬되는 uuid6
+                ordered = sorted(checkpoints, reverse=True)
+                for checkpoint_id in ordered[keep_last:]:
+                    del checkpoints[checkpoint_id]
+                    self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+                    deleted += 1
+
+                # 남은 체크포인트가 참조하지 않는 채널 값(blob) 삭제
+                referenced = set()
+                for saved_checkpoint, _, _ in checkpoints.values():
+                    versions = self.serde.loads_typed(saved_checkpoint)["channel_versions"]
+                    referenced.update(versions.items())
+                for key in blob_keys.get((thread_id, checkpoint_ns), []):
+                    if (key[2], key[3]) not in referenced:
+                        self.blobs.pop(key, None)
+        return deleted
+
+    def thread_sizes(self) -> dict[str, int]:
+        """thread별 보존 중인 직렬화 바이트 수"""
+        sizes: dict[str, int] = {}
+        with self._lock:
+            for thread_id, namespaces in self.storage.items():
+                size = 0
+                for checkpoints in namespaces.values():
+                    for saved_checkpoint, saved_metadata, _ in checkpoints.values():
+                        size += len(saved_checkpoint[1]) + len(saved_metadata[1])
+                sizes[thread_id] = size
+            for (thread_id, *_), writes in self.writes.items():
+                sizes[thread_id] = sizes.get(thread_id, 0) + sum(len(w[2][1]) for w in writes.values())
+            for (thread_id, *_), blob in self.blobs.items():
+                sizes[thread_id] = sizes.get(thread_id, 0) + len(blob[1])
+        return sizes
+
+
+def compact_checkpoints(checkpointer: BaseCheckpointSaver, keep_last: int = CHECKPOINT_KEEP_LAST) -> dict[str, int]:
+    """보존 정책 적용 후 thread별 보존 바이트 수를 메트릭에 기록"""
+    if keep_last > 0 and hasattr(checkpointer, "prune"):
+        deleted = checkpointer.prune(keep_last)
+        metrics.inc("checkpoints_pruned", deleted)
+
+    if not hasattr(checkpointer, "thread_sizes"):
+        return {}
+
+    sizes = checkpointer.thread_sizes()
+    total = sum(sizes.values())
+    metrics.set_gauge("checkpoint_threads", len(sizes))
+    metrics.set_gauge("checkpoint_bytes_total", total)
+    metrics.set_gauge("checkpoint_bytes_per_thread_avg", total / len(sizes) if sizes else 0)
+    metrics.set_gauge("checkpoint_bytes_per_thread_max", max(sizes.values(), default=0))
+    return sizes
+
+
+def create_checkpointer() -> BaseCheckpointSaver:
+    """CHECKPOINTER 환경변수에 따라 체크포인터 생성"""
+    if CHECKPOINTER == "sqlite":
+        flush_batch = CHECKPOINT_FLUSH_BATCH
+        if flush_batch > 1 and WEB_CONCURRENCY > 1:
+            print(f"[Checkpointer] Group commit disabled: {WEB_CONCURRENCY} workers share {CHECKPOINT_DB_PATH}")
+            flush_batch = 1
+        if flush_batch > 1:
+            print(f"[Checkpointer] SQLite: {CHECKPOINT_DB_PATH} (flush {CHECKPOINT_FLUSH_INTERVAL_MS}ms / {flush_batch} writes)")
+        else:
+            print(f"[Checkpointer] SQLite: {CHECKPOINT_DB_PATH} (commit per write)")
+        return SqliteCheckpointSaver(flush_batch=flush_batch)
+    if CHECKPOINTER != "memory":
+        print(f"[Checkpointer] Unknown backend '{CHECKPOINTER}', falling back to memory")
+    return CompactingMemorySaver()
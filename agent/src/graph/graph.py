@@ -1,14 +1,17 @@
 """LangGraph 그래프 정의"""
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
 
 from .state import TravelState
+from .checkpoint import create_checkpointer
 from ..nodes import (
     intent_node,
+    aintent_node,
     form_generator_node,
     conversation_node,
-    action_handler_node,
+    aconversation_node,
+    aaction_handler_node,
     modify_handler_node,
     clarify_handler_node,
 )
@@ -19,6 +22,9 @@ def route_input(state: TravelState) -> str:
     if state.get("user_action"):
         return "action_handler"
     elif state.get("user_message"):
+        # 호출 측에서 이미 분석한 의도가 주입된 경우 intent 노드(LLM 호출)를 건너뜀
+        if state.get("intent_type"):
+            return route_intent(state)
         return "intent"
     return END
 
@@ -37,17 +43,27 @@ def route_intent(state: TravelState) -> str:
         return "conversation"
 
 
-def create_travel_graph():
-    """여행 예약 에이전트 그래프 생성"""
+def _build_graph() -> StateGraph:
+    """노드/엣지가 구성된 (컴파일 전) 그래프 생성
+
+    LLM을 호출하는 노드는 sync/async 구현을 함께 등록하므로
+    invoke()와 ainvoke()/astream() 모두에서 동작한다.
+    ainvoke 경로에서는 LLM 호출이 이벤트 루프를 블로킹하지 않는다.
 
-    # 그래프 생성
+    A2UI 메시지를 스트리밍하는 노드는 LangGraph가 writer를 주입하도록 함수를 그대로 등록한다
+    (RunnableLambda로 감싸면 주입되지 않음). action_handler는 검색 공급자 fan-out을 기다리므로
+    async로만 등록되어 ainvoke()/astream() 전용이다.
+    """
     graph = StateGraph(TravelState)
 
     # 노드 추가
-    graph.add_node("intent", intent_node)
+    graph.add_node("intent", RunnableLambda(intent_node, afunc=aintent_node, name="intent"))
     graph.add_node("form_generator", form_generator_node)
-    graph.add_node("conversation", conversation_node)
-    graph.add_node("action_handler", action_handler_node)
+    graph.add_node(
+        "conversation",
+        RunnableLambda(conversation_node, afunc=aconversation_node, name="conversation"),
+    )
+    graph.add_node("action_handler", aaction_handler_node)
     graph.add_node("modify_handler", modify_handler_node)
     graph.add_node("clarify_handler", clarify_handler_node)
 
@@ -73,54 +89,32 @@ def create_travel_graph():
     graph.add_edge("modify_handler", END)
     graph.add_edge("clarify_handler", END)
 
+    return graph
+
+
+def create_travel_graph():
+    """여행 예약 에이전트 그래프 생성"""
     # 컴파일
-    return graph.compile()
+    return _build_graph().compile()
 
 
-# 싱글톤: 체크포인터 (세션별 대화 기록 자동 관리)
-_checkpointer = MemorySaver()
+# 싱글톤: 체크포인터 (세션별 대화 기록 자동 관리, CHECKPOINTER 환경변수로 백엔드 선택)
+_checkpointer = create_checkpointer()
 
 # 싱글톤: 컴파일된 그래프
 _compiled_graph = None
 
 
+def get_checkpointer():
+    """싱글톤 체크포인터 반환 (세션 정리 시 thread 삭제용)"""
+    return _checkpointer
+
+
 def get_travel_graph():
     """싱글톤 그래프 반환 (체크포인터 포함)"""
     global _compiled_graph
     if _compiled_graph is None:
-        graph = StateGraph(TravelState)
-
-        # 노드 추가
-        graph.add_node("intent", intent_node)
-        graph.add_node("form_generator", form_generator_node)
-        graph.add_node("conversation", conversation_node)
-        graph.add_node("action_handler", action_handler_node)
-        graph.add_node("modify_handler", modify_handler_node)
-        graph.add_node("clarify_handler", clarify_handler_node)
-
-        # 시작점: 조건부 엔트리 포인트
-        graph.set_conditional_entry_point(route_input)
-
-        # intent 노드 이후 조건부 라우팅
-        graph.add_conditional_edges(
-            "intent",
-            route_intent,
-            {
-                "form_generator": "form_generator",
-                "conversation": "conversation",
-                "modify_handler": "modify_handler",
-                "clarify_handler": "clarify_handler",
-            },
-        )
-
-        # 각 노드에서 종료
-        graph.add_edge("form_generator", END)
-        graph.add_edge("conversation", END)
-        graph.add_edge("action_handler", END)
-        graph.add_edge("modify_handler", END)
-        graph.add_edge("clarify_handler", END)
-
         # 체크포인터와 함께 컴파일
-        _compiled_graph = graph.compile(checkpointer=_checkpointer)
+        _compiled_graph = _build_graph().compile(checkpointer=_checkpointer)
 
     return _compiled_graph
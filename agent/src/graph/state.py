@@ -8,11 +8,11 @@ from langgraph.graph.message import add_messages
 class TravelState(TypedDict, total=False):
     """여행 예약 에이전트 상태"""
 
-    # 입력
+    # 입력 (요청마다 새로 설정, 체크포인트에 저장하지 않음)
     user_message: str  # 사용자 텍스트 메시지
     user_action: dict  # 사용자 액션 (버튼 클릭 등)
 
-    # 현재 폼 데이터 (폼 업데이트용)
+    # 현재 폼 데이터 (폼 업데이트용, current_data는 요청마다 클라이언트가 전송하므로 저장하지 않음)
     current_data: dict  # 현재 활성 폼의 dataModel
     current_surface_id: str  # 현재 활성 Surface ID
 
@@ -22,6 +22,13 @@ class TravelState(TypedDict, total=False):
 
     # 대화 히스토리 (LangChain 메시지 타입, add_messages reducer)
     chat_history: Annotated[list[BaseMessage], add_messages]
+    # 토큰 예산을 벗어나 chat_history에서 제거된 오래된 대화의 누적 요약
+    history_summary: str
 
-    # 출력 (A2UI 메시지들)
+    # 출력 (A2UI 메시지들, 요청별 출력이므로 체크포인트에 저장하지 않음)
     messages: list[dict]
+
+
+# 체크포인트에 저장하지 않는 채널 (요청 단위 입력/출력)
+# 체크포인트에는 대화 상태(chat_history, entities, surface 정보)만 남긴다.
+EPHEMERAL_CHANNELS = frozenset({"user_message", "user_action", "current_data", "messages"})
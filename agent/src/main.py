@@ -3,14 +3,26 @@
 from dotenv import load_dotenv
 load_dotenv()  # 다른 모듈 import 전에 환경변수 로드
 
-import json
-from fastapi import FastAPI, Header
+import asyncio
+from fastapi import FastAPI, Header, HTTPException, Query, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
 
+from . import metrics
+from .payload import encode_response
+from .streaming import coalesce_answers, cancel_on_disconnect
+from .ws import serve_websocket
+from .surfaces import compact_messages, parse_known_surfaces, get_surface_definition
 from .agent import TravelAgent
+from .session import get_session_manager, SESSION_SWEEP_INTERVAL
+from .graph import get_checkpointer
+from .graph.checkpoint import compact_checkpoints, CHECKPOINT_COMPACT_INTERVAL
+from .forms import get_form_registry
+from .forms.results import warm_results_layouts
+from .search import get_flight_inventory, get_hotel_index, get_car_availability
+from .nodes import get_initial_ui
 from .nodes.llm import LLM_MODEL, LLM_MAX_TOKENS, LLM_REASONING_EFFORT, reset_llm
 
 app = FastAPI(title="Travel Booking Agent")
@@ -22,6 +34,41 @@ async def startup_event():
     reset_llm()  # 캐시된 LLM 인스턴스 리셋
     reasoning_info = f", reasoning={LLM_REASONING_EFFORT}" if LLM_REASONING_EFFORT else ""
     print(f"[LLM Config] Model: {LLM_MODEL}, max_tokens: {LLM_MAX_TOKENS}{reasoning_info}, streaming=True")
+    # 폼 설정 로드/검증 (잘못된 설정이면 시작 실패)
+    get_form_registry()
+    # 코드 정의 Surface(결과 화면, 초기 UI) 등록 (재시작 후에도 참조 조회 가능하도록)
+    warm_results_layouts()
+    get_initial_ui()
+    # 항공편 인벤토리/호텔 색인/렌터카 가용성 생성 (첫 검색이 기다리지 않도록, 이벤트 루프는 막지 않음)
+    await asyncio.to_thread(get_flight_inventory)
+    await asyncio.to_thread(get_hotel_index)
+    await asyncio.to_thread(get_car_availability)
+    # 유휴 세션 주기적 정리
+    app.state.session_sweeper = asyncio.create_task(_session_sweeper())
+    # 체크포인트 보존 정책 적용 (오래된 체크포인트 정리)
+    app.state.checkpoint_compactor = asyncio.create_task(_checkpoint_compactor())
+
+
+async def _session_sweeper():
+    """유휴 세션 백그라운드 정리 루프"""
+    session_manager = get_session_manager()
+    while True:
+        await asyncio.sleep(SESSION_SWEEP_INTERVAL)
+        try:
+            session_manager.sweep()
+        except Exception as e:
+            print(f"[Session] Sweep error: {e}")
+
+
+async def _checkpoint_compactor():
+    """체크포인트 compaction 백그라운드 루프"""
+    while True:
+        await asyncio.sleep(CHECKPOINT_COMPACT_INTERVAL)
+        try:
+            # 저장소 전체를 훑는 작업 (SQLite면 디스크 I/O) → 이벤트 루프 밖에서 실행
+            await asyncio.to_thread(compact_checkpoints, get_checkpointer())
+        except Exception as e:
+            print(f"[Checkpointer] Compaction error: {e}")
 
 # CORS 설정
 app.add_middleware(
@@ -48,15 +95,9 @@ class ChatRequest(BaseModel):
     surfaceId: Optional[str] = None     # 현재 활성 Surface ID
 
 
-# 클라이언트별 에이전트 관리
-agents: dict[str, TravelAgent] = {}
-
-
 def get_or_create_agent(client_id: str) -> TravelAgent:
-    """클라이언트별 에이전트 가져오기 또는 생성"""
-    if client_id not in agents:
-        agents[client_id] = TravelAgent(thread_id=client_id)
-    return agents[client_id]
+    """클라이언트별 에이전트 가져오기 또는 생성 (세션 매니저가 LRU/TTL로 관리)"""
+    return get_session_manager().get_or_create(client_id)
 
 
 @app.get("/health")
@@ -64,6 +105,77 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """프로세스 내 메트릭 (세션 수, 제거 횟수 등)"""
+    return metrics.snapshot()
+
+
+@app.get("/metrics/checkpoints")
+async def get_checkpoint_metrics(limit: int = 20):
+    """thread별 보존 중인 체크포인트 바이트 수 (큰 순서)"""
+    checkpointer = get_checkpointer()
+    sizes = await asyncio.to_thread(checkpointer.thread_sizes) if hasattr(checkpointer, "thread_sizes") else {}
+    top = sorted(sizes.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return {
+        "threads": len(sizes),
+        "bytesTotal": sum(sizes.values()),
+        "top": [{"threadId": thread_id, "bytes": size} for thread_id, size in top],
+    }
+
+
+@app.get("/options/{catalog_name}")
+async def get_option_catalog(
+    catalog_name: str,
+    v: Optional[str] = None,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """옵션 카탈로그 (airports, cities, locations)
+
+    폼 데이터 모델의 {"$catalog", "version"} 참조를 클라이언트가 해석할 때 사용.
+    버전(?v=)이 현재 버전과 같으면 내용이 바뀌지 않으므로 장기 캐시, 아니면 ETag로 재검증.
+    """
+    catalog = get_form_registry().get_catalog(catalog_name)
+    if catalog is None:
+        raise HTTPException(status_code=404, detail=f"Unknown catalog: {catalog_name}")
+
+    cache_control = "public, max-age=31536000, immutable" if v == catalog.version else "no-cache"
+    headers = {"ETag": catalog.etag, "Cache-Control": cache_control}
+    if if_none_match and catalog.etag in [tag.strip() for tag in if_none_match.split(",")]:
+        metrics.inc("option_catalog_not_modified")
+        return Response(status_code=304, headers=headers)
+
+    metrics.inc("option_catalog_served")
+    metrics.inc("option_catalog_bytes", len(catalog.encoded))
+    return Response(content=catalog.encoded, media_type="application/json", headers=headers)
+
+
+@app.get("/catalog/{catalog_id}/surfaces/{surface_id}")
+async def get_surface(
+    catalog_id: str,
+    surface_id: str,
+    v: Optional[str] = None,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    """Surface 정의(컴포넌트 트리)
+
+    채팅 응답의 definitionRef를 클라이언트가 해석할 때 사용.
+    버전(?v=)이 현재 버전과 같으면 장기 캐시, 아니면 ETag로 재검증.
+    """
+    definition = get_surface_definition(catalog_id, surface_id)
+    if definition is None:
+        raise HTTPException(status_code=404, detail=f"Unknown surface: {catalog_id}/{surface_id}")
+
+    cache_control = "public, max-age=31536000, immutable" if v == definition.version else "no-cache"
+    headers = {"ETag": definition.etag, "Cache-Control": cache_control}
+    if if_none_match and definition.etag in [tag.strip() for tag in if_none_match.split(",")]:
+        metrics.inc("surface_definition_not_modified")
+        return Response(status_code=304, headers=headers)
+
+    metrics.inc("surface_definition_served")
+    return Response(content=definition.encoded, media_type="application/json", headers=headers)
+
+
 @app.get("/chat/init")
 async def chat_init(x_client_id: str = Header(alias="X-Client-ID")):
     """초기화 - 에이전트 생성만 하고 UI는 보내지 않음"""
@@ -77,7 +189,11 @@ async def chat_init(x_client_id: str = Header(alias="X-Client-ID")):
 
 
 @app.post("/chat")
-async def chat(request: ChatRequest, x_client_id: str = Header(alias="X-Client-ID")):
+async def chat(
+    request: ChatRequest,
+    x_client_id: str = Header(alias="X-Client-ID"),
+    x_known_surfaces: Optional[str] = Header(default=None, alias="X-Known-Surfaces"),
+):
     """채팅 메시지 처리"""
     agent = get_or_create_agent(x_client_id)
 
@@ -96,13 +212,21 @@ async def chat(request: ChatRequest, x_client_id: str = Header(alias="X-Client-I
     # 에이전트에서 응답 처리
     responses = await agent.handle_message(message)
 
-    # 모든 메시지를 배열로 반환
-    return {"messages": responses}
+    # 클라이언트가 가진 Surface 정의는 참조로 대체
+    responses = compact_messages(responses, parse_known_surfaces(x_known_surfaces))
+
+    # 모든 메시지를 배열로 반환 (사전 인코딩된 정적 메시지는 바이트 그대로 삽입)
+    return Response(content=encode_response({"messages": responses}), media_type="application/json")
 
 
 @app.post("/chat/stream")
-async def chat_stream(request: ChatRequest, x_client_id: str = Header(alias="X-Client-ID")):
-    """채팅 메시지 처리 (SSE 스트리밍)"""
+async def chat_stream(
+    request: ChatRequest,
+    http_request: Request,
+    x_client_id: str = Header(alias="X-Client-ID"),
+    x_known_surfaces: Optional[str] = Header(default=None, alias="X-Known-Surfaces"),
+):
+    """채팅 메시지/userAction 처리 (SSE 스트리밍, 클라이언트 연결이 끊기면 처리 취소)"""
     agent = get_or_create_agent(x_client_id)
 
     # 요청을 dict로 변환
@@ -116,13 +240,25 @@ async def chat_stream(request: ChatRequest, x_client_id: str = Header(alias="X-C
     elif request.userAction:
         message["userAction"] = request.userAction.model_dump()
 
+    known_surfaces = parse_known_surfaces(x_known_surfaces)
+
     async def event_generator():
         """SSE 이벤트 생성기"""
         try:
-            async for event in agent.handle_message_stream(message):
-                yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+            # 연속된 answer 토큰은 묶어서 전송 (쓰기 횟수 감소), 연결이 끊기면 그래프 실행까지 취소
+            events = cancel_on_disconnect(
+                coalesce_answers(agent.handle_message_stream(message)), http_request.is_disconnected
+            )
+            async for event in events:
+                # 클라이언트가 가진 Surface 정의는 참조로 대체
+                if known_surfaces:
+                    if "messages" in event:
+                        event = {**event, "messages": compact_messages(event["messages"], known_surfaces)}
+                    elif "message" in event:
+                        event = {**event, "message": compact_messages([event["message"]], known_surfaces)[0]}
+                yield b"data: " + encode_response(event) + b"\n\n"
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
+            yield b"data: " + encode_response({"type": "error", "error": str(e)}) + b"\n\n"
 
     return StreamingResponse(
         event_generator(),
@@ -133,3 +269,20 @@ async def chat_stream(request: ChatRequest, x_client_id: str = Header(alias="X-C
             "X-Accel-Buffering": "no",  # nginx 버퍼링 비활성화
         },
     )
+
+
+@app.websocket("/ws")
+async def websocket_chat(
+    websocket: WebSocket,
+    client_id: Optional[str] = Query(default=None, alias="clientId"),
+):
+    """채팅 WebSocket - 클라이언트당 연결 하나로 텍스트/userAction 요청과 스트리밍 이벤트 전송
+
+    브라우저 WebSocket은 헤더를 지정할 수 없으므로 clientId는 쿼리 파라미터(없으면 X-Client-ID 헤더)로 받는다.
+    이벤트 형식은 /chat/stream과 같고, 요청 id가 함께 붙는다.
+    """
+    client_id = client_id or websocket.headers.get("x-client-id")
+    if not client_id:
+        await websocket.close(code=1008, reason="clientId required")
+        return
+    await serve_websocket(websocket, client_id)
@@ -0,0 +1,34 @@
+"""프로세스 내 간단한 메트릭 (카운터/게이지)
+
+외부 의존성 없이 /metrics 엔드포인트로 노출하기 위한 최소 구현.
+"""
+
+import threading
+
+_lock = threading.Lock()
+_counters: dict[str, float] = {}
+_gauges: dict[str, float] = {}
+
+
+def inc(name: str, value: float = 1) -> None:
+    """카운터 증가"""
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def set_gauge(name: str, value: float) -> None:
+    """게이지 값 설정"""
+    with _lock:
+        _gauges[name] = value
+
+
+def get_counter(name: str) -> float:
+    """카운터 현재 값"""
+    with _lock:
+        return _counters.get(name, 0)
+
+
+def snapshot() -> dict:
+    """전체 메트릭 스냅샷"""
+    with _lock:
+        return {"counters": dict(_counters), "gauges": dict(_gauges)}
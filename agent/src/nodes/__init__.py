@@ -1,18 +1,23 @@
 """그래프 노드 함수들"""
 
-from .intent import intent_node
-from .form import form_generator_node
-from .conversation import conversation_node
-from .action import action_handler_node
+from .intent import intent_node, aintent_node, astream_intent
+from .form import form_generator_node, form_scaffold_messages
+from .conversation import conversation_node, aconversation_node
+from .action import action_handler_node, aaction_handler_node
 from .modify import modify_handler_node
 from .clarify import clarify_handler_node
 from .ui import get_initial_ui
 
 __all__ = [
     "intent_node",
+    "aintent_node",
+    "astream_intent",
     "form_generator_node",
+    "form_scaffold_messages",
     "conversation_node",
+    "aconversation_node",
     "action_handler_node",
+    "aaction_handler_node",
     "modify_handler_node",
     "clarify_handler_node",
     "get_initial_ui",
@@ -1,9 +1,15 @@
 """사용자 액션 처리 노드"""
 
+import asyncio
+
+from langgraph.types import StreamWriter
+
 from ..graph.state import TravelState
 from ..forms import get_form_generator
 from ..forms.results import get_results_generator
+from ..search import SearchQuery, get_search_aggregator
 from .ui import get_initial_ui
+from .stream import emit_messages
 
 
 def _extract_entities_from_data(current_data: dict, travel_type: str) -> dict:
@@ -40,7 +46,7 @@ def _extract_entities_from_data(current_data: dict, travel_type: str) -> dict:
     return entities
 
 
-def action_handler_node(state: TravelState) -> TravelState:
+async def aaction_handler_node(state: TravelState, writer: StreamWriter = None) -> TravelState:
     """사용자 액션(버튼 클릭 등) 처리 노드"""
     user_action = state.get("user_action", {})
     action_type = user_action.get("action", "")
@@ -49,32 +55,48 @@ def action_handler_node(state: TravelState) -> TravelState:
 
     messages = []
 
+    def add(new_messages: list[dict]) -> None:
+        # 스트리밍 실행이면 만든 순서대로 바로 전달 (이전 결과 화면 삭제 → 새 Surface)
+        emit_messages(new_messages, writer)
+        messages.extend(new_messages)
+
     # 여행 타입 선택 액션
     if action_type.startswith("select-"):
         travel_type = action_type.replace("select-", "")
 
         # 검색 결과에서 온 경우 기존 Surface 삭제
         if surface_id and surface_id.endswith("-results"):
-            messages.append({"deleteSurface": {"surfaceId": surface_id}})
+            add([{"deleteSurface": {"surfaceId": surface_id}}])
 
         generator = get_form_generator(travel_type)
         if generator:
             # 기존 데이터가 있으면 유지
             entities = _extract_entities_from_data(current_data, travel_type)
-            messages.extend(generator.generate(entities))
+            add(generator.generate(entities))
 
     # 뒤로가기 액션
     elif action_type == "back":
-        messages.extend(get_initial_ui())
+        add(get_initial_ui())
 
     # 검색 액션
     elif action_type.startswith("search-"):
         result_type = action_type.replace("search-", "")  # flights, hotels, cars
         generator = get_results_generator(result_type)
         if generator:
-            messages.append({"assistantMessage": "검색 결과를 찾았어요!"})
-            messages.extend(generator.generate(current_data))
+            # 결과 화면 레이아웃을 먼저 보내고 공급자 응답(fan-out) 대기
+            add(generator.layout())
+            response = await get_search_aggregator().search(SearchQuery.from_form(result_type, current_data))
+            if response.results:
+                add([{"assistantMessage": f"검색 결과 {len(response.results)}건을 찾았어요!"}])
+            else:
+                add([{"assistantMessage": "조건에 맞는 검색 결과가 없어요. 검색 조건을 바꿔보세요."}])
+            add([generator.data_message(current_data, response.results)])
         else:
-            messages.append({"assistantMessage": "검색 결과를 불러오는 중입니다..."})
+            add([{"assistantMessage": "검색 결과를 불러오는 중입니다..."}])
 
     return {"messages": messages}
+
+
+def action_handler_node(state: TravelState) -> TravelState:
+    """사용자 액션 처리 (그래프 밖 동기 호출용, 이벤트 루프가 없는 스레드에서 실행, 스트리밍 없음)"""
+    return asyncio.run(aaction_handler_node(state))
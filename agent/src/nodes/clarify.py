@@ -1,11 +1,13 @@
 """명확화 질문 핸들러 노드"""
 
 from langchain_core.messages import HumanMessage, AIMessage
+from langgraph.types import StreamWriter
 
 from ..graph.state import TravelState
+from .stream import emit_messages
 
 
-def clarify_handler_node(state: TravelState) -> TravelState:
+def clarify_handler_node(state: TravelState, writer: StreamWriter = None) -> TravelState:
     """모호한 요청에 대한 명확화 질문 응답 노드"""
 
     user_message = state.get("user_message", "")
@@ -15,8 +17,10 @@ def clarify_handler_node(state: TravelState) -> TravelState:
     clarify_question = entities.get("clarifyQuestion")
 
     if clarify_question:
+        messages = [{"assistantMessage": clarify_question}]
+        emit_messages(messages, writer)
         return {
-            "messages": [{"assistantMessage": clarify_question}],
+            "messages": messages,
             "chat_history": [
                 HumanMessage(content=user_message),
                 AIMessage(content=clarify_question),
@@ -56,8 +60,10 @@ def clarify_handler_node(state: TravelState) -> TravelState:
     else:
         message = "어떤 항목을 어떻게 변경할지 조금 더 구체적으로 말씀해주세요."
 
+    messages = [{"assistantMessage": message}]
+    emit_messages(messages, writer)
     return {
-        "messages": [{"assistantMessage": message}],
+        "messages": messages,
         "chat_history": [
             HumanMessage(content=user_message),
             AIMessage(content=message),
@@ -5,6 +5,7 @@ from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
 from ..graph.state import TravelState
 from .llm import get_llm, LLM_REASONING_EFFORT
+from .history import prepare_history, aprepare_history
 
 
 SYSTEM_PROMPT = """당신은 친절한 여행 예약 도우미입니다.
@@ -59,6 +60,66 @@ def _extract_text_content(response) -> str:
     return str(response)
 
 
+def _build_conversation_messages(user_message: str, chat_history: list) -> list:
+    """대화 응답용 LLM 메시지 구성"""
+    messages = [SystemMessage(content=SYSTEM_PROMPT)]
+    messages.extend(chat_history)
+    messages.append(HumanMessage(content=user_message))
+    return messages
+
+
+def _reasoning_kwargs() -> dict:
+    """reasoning effort 설정이 있으면 invoke 인자로 변환"""
+    invoke_kwargs = {}
+    if LLM_REASONING_EFFORT:
+        invoke_kwargs["reasoning"] = {
+            "effort": LLM_REASONING_EFFORT,
+            "summary": "auto"
+        }
+    return invoke_kwargs
+
+
+def _no_llm_response(user_message: str) -> TravelState:
+    """LLM 미설정 시 폴백 응답"""
+    fallback_msg = "죄송해요, 지금은 일반 대화가 어려워요. 항공권, 호텔, 렌터카 예약을 도와드릴 수 있어요!"
+    return {
+        "messages": [{"assistantMessage": fallback_msg}],
+        "chat_history": [
+            HumanMessage(content=user_message),
+            AIMessage(content=fallback_msg),
+        ],
+    }
+
+
+def _build_conversation_result(user_message: str, response, history_update: dict) -> TravelState:
+    """LLM 응답을 노드 결과로 변환 (히스토리 요약 갱신분 포함)"""
+    # 텍스트와 reasoning summary 추출
+    assistant_msg = _extract_text_content(response)
+    reasoning_summary = _extract_reasoning_summary(response)
+
+    # 응답 메시지 구성
+    response_msg = {"assistantMessage": assistant_msg}
+    if reasoning_summary:
+        response_msg["reasoning"] = reasoning_summary
+
+    result = {
+        "messages": [response_msg],
+        "chat_history": history_update.get("chat_history", []) + [
+            HumanMessage(content=user_message),
+            AIMessage(content=assistant_msg),
+        ],
+    }
+    if "history_summary" in history_update:
+        result["history_summary"] = history_update["history_summary"]
+    return result
+
+
+def _error_response() -> TravelState:
+    """LLM 호출 실패 시 폴백 응답"""
+    fallback_msg = "죄송해요, 잠시 문제가 생겼어요. 항공권, 호텔, 렌터카 예약을 도와드릴 수 있어요!"
+    return {"messages": [{"assistantMessage": fallback_msg}]}
+
+
 def conversation_node(state: TravelState) -> TravelState:
     """일반 대화 응답 노드"""
     user_message = state.get("user_message", "")
@@ -67,52 +128,40 @@ def conversation_node(state: TravelState) -> TravelState:
     llm = get_llm()
 
     if not llm:
-        fallback_msg = "죄송해요, 지금은 일반 대화가 어려워요. 항공권, 호텔, 렌터카 예약을 도와드릴 수 있어요!"
-        return {
-            "messages": [{"assistantMessage": fallback_msg}],
-            "chat_history": [
-                HumanMessage(content=user_message),
-                AIMessage(content=fallback_msg),
-            ],
-        }
+        return _no_llm_response(user_message)
 
     try:
-        # 메시지 구성
-        messages = [SystemMessage(content=SYSTEM_PROMPT)]
-        messages.extend(chat_history)
-        messages.append(HumanMessage(content=user_message))
-
-        # invoke 호출 (reasoning effort 설정)
-        invoke_kwargs = {}
-        if LLM_REASONING_EFFORT:
-            invoke_kwargs["reasoning"] = {
-                "effort": LLM_REASONING_EFFORT,
-                "summary": "auto"
-            }
-
-        response = llm.invoke(messages, **invoke_kwargs)
-
-        # 텍스트와 reasoning summary 추출
-        assistant_msg = _extract_text_content(response)
-        reasoning_summary = _extract_reasoning_summary(response)
-
-        # 응답 메시지 구성
-        response_msg = {"assistantMessage": assistant_msg}
-        if reasoning_summary:
-            response_msg["reasoning"] = reasoning_summary
+        # 토큰 예산 윈도우 + 누적 요약으로 컨텍스트 구성
+        context, history_update = prepare_history(chat_history, state.get("history_summary", ""))
+        messages = _build_conversation_messages(user_message, context)
+        response = llm.invoke(messages, **_reasoning_kwargs())
+        return _build_conversation_result(user_message, response, history_update)
 
-        return {
-            "messages": [response_msg],
-            "chat_history": [
-                HumanMessage(content=user_message),
-                AIMessage(content=assistant_msg),
-            ],
-        }
+    except Exception as e:
+        print(f"[Conversation Node] Error: {e}")
+        return _error_response()
+
+
+async def aconversation_node(state: TravelState) -> TravelState:
+    """일반 대화 응답 노드 (비동기)"""
+    user_message = state.get("user_message", "")
+    chat_history = state.get("chat_history", [])
+
+    llm = get_llm()
+
+    if not llm:
+        return _no_llm_response(user_message)
+
+    try:
+        # 토큰 예산 윈도우 + 누적 요약으로 컨텍스트 구성
+        context, history_update = await aprepare_history(chat_history, state.get("history_summary", ""))
+        messages = _build_conversation_messages(user_message, context)
+        response = await llm.ainvoke(messages, **_reasoning_kwargs())
+        return _build_conversation_result(user_message, response, history_update)
 
     except Exception as e:
         print(f"[Conversation Node] Error: {e}")
-        fallback_msg = "죄송해요, 잠시 문제가 생겼어요. 항공권, 호텔, 렌터카 예약을 도와드릴 수 있어요!"
-        return {"messages": [{"assistantMessage": fallback_msg}]}
+        return _error_response()
 
 
 async def conversation_stream(
@@ -138,17 +187,10 @@ async def conversation_stream(
 
     try:
         # 메시지 구성
-        messages = [SystemMessage(content=SYSTEM_PROMPT)]
-        messages.extend(chat_history)
-        messages.append(HumanMessage(content=user_message))
+        messages = _build_conversation_messages(user_message, chat_history)
 
         # 스트리밍 호출
-        invoke_kwargs = {}
-        if LLM_REASONING_EFFORT:
-            invoke_kwargs["reasoning"] = {
-                "effort": LLM_REASONING_EFFORT,
-                "summary": "auto"
-            }
+        invoke_kwargs = _reasoning_kwargs()
 
         collected_text = []
         collected_reasoning = []
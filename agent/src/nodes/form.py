@@ -1,9 +1,11 @@
 """폼 생성 노드"""
 
 from langchain_core.messages import HumanMessage, AIMessage
+from langgraph.types import StreamWriter
 
 from ..graph.state import TravelState
 from ..forms import get_form_generator
+from .stream import emit_messages
 
 
 # 도시명 → 코드 매핑 (ChoicePicker value 변환용)
@@ -68,7 +70,15 @@ def _merge_entities_with_current_data(current_data: dict, entities: dict, intent
     return merged
 
 
-def form_generator_node(state: TravelState) -> TravelState:
+def form_scaffold_messages(intent_type: str, current_data: dict) -> list[dict]:
+    """엔티티 도착 전에 미리 보낼 폼 골격 메시지 (기존 폼 갱신이면 빈 리스트)"""
+    if current_data and current_data.get(intent_type):
+        return []
+    generator = get_form_generator(intent_type)
+    return generator.scaffold() if generator else []
+
+
+def form_generator_node(state: TravelState, writer: StreamWriter = None) -> TravelState:
     """예약 폼 생성 노드"""
     intent_type = state.get("intent_type", "unknown")
     user_message = state.get("user_message", "")
@@ -108,11 +118,20 @@ def form_generator_node(state: TravelState) -> TravelState:
 
     if assistant_msg:
         messages.append({"assistantMessage": assistant_msg})
+        # 스트리밍 실행이면 안내 문구를 폼보다 먼저 전달
+        emit_messages(messages, writer)
 
-    # 폼 생성 (병합된 entities를 전달하여 초기값 설정)
+    form_messages = []
     generator = get_form_generator(intent_type)
-    if generator:
-        messages.extend(generator.generate(merged_entities))
+    if generator and is_update and current_surface_id == generator.surface_id:
+        # 클라이언트에 이미 활성화된 폼: 바뀐 값만 replace로 전송
+        form_messages = generator.update(converted_entities, current_data)
+    elif generator:
+        # 폼 생성 (병합된 entities를 전달하여 초기값 설정)
+        form_messages = generator.generate(merged_entities)
+    # createSurface → updateComponents → updateDataModel 순서로 각각 전달
+    emit_messages(form_messages, writer)
+    messages.extend(form_messages)
 
     # 히스토리 업데이트 (add_messages reducer가 자동으로 추가)
     new_messages = []
@@ -0,0 +1,181 @@
+"""대화 히스토리 관리 - 토큰 예산 기반 최근 윈도우 + 누적 요약
+
+chat_history 전체를 매 턴 LLM에 보내지 않고,
+- 최근 메시지는 토큰 예산(HISTORY_TOKEN_BUDGET) 안에서 그대로 유지하고
+- 예산을 벗어난 오래된 메시지는 요약(history_summary)에 점진적으로 합친 뒤 state에서 제거한다.
+요약은 state에 저장되므로 다음 턴에는 새로 밀려난 메시지만 요약하면 된다.
+스트리밍 대화에서는 요약 LLM 호출을 응답 뒤 백그라운드로 미뤄 첫 토큰이 늦어지지 않게 한다 (plan_history + afold_history).
+"""
+
+import os
+from langchain_core.messages import BaseMessage, HumanMessage, RemoveMessage, SystemMessage
+
+from .llm import get_llm
+
+
+# 최근 윈도우 토큰 예산 (대략적인 추정치 기준)
+HISTORY_TOKEN_BUDGET = int(os.getenv("HISTORY_TOKEN_BUDGET", "1500"))
+# 예산과 무관하게 항상 유지하는 최근 메시지 수 (직전 질문/답변 맥락 보존)
+HISTORY_MIN_MESSAGES = 2
+# 예산을 넘으면 이 비율까지 접음 (매 턴 다시 접지 않도록 여유를 둠)
+HISTORY_FOLD_TARGET = float(os.getenv("HISTORY_FOLD_TARGET", "0.6"))
+
+SUMMARY_PROMPT = """당신은 여행 예약 상담 대화를 요약하는 도우미입니다.
+기존 요약과 새로 추가된 대화를 합쳐 하나의 요약으로 갱신하세요.
+
+규칙:
+- 목적지, 날짜, 인원, 예약 종류 등 이후 대화에 필요한 사실 위주로 정리하세요
+- 5문장 이내로 간결하게 작성하세요
+- 한국어로 작성하세요
+- 요약문만 출력하세요"""
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (한글 등 비ASCII는 글자당 1토큰, ASCII는 4글자당 1토큰)"""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (len(text) - ascii_chars) + ascii_chars // 4 + 4
+
+
+def _message_text(msg: BaseMessage) -> str:
+    content = msg.content
+    if isinstance(content, list):
+        return "".join(
+            item.get("text", "") if isinstance(item, dict) else str(item) for item in content
+        )
+    return content
+
+
+def split_history(chat_history: list, budget: int = HISTORY_TOKEN_BUDGET) -> tuple[list, list]:
+    """히스토리를 (요약 대상, 최근 윈도우)로 분리"""
+    used = 0
+    start = len(chat_history)
+    for i in range(len(chat_history) - 1, -1, -1):
+        tokens = estimate_tokens(_message_text(chat_history[i]))
+        kept = len(chat_history) - i - 1
+        if used + tokens > budget and kept >= HISTORY_MIN_MESSAGES:
+            break
+        used += tokens
+        start = i
+    return chat_history[:start], chat_history[start:]
+
+
+def format_history_lines(messages: list) -> list[str]:
+    """메시지를 "역할: 내용" 형식의 줄로 변환"""
+    lines = []
+    for msg in messages:
+        role = "사용자" if msg.type == "human" else "어시스턴트"
+        lines.append(f"{role}: {_message_text(msg)}")
+    return lines
+
+
+def build_context_messages(recent: list, summary: str) -> list:
+    """요약(있으면) + 최근 윈도우로 LLM 컨텍스트 메시지 구성"""
+    messages = []
+    if summary:
+        messages.append(SystemMessage(content=f"이전 대화 요약:\n{summary}"))
+    messages.extend(recent)
+    return messages
+
+
+def _summary_request(summary: str, older: list) -> list:
+    body = ""
+    if summary:
+        body += f"## 기존 요약\n{summary}\n\n"
+    body += "## 새로 추가된 대화\n" + "\n".join(format_history_lines(older))
+    return [SystemMessage(content=SUMMARY_PROMPT), HumanMessage(content=body)]
+
+
+def _fallback_summary(summary: str, older: list) -> str:
+    """LLM 없이 요약: 기존 요약 + 새 메시지를 이어붙이고 예산의 절반으로 자름"""
+    text = "\n".join(filter(None, [summary, *format_history_lines(older)]))
+    limit = HISTORY_TOKEN_BUDGET // 2
+    return text[-limit:] if estimate_tokens(text) > limit else text
+
+
+def _history_update(older: list, summary: str) -> dict:
+    """요약에 합쳐진 메시지 제거 + 갱신된 요약을 state 업데이트로 변환"""
+    return {
+        "chat_history": [RemoveMessage(id=msg.id) for msg in older if msg.id],
+        "history_summary": summary,
+    }
+
+
+def _split_for_fold(chat_history: list) -> tuple[list, list]:
+    """(요약에 합칠 메시지, 최근 윈도우) - 예산 이내면 합칠 메시지 없음
+
+    예산을 넘으면 예산의 HISTORY_FOLD_TARGET 비율까지 한 번에 접어 다음 몇 턴은 다시 접지 않도록 한다 (hysteresis).
+    """
+    older, recent = split_history(chat_history)
+    if not older:
+        return [], recent
+    return split_history(chat_history, int(HISTORY_TOKEN_BUDGET * HISTORY_FOLD_TARGET))
+
+
+def plan_history(chat_history: list, summary: str = "") -> tuple[list, list]:
+    """LLM 호출 없이 이번 턴 컨텍스트와 요약에 합칠 메시지 결정
+
+    요약이 갱신되기 전인 이번 턴에는 접을 메시지를 이어붙인 임시 요약으로 대신한다.
+
+    Returns:
+        (LLM에 보낼 컨텍스트 메시지, 요약에 합칠 메시지 - 예산 이내면 빈 리스트)
+    """
+    older, recent = _split_for_fold(chat_history)
+    return build_context_messages(recent, _fallback_summary(summary, older) if older else summary), older
+
+
+def _summary_llm():
+    llm = get_llm()
+    if not llm:
+        raise RuntimeError("LLM not configured")
+    return llm
+
+
+def _folded(older: list, summary: str, response=None, error: Exception | None = None) -> dict:
+    """요약 LLM 응답(실패 시 이어붙이기 요약)으로 state 업데이트 생성"""
+    if error is not None:
+        print(f"[History] Summary fallback: {error}")
+        summary = _fallback_summary(summary, older)
+    else:
+        summary = _message_text(response).strip()
+    print(f"[History] Folded {len(older)} messages into summary ({estimate_tokens(summary)} tokens)")
+    return _history_update(older, summary)
+
+
+def fold_history(older: list, summary: str = "") -> dict:
+    """older를 요약에 합친 state 업데이트"""
+    try:
+        response = _summary_llm().invoke(_summary_request(summary, older))
+    except Exception as e:
+        return _folded(older, summary, error=e)
+    return _folded(older, summary, response)
+
+
+async def afold_history(older: list, summary: str = "") -> dict:
+    """fold_history의 비동기 버전"""
+    try:
+        response = await _summary_llm().ainvoke(_summary_request(summary, older))
+    except Exception as e:
+        return _folded(older, summary, error=e)
+    return _folded(older, summary, response)
+
+
+def prepare_history(chat_history: list, summary: str = "") -> tuple[list, dict]:
+    """컨텍스트 메시지와 state 업데이트 반환 (예산 초과분은 요약에 바로 합침, 그래프 노드 경로용)
+
+    Returns:
+        (LLM에 보낼 컨텍스트 메시지, state 업데이트 dict - 변경 없으면 빈 dict)
+    """
+    older, recent = _split_for_fold(chat_history)
+    if not older:
+        return build_context_messages(recent, summary), {}
+    update = fold_history(older, summary)
+    return build_context_messages(recent, update["history_summary"]), update
+
+
+async def aprepare_history(chat_history: list, summary: str = "") -> tuple[list, dict]:
+    """prepare_history의 비동기 버전"""
+    older, recent = _split_for_fold(chat_history)
+    if not older:
+        return build_context_messages(recent, summary), {}
+    update = await afold_history(older, summary)
+    return build_context_messages(recent, update["history_summary"]), update
@@ -0,0 +1,110 @@
+"""의도 분석 결과 캐시 (LRU + 자정 만료 TTL)
+
+같은 발화("호텔 예약", "항공권 검색해줘")가 반복될 때 INTENT_PROMPT LLM 호출을 생략한다.
+상대 날짜("내일")가 오늘 날짜에 따라 달라지므로 키에 날짜를 포함하고, 항목은 자정에 만료된다.
+"""
+
+import os
+import re
+import copy
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+
+from .. import metrics
+
+
+INTENT_CACHE_SIZE = int(os.getenv("INTENT_CACHE_SIZE", "2048"))
+INTENT_CACHE_TTL = float(os.getenv("INTENT_CACHE_TTL", "3600"))
+
+
+def normalize_message(text: str) -> str:
+    """캐시 키용 메시지 정규화 (소문자, 공백 축약, 끝 문장부호 제거)"""
+    text = re.sub(r"\s+", " ", text.strip().lower())
+    return text.rstrip(" .!~?")
+
+
+def _digest(value) -> str:
+    if not value:
+        return ""
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def _seconds_until_midnight() -> float:
+    now = datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return (midnight - now).total_seconds()
+
+
+class IntentCache:
+    """크기 제한 LRU 캐시, 항목은 TTL과 자정 중 빠른 시점에 만료"""
+
+    def __init__(self, max_size: int = INTENT_CACHE_SIZE, ttl: float = INTENT_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple, tuple[dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        user_message: str,
+        surface_id: str,
+        current_data: dict,
+        history_context: str = "",
+        today: date | None = None,
+    ) -> tuple:
+        """캐시 키 생성
+
+        프롬프트에 포함되는 대화 맥락(history_context)이 다르면 결과도 달라질 수 있으므로
+        해당 텍스트의 해시도 키에 포함한다 (대화 첫 턴은 모두 같은 빈 맥락을 공유).
+        """
+        return (
+            normalize_message(user_message),
+            surface_id or "",
+            _digest(current_data),
+            _digest(history_context),
+            (today or date.today()).isoformat(),
+        )
+
+    def get(self, key: tuple) -> dict | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[1] > now:
+                self._entries.move_to_end(key)
+                metrics.inc("intent_cache_hit")
+                return copy.deepcopy(entry[0])
+            if entry:
+                del self._entries[key]
+        metrics.inc("intent_cache_miss")
+        return None
+
+    def put(self, key: tuple, value: dict) -> None:
+        expires_at = time.monotonic() + min(self.ttl, _seconds_until_midnight())
+        with self._lock:
+            self._entries[key] = (copy.deepcopy(value), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            metrics.set_gauge("intent_cache_size", len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            metrics.set_gauge("intent_cache_size", 0)
+
+
+# 싱글톤 캐시
+_intent_cache: IntentCache | None = None
+
+
+def get_intent_cache() -> IntentCache:
+    """싱글톤 의도 캐시 반환"""
+    global _intent_cache
+    if _intent_cache is None:
+        _intent_cache = IntentCache()
+    return _intent_cache
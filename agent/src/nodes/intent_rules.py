@@ -0,0 +1,387 @@
+"""규칙 기반 의도 분석 (LLM 앞단 fast path)
+
+키워드, 필드명 사전, 공항/도시 코드 맵, 한국어 날짜 표현으로
+명확한 메시지("김포에서 제주 항공권", "성인 3명으로 바꿔줘")는 LLM 없이 처리한다.
+결과에는 confidence가 포함되며, 임계값(INTENT_FASTPATH_THRESHOLD) 미만이면 LLM으로 넘긴다.
+타입 키워드만 있고 예약 동사/장소/날짜가 없거나, 취소/문의 표현이 있으면 임계값 미만으로 둔다.
+"""
+
+import os
+import re
+from datetime import date, timedelta
+
+from .. import metrics
+from .form import AIRPORT_CODE_MAP, CITY_CODE_MAP
+from .modify import LOCATION_CODE_MAP
+
+
+# 이 값 이상이면 LLM 호출 없이 규칙 결과 사용
+INTENT_FASTPATH_THRESHOLD = float(os.getenv("INTENT_FASTPATH_THRESHOLD", "0.85"))
+# fast path 적중 중 LLM과 비교할 샘플 비율 (임계값 이상 구간의 일치율 측정용, 0 = 비활성)
+INTENT_FASTPATH_SHADOW_RATE = float(os.getenv("INTENT_FASTPATH_SHADOW_RATE", "0"))
+
+# 여행 타입 키워드 (순서대로 우선 적용, 영문은 단어 단위로만 일치)
+TYPE_KEYWORDS = {
+    "flight": ["항공", "비행기", "flight", "fly"],
+    "hotel": ["호텔", "숙소", "게스트하우스", "에어비앤비", "hotel", "stay"],
+    "car": ["렌터카", "렌트카", "차량", "car", "rent", "rental"],
+    "package": ["패키지", "package", "tour"],
+}
+MODIFY_KEYWORDS = ["변경", "바꿔", "수정", "change", "modify"]
+# 예약 요청임을 나타내는 동사 (타입 키워드만으로는 예약 요청인지 알 수 없음)
+BOOKING_VERBS = ["예약", "예매", "끊어", "잡아", "구해", "찾아", "검색", "알아봐", "book", "reserve"]
+
+# 일반 질문/대화로 볼 수 있는 표현 (예약 요청이 아닐 가능성)
+QUESTION_MARKERS = [
+    "?", "얼마", "어때", "추천", "알려", "뭐", "어디", "언제", "왜", "어떻게",
+    # 기존 예약 취소/환불, 이용 안내 문의
+    "취소", "환불", "몇시", "몇 시", "문의", "규정", "확인", "cancel", "refund",
+]
+# 이전 대화 맥락을 참조하는 표현 ("호텔도 예약해줘", "거기로")
+CONTEXT_MARKERS = ["도 ", "도예약", "거기", "그곳", "같은", "그날", "그때"]
+
+# 필드명 사전 (사용자 표현 → 엔티티 키)
+FIELD_LEXICON = {
+    "departure": ["출발지", "출발 공항", "떠나는 곳"],
+    "arrival": ["도착지", "목적지", "가는 곳", "도시"],
+    "departureDate": ["출발일", "출발 날짜", "가는 날", "떠나는 날", "체크인", "픽업일", "픽업 날짜"],
+    "returnDate": ["귀국일", "돌아오는 날", "복귀일", "체크아웃", "반납일", "반납 날짜"],
+    "adults": ["성인", "어른"],
+    "children": ["아동", "어린이", "아이"],
+    "infants": ["유아", "영아", "아기", "애기"],
+    "class": ["좌석등급", "좌석 등급", "좌석", "클래스"],
+    "rooms": ["객실", "방"],
+    "breakfast": ["조식", "아침"],
+    "carType": ["차종"],
+    "pickupLocation": ["픽업 장소", "픽업장소", "픽업"],
+}
+
+# 값 사전
+CLASS_VALUES = {"비즈니스": "business", "비지니스": "business", "이코노미": "economy", "일반석": "economy",
+                "퍼스트": "first", "일등석": "first"}
+TRIP_TYPE_VALUES = {"왕복": "roundtrip", "편도": "oneway"}
+CAR_TYPE_VALUES = {"경형": "compact", "소형": "compact", "경차": "compact", "중형": "mid", "대형": "full",
+                   "suv": "suv", "승합": "van", "고급": "luxury"}
+KOREAN_NUMBERS = {"한": 1, "하나": 1, "두": 2, "둘": 2, "세": 3, "셋": 3, "네": 4, "넷": 4,
+                  "다섯": 5, "여섯": 6, "일곱": 7, "여덟": 8, "아홉": 9, "열": 10}
+WEEKDAYS = "월화수목금토일"
+
+# 타입별 장소 사전 (이름 → 엔티티 값, 변환은 form/modify 노드에서 수행)
+PLACE_NAMES = {
+    "flight": list(AIRPORT_CODE_MAP),
+    "hotel": list(CITY_CODE_MAP),
+    "car": list(LOCATION_CODE_MAP),
+}
+ALL_PLACE_NAMES = set(AIRPORT_CODE_MAP) | set(CITY_CODE_MAP) | set(LOCATION_CODE_MAP)
+
+_NUMBER = r"(\d+|" + "|".join(sorted(KOREAN_NUMBERS, key=len, reverse=True)) + r")"
+_DATE_PATTERN = re.compile(
+    r"(?P<iso>\d{4}-\d{2}-\d{2})"
+    r"|(?:(?P<month>\d{1,2})월\s*)?(?P<day>\d{1,2})일(?!\s*(?:후|뒤|간|동안))"
+    r"|(?P<rel>오늘|내일|모레|글피)"
+    r"|(?P<after>\d+)일\s*(?:후|뒤)"
+    r"|(?P<week>이번\s*주|다음\s*주|다다음\s*주)\s*(?P<wday>[월화수목금토일])요일"
+)
+_NIGHTS_PATTERN = re.compile(r"(\d+)\s*박")
+
+
+def _keyword_pattern(keywords: list[str]) -> re.Pattern:
+    """키워드 목록 → 정규식 (영문은 앞뒤가 영문자가 아닐 때만 일치: "car"는 "carpet"에 일치하지 않음)"""
+    parts = [
+        rf"(?<![a-z]){re.escape(kw)}(?![a-z])" if kw.isascii() else re.escape(kw)
+        for kw in keywords
+    ]
+    return re.compile("|".join(parts))
+
+
+_TYPE_PATTERNS = {intent_type: _keyword_pattern(kws) for intent_type, kws in TYPE_KEYWORDS.items()}
+_BOOKING_VERB_PATTERN = _keyword_pattern(BOOKING_VERBS)
+_QUESTION_PATTERN = _keyword_pattern(QUESTION_MARKERS)
+
+
+def _mentioned_types(text_lower: str) -> list[str]:
+    return [t for t, pattern in _TYPE_PATTERNS.items() if pattern.search(text_lower)]
+
+
+def classify_keywords(text: str, current_surface_id: str = "") -> str:
+    """키워드 기반 타입 분류"""
+    text_lower = text.lower()
+
+    # 활성 Surface가 있고 변경 관련 키워드가 있으면 modify
+    if current_surface_id and any(kw in text_lower for kw in MODIFY_KEYWORDS):
+        return "modify"
+    types = _mentioned_types(text_lower)
+    return types[0] if types else "unknown"
+
+
+def _to_number(token: str) -> int:
+    return int(token) if token.isdigit() else KOREAN_NUMBERS[token]
+
+
+def _extract_dates(text: str, today: date) -> list[tuple[int, str]]:
+    """(위치, YYYY-MM-DD) 목록 추출"""
+    dates = []
+    last_month = None
+    for m in _DATE_PATTERN.finditer(text):
+        value = None
+        if m.group("iso"):
+            try:
+                value = date.fromisoformat(m.group("iso"))
+            except ValueError:
+                continue  # "2026-13-45" 같은 없는 날짜는 무시
+        elif m.group("day"):
+            month = int(m.group("month")) if m.group("month") else last_month
+            if month is None:
+                continue  # "10일" 단독은 월이 불분명
+            last_month = month
+            try:
+                value = date(today.year, month, int(m.group("day")))
+            except ValueError:
+                continue
+            if value < today:
+                value = value.replace(year=today.year + 1)
+        elif m.group("rel"):
+            value = today + timedelta(days=["오늘", "내일", "모레", "글피"].index(m.group("rel")))
+        elif m.group("after"):
+            value = today + timedelta(days=int(m.group("after")))
+        elif m.group("week"):
+            weeks = {"이번": 0, "다음": 1, "다다음": 2}[m.group("week").replace(" ", "")[:-1]]
+            monday = today - timedelta(days=today.weekday())
+            value = monday + timedelta(weeks=weeks, days=WEEKDAYS.index(m.group("wday")))
+        if value:
+            dates.append((m.start(), value.isoformat()))
+    return dates
+
+
+def _extract_places(text: str, names: list[str]) -> list[tuple[int, str, str]]:
+    """(위치, 장소명, 뒤따르는 조사) 목록 추출 (긴 이름 우선)"""
+    if not names:
+        return []
+    pattern = re.compile("|".join(re.escape(n) for n in sorted(names, key=len, reverse=True)))
+    places = []
+    for m in pattern.finditer(text):
+        rest = text[m.end():m.end() + 3]
+        places.append((m.start(), m.group(), rest))
+    return places
+
+
+def _find_field_mentions(text: str) -> list[tuple[int, str]]:
+    """(위치, 필드) 목록 - 긴 표현 우선, 겹치는 표현은 제외"""
+    phrases = sorted(
+        ((phrase, field) for field, ps in FIELD_LEXICON.items() for phrase in ps),
+        key=lambda item: len(item[0]),
+        reverse=True,
+    )
+    taken: list[tuple[int, int]] = []
+    mentions = []
+    for phrase, field in phrases:
+        for m in re.finditer(re.escape(phrase), text):
+            if any(s < m.end() and m.start() < e for s, e in taken):
+                continue
+            taken.append((m.start(), m.end()))
+            mentions.append((m.start(), field))
+    return sorted(mentions)
+
+
+def _extract_counts(text: str) -> dict:
+    """"성인 2명", "아이 한 명", "객실 2개" 형태의 인원/객실 수"""
+    counts = {}
+    for field in ("adults", "children", "infants", "rooms"):
+        words = "|".join(re.escape(w) for w in FIELD_LEXICON[field])
+        m = re.search(rf"(?:{words})\s*(?:을|를|은|는|이|가)?\s*{_NUMBER}\s*(?:명|개|실)?", text)
+        if m:
+            counts[field] = _to_number(m.group(1))
+    return counts
+
+
+def _extract_values(text: str) -> dict:
+    """필드명 없이도 값만으로 필드가 확정되는 엔티티"""
+    text_lower = text.lower()
+    entities = {}
+    for word, value in CLASS_VALUES.items():
+        if word in text:
+            entities["class"] = value
+    for word, value in TRIP_TYPE_VALUES.items():
+        if word in text:
+            entities["tripType"] = value
+    for word, value in CAR_TYPE_VALUES.items():
+        if word in text_lower:
+            entities["carType"] = value
+    if "조식" in text:
+        entities["breakfast"] = not any(neg in text for neg in ("불포함", "제외", "빼", "없이"))
+    return entities
+
+
+def _booking_entities(text: str, intent_type: str, today: date) -> tuple[dict, bool]:
+    """예약 요청에서 엔티티 추출, (엔티티, 인식 못한 장소가 있는지) 반환"""
+    entities = _extract_values(text)
+    entities.update(_extract_counts(text))
+
+    # 날짜: 첫 번째 → 출발/체크인/픽업, 두 번째 → 귀국/체크아웃/반납
+    dates = [value for _, value in _extract_dates(text, today)]
+    if dates:
+        entities["departureDate"] = dates[0]
+    if len(dates) > 1:
+        entities["returnDate"] = dates[1]
+    nights = _NIGHTS_PATTERN.search(text)
+    if nights and "departureDate" in entities and "returnDate" not in entities:
+        checkout = date.fromisoformat(entities["departureDate"]) + timedelta(days=int(nights.group(1)))
+        entities["returnDate"] = checkout.isoformat()
+
+    # 장소: 조사("에서" → 출발, "로/행/까지" → 도착)로 역할 결정
+    names = PLACE_NAMES.get(intent_type, [])
+    places = _extract_places(text, names)
+    for _, name, rest in places:
+        if intent_type == "hotel":
+            entities.setdefault("arrival", name)
+        elif intent_type == "car":
+            entities.setdefault("pickupLocation", name)
+        elif rest.startswith("에서"):
+            entities.setdefault("departure", name)
+        elif rest.startswith(("으로", "로", "행", "까지", "가는")):
+            entities.setdefault("arrival", name)
+        elif "departure" not in entities:
+            entities["departure"] = name
+        else:
+            entities.setdefault("arrival", name)
+
+    # 편도가 아니면 항공권 기본은 왕복
+    if intent_type == "flight" and "returnDate" in entities:
+        entities.setdefault("tripType", "roundtrip")
+
+    recognized = {name for _, name, _ in places}
+    unknown_places = any(name in text and name not in recognized for name in ALL_PLACE_NAMES - set(names))
+    return entities, unknown_places
+
+
+def _modify_entities(text: str, today: date) -> tuple[dict, bool]:
+    """필드 변경 요청에서 엔티티 추출, (엔티티, 필드 없이 값만 있는지) 반환"""
+    entities = {}
+    mentions = _find_field_mentions(text)
+    dates = _extract_dates(text, today)
+    places = _extract_places(text, list(ALL_PLACE_NAMES))
+    counts = _extract_counts(text)
+
+    for pos, field in mentions:
+        if field in ("departureDate", "returnDate"):
+            value = next((v for p, v in dates if p > pos), None)
+        elif field in ("departure", "arrival", "pickupLocation"):
+            value = next((name for p, name, _ in places if p > pos), None)
+        elif field in counts:
+            value = counts[field]
+        else:
+            value = _extract_values(text).get(field)
+        if value is not None:
+            entities.setdefault(field, value)
+
+    # 값만으로 필드가 확정되는 경우 (좌석 등급, 왕복/편도, 차종, 조식)
+    for field, value in _extract_values(text).items():
+        entities.setdefault(field, value)
+
+    # 필드 없이 값만 있는 경우 ("내일로 바꿔줘", "3명으로") → 모호함
+    used_dates = {entities.get("departureDate"), entities.get("returnDate")}
+    used_places = {entities.get(f) for f in ("departure", "arrival", "pickupLocation")}
+    dangling = (
+        any(v not in used_dates for _, v in dates)
+        or any(name not in used_places for _, name, _ in places)
+        or (bool(re.search(rf"{_NUMBER}\s*명", text)) and not counts)
+    )
+    return entities, dangling
+
+
+def fast_intent_analysis(
+    text: str,
+    current_surface_id: str = "",
+    chat_history: list | None = None,
+    today: date | None = None,
+) -> dict:
+    """규칙 기반 의도 분석
+
+    Returns:
+        {"intent_type": ..., "entities": {...}, "confidence": 0.0~1.0}
+    """
+    today = today or date.today()
+    chat_history = chat_history or []
+    text = text.strip()
+    text_lower = text.lower()
+
+    # 직전 어시스턴트 메시지가 명확화 질문이면 답변 해석에 대화 맥락이 필요하므로 LLM에 맡김
+    last_ai = next((m for m in reversed(chat_history) if m.type == "ai"), None)
+    if last_ai and isinstance(last_ai.content, str) and last_ai.content.rstrip().endswith("?"):
+        return {"intent_type": classify_keywords(text, current_surface_id), "entities": {}, "confidence": 0.0}
+
+    types = _mentioned_types(text_lower)
+    is_modify = bool(current_surface_id) and any(kw in text_lower for kw in MODIFY_KEYWORDS)
+    is_question = bool(_QUESTION_PATTERN.search(text_lower))
+    refers_context = bool(chat_history) and any(marker in text + " " for marker in CONTEXT_MARKERS)
+
+    # 1. 활성 폼 수정 요청
+    if is_modify and not types:
+        entities, dangling = _modify_entities(text, today)
+        if entities and not dangling:
+            return {"intent_type": "modify", "entities": entities, "confidence": 0.9}
+        if dangling and not entities:
+            # 명확화 질문 문구는 LLM이 생성
+            return {"intent_type": "clarify", "entities": {}, "confidence": 0.4}
+        return {"intent_type": "modify", "entities": entities, "confidence": 0.5}
+
+    # 2. 예약 요청 (타입 키워드)
+    if types:
+        intent_type = types[0]
+        entities, unknown_places = _booking_entities(text, intent_type, today)
+        # 예약 동사/장소/날짜가 함께 있어야 예약 요청으로 확신 ("내 차 얘기" 같은 대화는 LLM이 판단)
+        has_booking_signal = bool(_BOOKING_VERB_PATTERN.search(text_lower)) or any(
+            key in entities for key in ("departure", "arrival", "pickupLocation", "departureDate")
+        )
+        confidence = 0.9 if has_booking_signal else 0.6
+        if len(types) > 1:
+            confidence -= 0.5  # 여러 타입 언급 (패키지/복합 요청)
+        if is_question:
+            confidence -= 0.3  # 정보 질문일 가능성
+        if refers_context or unknown_places:
+            confidence -= 0.3  # 맥락/코드 변환이 필요한 장소
+        if current_surface_id and not current_surface_id.startswith(intent_type):
+            confidence -= 0.3  # 폼 전환 (이전 폼 정보 공유는 LLM이 판단)
+        if is_modify:
+            confidence -= 0.3
+        return {"intent_type": intent_type, "entities": entities, "confidence": round(max(confidence, 0.0), 2)}
+
+    # 3. 활성 폼에서 변경 키워드 없이 필드 값만 말한 경우 ("성인 3명")
+    if current_surface_id:
+        entities, dangling = _modify_entities(text, today)
+        if entities:
+            return {"intent_type": "modify", "entities": entities, "confidence": 0.3 if dangling else 0.7}
+
+    # 4. 일반 대화 (LLM이 판단)
+    return {"intent_type": "unknown", "entities": {}, "confidence": 0.2}
+
+
+def _confidence_bucket(confidence: float) -> str:
+    return f"c{int(confidence * 10) * 10}"
+
+
+def record_fastpath_hit() -> None:
+    """규칙 결과를 그대로 사용한 경우"""
+    metrics.inc("intent_fastpath_hit")
+
+
+def record_fastpath_agreement(fast_result: dict, llm_result: dict, shadow: bool = False) -> None:
+    """규칙 결과와 LLM 결과 일치 여부 기록 (confidence 구간별)
+
+    LLM으로 넘어간 요청(fallthrough)과 shadow 샘플 모두 기록하며,
+    구간별 일치율로 INTENT_FASTPATH_THRESHOLD를 조정한다.
+    """
+    if not shadow:
+        metrics.inc("intent_fastpath_fallthrough")
+    bucket = _confidence_bucket(fast_result.get("confidence", 0.0))
+
+    type_match = fast_result.get("intent_type") == llm_result.get("intent_type")
+    metrics.inc(f"intent_fastpath_type_{'agree' if type_match else 'disagree'}_{bucket}")
+
+    # 엔티티: 규칙이 추출한 키가 LLM 결과와 모두 같은지
+    fast_entities = fast_result.get("entities", {})
+    llm_entities = llm_result.get("entities", {})
+    entity_match = type_match and all(
+        str(llm_entities.get(k)) == str(v) for k, v in fast_entities.items()
+    )
+    metrics.inc(f"intent_fastpath_entities_{'agree' if entity_match else 'disagree'}_{bucket}")
@@ -0,0 +1,78 @@
+"""의도 분석 응답 증분 파서
+
+LLM 응답({"type": ..., "entities": {...}})을 토큰 단위로 받으면서
+최상위 문자열 필드를 값이 닫히는 즉시 추출한다.
+"type"은 응답 형식상 가장 먼저 나오므로 엔티티가 도착하기 전에 플로우를 결정할 수 있다.
+"""
+
+import json
+
+
+class IntentStreamParser:
+    """최상위 JSON 문자열 필드 증분 추출기
+
+    전체 응답을 다시 파싱하지 않고 새로 들어온 청크만 스캔한다.
+    중첩 객체/배열 안의 값은 무시하며 최종 결과는 완성된 응답을 json.loads로 파싱한다.
+    """
+
+    def __init__(self):
+        self.fields: dict[str, str] = {}
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._token: list[str] = []
+        self._expect_key = False
+        self._key: str | None = None
+
+    @property
+    def intent_type(self) -> str | None:
+        return self.fields.get("type")
+
+    def feed(self, text: str) -> str | None:
+        """청크 입력, 이번 청크에서 "type"이 확정되면 그 값을 반환"""
+        known = self.intent_type
+        for ch in text:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._end_string()
+                    continue
+                if self._depth == 1:
+                    self._token.append(ch)
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._token = []
+            elif ch in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    self._expect_key = ch == "{"
+            elif ch in "}]":
+                self._depth -= 1
+            elif self._depth == 1:
+                if ch == ",":
+                    self._expect_key = True
+                elif ch == ":":
+                    self._expect_key = False
+
+        if known is None and self.intent_type is not None:
+            return self.intent_type
+        return None
+
+    def _end_string(self) -> None:
+        if self._depth != 1:
+            return
+        try:
+            value = json.loads('"' + "".join(self._token) + '"')
+        except json.JSONDecodeError:
+            value = "".join(self._token)
+        if self._expect_key:
+            self._key = value
+        elif self._key is not None:
+            self.fields[self._key] = value
+            self._key = None
@@ -49,6 +49,7 @@ def get_llm() -> ChatOpenAI | None:
                 api_key=api_key,
                 max_tokens=LLM_MAX_TOKENS,
                 streaming=True,  # 스트리밍 활성화
+                stream_usage=True,  # 스트리밍 응답에도 토큰 사용량(캐시 적중 포함) 포함
                 use_responses_api=use_responses,
                 output_version="responses/v1" if use_responses else None,
             )
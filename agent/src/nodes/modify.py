@@ -1,6 +1,10 @@
 """폼 데이터 수정 핸들러 노드"""
 
+from langgraph.types import StreamWriter
+
 from ..graph.state import TravelState
+from ..forms import make_patch, set_values
+from .stream import emit_messages
 
 
 # 도시명 → 코드 매핑 (ChoicePicker value 변환용)
@@ -76,7 +80,7 @@ FIELD_PATH_MAP = {
 }
 
 
-def modify_handler_node(state: TravelState) -> TravelState:
+def modify_handler_node(state: TravelState, writer: StreamWriter = None) -> TravelState:
     """채팅으로 요청된 폼 데이터 수정을 처리하는 노드"""
 
     entities = state.get("entities", {})
@@ -125,8 +129,8 @@ def modify_handler_node(state: TravelState) -> TravelState:
             }]
         }
 
-    # 여러 필드 업데이트를 위한 operations 생성
-    operations = []
+    # 필드별 목표 값 (경로 → 값)
+    new_values = {}
     updated_fields = []
 
     for field, value in fields_to_update.items():
@@ -166,13 +170,15 @@ def modify_handler_node(state: TravelState) -> TravelState:
                 default_time = "10:00" if field == "pickupDateTime" else "18:00"
                 value = f"{value}T{default_time}"
 
-        operations.append({
-            "op": "replace",
-            "path": data_path,
-            "value": value,
-        })
+        new_values[data_path] = value
         updated_fields.append(field)
 
+    # 현재 폼 데이터 대비 실제로 바뀐 부분만 JSON Patch로 생성
+    if current_data:
+        operations = make_patch(current_data, set_values(current_data, new_values))
+    else:
+        operations = [{"op": "replace", "path": path, "value": value} for path, value in new_values.items()]
+
     # updateDataModel 메시지 생성
     update_message = {
         "updateDataModel": {
@@ -275,6 +281,10 @@ def modify_handler_node(state: TravelState) -> TravelState:
     print(f"[Modify Handler] Generated updateDataModel: {update_message}")
     print(f"[Modify Handler] Updated fields: {updated_fields}")
 
+    # 안내 문구 → 데이터 변경 순서 (스트리밍 실행이면 각각 바로 전달)
+    messages = [assistant_message, update_message] if operations else [assistant_message]
+    emit_messages(messages, writer)
+
     return {
-        "messages": [update_message, assistant_message]
+        "messages": messages
     }
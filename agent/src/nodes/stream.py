@@ -0,0 +1,22 @@
+"""노드에서 만든 A2UI 메시지를 즉시 스트리밍으로 전달
+
+노드는 LangGraph가 주입하는 writer(StreamWriter) 인자를 받아 여기로 넘긴다.
+graph.astream(stream_mode="custom")이 아니면 writer는 아무 일도 하지 않는다.
+노드는 항상 전체 messages를 상태로도 반환하므로 /chat(비스트리밍) 응답은 그대로다.
+
+LangGraph의 custom 스트림 writer는 비동기 실행에서 contextvar로 실행 설정을 찾으므로 Python 3.11 이상이 필요하다
+(3.10에서는 RuntimeError). 오류는 삼키지 않고 그대로 올려 설정 문제가 드러나게 한다.
+"""
+
+from langgraph.types import StreamWriter
+
+
+def emit_messages(messages: list[dict], writer: StreamWriter | None = None) -> None:
+    """A2UI 메시지를 {"type": "message", "message": ...} 이벤트로 전달 (만든 순서대로)
+
+    writer가 None이면 그래프 밖에서 노드 함수를 직접 호출한 경우로 보고 전달하지 않는다.
+    """
+    if not messages or writer is None:
+        return
+    for message in messages:
+        writer({"type": "message", "message": message})
@@ -1,8 +1,29 @@
 """UI 생성 유틸"""
 
+from ..payload import get_payload_cache
+from ..surfaces import get_surface_registry
+
+# 초기 UI 레이아웃 버전 - 컴포넌트를 바꾸면 올려서 사전 인코딩 캐시 갱신
+INITIAL_UI_VERSION = 1
+
 
 def get_initial_ui() -> list[dict]:
-    """초기 여행 타입 선택 UI"""
+    """초기 여행 타입 선택 UI (사전 인코딩 캐시)"""
+    definition = get_surface_registry().define(
+        "travel-booking",
+        "travel-type-selector",
+        INITIAL_UI_VERSION,
+        lambda: _initial_ui()[1]["updateComponents"]["components"],
+    )
+    return [
+        get_payload_cache().get(
+            "travel-type-selector", "createSurface", INITIAL_UI_VERSION, lambda: _initial_ui()[0]
+        ),
+        definition.message,
+    ]
+
+
+def _initial_ui() -> list[dict]:
     return [
         {"createSurface": {"surfaceId": "travel-type-selector", "catalogId": "travel-booking"}},
         {
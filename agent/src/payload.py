@@ -0,0 +1,92 @@
+"""사전 인코딩된 A2UI 메시지 캐시 및 응답 인코더
+
+정적인 메시지(createSurface, 폼/결과 화면 updateComponents, 초기 UI)는 한 번만 JSON으로 인코딩해 두고,
+/chat, /chat/stream 응답 작성 시 그 바이트를 그대로 이어 붙인다. 동적인 부분(updateDataModel 등)만 매번 직렬화한다.
+"""
+
+import json
+import threading
+from typing import Any, Callable
+
+
+def dumps(obj: Any) -> bytes:
+    """응답 공통 JSON 인코딩 (한글 그대로, 공백 없음)"""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class EncodedPayload(dict):
+    """인코딩된 바이트를 함께 가진 A2UI 메시지
+
+    일반 dict처럼 다룰 수 있지만, 인코딩 결과가 어긋나지 않도록 생성 후에는 수정하지 않는다.
+    """
+
+    def __init__(self, message: dict):
+        super().__init__(message)
+        self.encoded = dumps(message)
+
+
+class PayloadCache:
+    """(surfaceId, 종류, 버전)별 사전 인코딩 메시지 캐시"""
+
+    def __init__(self):
+        self._entries: dict[tuple, EncodedPayload] = {}
+        self._lock = threading.Lock()
+
+    def get(self, surface_id: str, kind: str, version: Any, build: Callable[[], dict]) -> EncodedPayload:
+        """캐시된 메시지 반환 (없으면 build()로 생성 후 인코딩)
+
+        같은 surfaceId/종류의 이전 버전은 교체된다.
+        """
+        key = (surface_id, kind)
+        entry = self._entries.get(key)
+        if entry is not None and entry.version == version:
+            return entry.payload
+        payload = EncodedPayload(build())
+        with self._lock:
+            self._entries[key] = _CacheEntry(version, payload)
+        return payload
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _CacheEntry:
+    __slots__ = ("version", "payload")
+
+    def __init__(self, version: Any, payload: EncodedPayload):
+        self.version = version
+        self.payload = payload
+
+
+def _encode_value(value: Any) -> bytes:
+    if isinstance(value, EncodedPayload):
+        return value.encoded
+    if isinstance(value, list):
+        return b"[" + b",".join(
+            item.encoded if isinstance(item, EncodedPayload) else dumps(item) for item in value
+        ) + b"]"
+    return dumps(value)
+
+
+def encode_response(obj: Any) -> bytes:
+    """응답 JSON 인코딩 (사전 인코딩 메시지는 바이트를 그대로 삽입)
+
+    치환 위치: 최상위 값, 최상위 dict의 값, 그 값이 리스트면 리스트 항목
+    (예: {"messages": [...]}, {"type": "message", "message": ...}).
+    """
+    if isinstance(obj, dict) and not isinstance(obj, EncodedPayload):
+        return b"{" + b",".join(
+            dumps(str(key)) + b":" + _encode_value(value) for key, value in obj.items()
+        ) + b"}"
+    return _encode_value(obj)
+
+
+_payload_cache: PayloadCache | None = None
+
+
+def get_payload_cache() -> PayloadCache:
+    """사전 인코딩 메시지 캐시 싱글톤"""
+    global _payload_cache
+    if _payload_cache is None:
+        _payload_cache = PayloadCache()
+    return _payload_cache
@@ -0,0 +1,27 @@
+"""검색 공급자 계층 - 결과 화면(search-* 액션)의 데이터 소스"""
+
+from .base import SearchQuery, SearchProvider, ProviderError
+from .flight_inventory import FlightInventory, search_flights, get_flight_inventory
+from .hotel_index import HotelIndex, search_hotels, get_hotel_index
+from .car_availability import CarAvailability, search_cars, get_car_availability
+from .synthetic import SyntheticProvider
+from .aggregator import SearchAggregator, SearchResponse, get_search_aggregator
+
+__all__ = [
+    "SearchQuery",
+    "SearchProvider",
+    "ProviderError",
+    "FlightInventory",
+    "search_flights",
+    "get_flight_inventory",
+    "HotelIndex",
+    "search_hotels",
+    "get_hotel_index",
+    "CarAvailability",
+    "search_cars",
+    "get_car_availability",
+    "SyntheticProvider",
+    "SearchAggregator",
+    "SearchResponse",
+    "get_search_aggregator",
+]
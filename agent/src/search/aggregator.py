@@ -0,0 +1,121 @@
+"""검색 집계기 - 여러 공급자에 동시 요청 후 병합/중복 제거
+
+공급자마다 제한 시간(timeout)을 두고, 시간 안에 받은 결과만 사용한다 (느린 공급자는 부분 결과).
+같은 id의 결과는 가장 싼 것만 남기고 가격순으로 정렬한다.
+"""
+
+import os
+import time
+import asyncio
+
+from .. import metrics
+from .base import PRICE_FIELDS, SearchProvider, SearchQuery
+from .synthetic import SyntheticProvider
+
+
+# 공급자별 응답 제한 시간 (초)
+SEARCH_PROVIDER_TIMEOUT = float(os.getenv("SEARCH_PROVIDER_TIMEOUT", "1.5"))
+# 화면에 보낼 최대 결과 수
+SEARCH_MAX_RESULTS = int(os.getenv("SEARCH_MAX_RESULTS", "20"))
+
+
+class ProviderOutcome:
+    """공급자 하나의 응답 결과"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.results: list[dict] = []
+        self.status = "ok"  # ok, timeout, error
+        self.latency_ms = 0.0
+
+    def to_dict(self) -> dict:
+        return {"status": self.status, "count": len(self.results), "latencyMs": round(self.latency_ms, 1)}
+
+
+class SearchResponse:
+    """집계된 검색 결과"""
+
+    def __init__(self, query: SearchQuery, results: list[dict], outcomes: list[ProviderOutcome]):
+        self.query = query
+        self.results = results
+        self.providers = {outcome.name: outcome.to_dict() for outcome in outcomes}
+
+
+class SearchAggregator:
+    """공급자 fan-out + 병합"""
+
+    def __init__(self, providers: list[SearchProvider], max_results: int = SEARCH_MAX_RESULTS):
+        self.providers = providers
+        self.max_results = max_results
+
+    async def _collect(self, provider: SearchProvider, query: SearchQuery) -> ProviderOutcome:
+        """제한 시간 안에 받은 결과 수집 (시간 초과/오류여도 그때까지 받은 결과는 유지)"""
+        outcome = ProviderOutcome(provider.name)
+        start = time.perf_counter()
+
+        async def consume() -> None:
+            async for result in provider.search(query):
+                outcome.results.append(result)
+
+        try:
+            await asyncio.wait_for(consume(), provider.timeout)
+        except asyncio.TimeoutError:
+            outcome.status = "timeout"
+        except Exception as e:
+            outcome.status = "error"
+            print(f"[Search] {provider.name} failed: {e}")
+
+        outcome.latency_ms = (time.perf_counter() - start) * 1000
+        metrics.inc(f"search_provider_{outcome.status}")
+        return outcome
+
+    async def search(self, query: SearchQuery) -> SearchResponse:
+        """지원하는 모든 공급자에 동시 요청 → 병합/중복 제거/가격순 정렬"""
+        start = time.perf_counter()
+        providers = [provider for provider in self.providers if query.kind in provider.kinds]
+        outcomes = await asyncio.gather(*(self._collect(provider, query) for provider in providers))
+
+        price_field = PRICE_FIELDS.get(query.kind, "price")
+        merged: dict[str, dict] = {}
+        received = 0
+        for outcome in outcomes:
+            for result in outcome.results:
+                received += 1
+                current = merged.get(result["id"])
+                if current is None or result.get(price_field, 0) < current.get(price_field, 0):
+                    merged[result["id"]] = result
+        results = sorted(merged.values(), key=lambda result: result.get(price_field, 0))[:self.max_results]
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        metrics.inc("search_requests")
+        metrics.inc("search_latency_ms_total", elapsed_ms)
+        metrics.inc("search_results_received", received)
+        metrics.inc("search_results_deduplicated", received - len(merged))
+        print(
+            f"[Search] {query.kind}: {len(results)} results from "
+            f"{sum(1 for outcome in outcomes if outcome.status == 'ok')}/{len(outcomes)} providers ({elapsed_ms:.0f}ms)"
+        )
+        return SearchResponse(query, results, outcomes)
+
+
+def default_providers(timeout: float = SEARCH_PROVIDER_TIMEOUT) -> list[SearchProvider]:
+    """기본 공급자 구성 (지연/커버리지/가격이 서로 다른 합성 공급자 3개)"""
+    return [
+        SyntheticProvider("synthetic-fast", latency_ms=250, jitter=0.3, coverage=0.7, timeout=timeout),
+        SyntheticProvider("synthetic-mid", latency_ms=450, jitter=0.5, coverage=0.6, markup=-0.03, timeout=timeout),
+        SyntheticProvider(
+            "synthetic-slow", latency_ms=600, jitter=0.6, coverage=0.5, markup=0.02,
+            fail_rate=0.02, timeout=timeout,
+        ),
+    ]
+
+
+_search_aggregator: SearchAggregator | None = None
+
+
+def get_search_aggregator() -> SearchAggregator:
+    """검색 집계기 싱글톤"""
+    global _search_aggregator
+    if _search_aggregator is None:
+        _search_aggregator = SearchAggregator(default_providers())
+    return _search_aggregator
@@ -0,0 +1,55 @@
+"""검색 공급자 인터페이스"""
+
+import json
+import asyncio
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+
+# 결과 타입 → 검색 조건이 들어 있는 폼 데이터 키
+FORM_KEYS = {"flights": "flight", "hotels": "hotel", "cars": "car"}
+
+# 결과 타입별 가격 필드 (중복 제거 시 더 싼 결과 유지, 정렬 기준)
+PRICE_FIELDS = {"flights": "price", "hotels": "pricePerNight", "cars": "pricePerDay"}
+
+
+class ProviderError(Exception):
+    """공급자 호출 실패"""
+
+
+class SearchQuery:
+    """검색 조건 (결과 타입 + 폼 데이터의 해당 타입 값)"""
+
+    def __init__(self, kind: str, params: dict):
+        self.kind = kind  # flights, hotels, cars
+        self.params = params
+        # 같은 조건 식별용 (공급자 인벤토리 시드, 캐시 키)
+        self.key = json.dumps([kind, params], sort_keys=True, ensure_ascii=False)
+        # 공급자들이 공유하는 로컬 인벤토리 조회 (검색 요청당 한 번, synthetic.load_inventory)
+        self.inventory: asyncio.Future | None = None
+
+    @classmethod
+    def from_form(cls, kind: str, form_data: dict) -> "SearchQuery":
+        """폼 dataModel에서 검색 조건 생성 (e.g., "flights", {"flight": {...}})"""
+        return cls(kind, dict(form_data.get(FORM_KEYS.get(kind, ""), {}) or {}))
+
+    def __repr__(self) -> str:
+        return f"SearchQuery({self.kind}, {self.params})"
+
+
+class SearchProvider(ABC):
+    """검색 공급자 기본 클래스
+
+    search()는 결과를 준비되는 대로 하나씩 내보낸다 (페이지 단위 응답 등).
+    같은 상품이면 공급자가 달라도 같은 "id"를 가져야 집계 시 중복 제거된다 (항공편 번호/날짜, 호텔 ID 등).
+    """
+
+    def __init__(self, name: str, kinds: tuple[str, ...], timeout: float):
+        self.name = name
+        self.kinds = kinds      # 지원하는 결과 타입
+        self.timeout = timeout  # 응답 제한 시간 (초, 넘기면 그때까지 받은 결과만 사용)
+
+    @abstractmethod
+    def search(self, query: SearchQuery) -> AsyncIterator[dict]:
+        """조건에 맞는 결과를 비동기로 하나씩 반환"""
+        pass
@@ -0,0 +1,367 @@
+"""렌터카 가용성 엔진 - 차량별 예약 구간을 정렬 배열로 유지하고 [픽업, 반납) 빈 차량을 조회
+
+지점(픽업 장소)마다 차량 목록을 차종별로 가격순 정렬해 두고, 차량마다 겹치지 않는 예약 구간 (시작, 종료) 목록을
+시작 시각순으로 유지한다. 겹치지 않으므로 종료 시각순이기도 해서, [픽업, 반납)과 겹치는 예약이 있는지는
+"반납 > 픽업"인 첫 예약을 이분 탐색해 그 시작이 반납보다 앞서는지만 보면 된다 (차량당 O(log k)).
+
+조회가 차량을 하나씩 검사하지 않도록 지점마다 시간 버킷(CAR_BUCKET_MINUTES)별 "예약이 걸친 차량" 비트셋을 둔다.
+비트 위치는 차량의 가격 순위라, 차종/옵션 비트셋과 AND한 결과를 낮은 비트부터 읽으면 곧 가격순 후보가 된다.
+[픽업, 반납)이 걸친 버킷 중 어디에도 비트가 없는 차량은 바로 빈 차량, 구간 안에 완전히 포함된 버킷에 비트가 있는
+차량은 바로 제외하고, 양 끝 버킷에만 걸친 차량만 이분 탐색으로 확인한다.
+→ 조회 비용은 버킷 수 × 비트셋 크기(워드 단위 연산)와 후보 수(limit까지)에 비례하고, 차량별 검사는 경계 차량에 한정된다.
+예약 추가/취소는 지점별 락 안에서 예약 목록(insort/삭제)과 해당 버킷 비트를 함께 갱신한다.
+"""
+
+import os
+import time
+import bisect
+import hashlib
+import random
+import threading
+from datetime import date, datetime, timedelta
+from operator import itemgetter
+
+
+# 지점별 차량 수
+CAR_FLEET_SIZE = int(os.getenv("CAR_FLEET_SIZE", "2000"))
+# 기존 예약을 채워 넣을 기간 (오늘부터 일 수)
+CAR_AVAILABILITY_DAYS = int(os.getenv("CAR_AVAILABILITY_DAYS", "90"))
+# 차량 가동률 목표 (기존 예약이 차지하는 시간 비율)
+CAR_UTILIZATION = float(os.getenv("CAR_UTILIZATION", "0.6"))
+# 조회 한 번에 공급자에 넘길 후보 수
+CAR_CANDIDATES = int(os.getenv("CAR_CANDIDATES", "60"))
+# 가용성 색인 시간 버킷 (분)
+CAR_BUCKET_MINUTES = int(os.getenv("CAR_BUCKET_MINUTES", str(6 * 60)))
+# 최대 대여 기간 (일, 넘으면 조회하지 않음)
+CAR_MAX_RENTAL_DAYS = int(os.getenv("CAR_MAX_RENTAL_DAYS", "90"))
+
+LOCATIONS = ["ICN", "GMP", "CJU", "JEJU_CITY", "SEOGWIPO"]
+CAR_MODELS = [
+    ("현대 캐스퍼", "compact"), ("기아 레이", "compact"),
+    ("현대 아반떼", "mid"), ("기아 K5", "mid"), ("현대 쏘나타", "mid"),
+    ("현대 그랜저", "full"), ("기아 K8", "full"),
+    ("현대 투싼", "suv"), ("기아 쏘렌토", "suv"),
+    ("기아 카니발", "van"), ("제네시스 G80", "luxury"),
+]
+CAR_COMPANIES = ["롯데렌터카", "SK렌터카", "쏘카", "그린카"]
+CAR_BASE_PRICES = {"compact": 38000, "mid": 55000, "full": 80000, "suv": 75000, "van": 95000, "luxury": 150000}
+CAR_FEATURES = ["네비게이션", "후방카메라", "블루투스", "통풍시트", "360도 카메라", "4WD", "하이패스"]
+# 추가 옵션 (car.json /car/options) → (비트, 차량 보유 확률, 1일 요금)
+CAR_OPTIONS = {"gps": (1, 0.8, 0), "childseat": (2, 0.5, 10000), "wifi": (4, 0.3, 5000), "etc": (8, 0.7, 0)}
+# 보험 (car.json /car/insurance) → (표시명, 1일 요금), 여러 개 고르면 가장 높은 보장
+CAR_INSURANCE = {"basic": ("기본 보험", 0), "full": ("완전 자차 보험", 12000), "super": ("슈퍼 보험", 22000)}
+
+_END = itemgetter(1)
+# 바이트 값 → 켜진 비트 위치 (낮은 비트부터)
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+def _rng(*parts: str) -> random.Random:
+    digest = hashlib.sha256("|".join(parts).encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+class LocationFleet:
+    """지점 하나의 차량과 차량별 예약 구간
+
+    시각은 엔진 기준 시각(오늘 0시)부터의 분 단위 정수.
+    """
+
+    def __init__(self, location: str, count: int, days: int, utilization: float):
+        rng = _rng("fleet", location)
+        self.location = location
+        self.model: list[int] = []
+        self.company: list[int] = []
+        self.features: list[list[str]] = []
+        self.options: list[int] = []
+        self.price: list[int] = []
+        # 차량별 예약 [(시작, 종료), ...] (시작순, 서로 겹치지 않음)
+        self.reservations: list[list[tuple[int, int]]] = []
+        self._lock = threading.Lock()
+
+        horizon = days * 24 * 60
+        for _ in range(count):
+            model = rng.randrange(len(CAR_MODELS))
+            self.model.append(model)
+            self.company.append(rng.randrange(len(CAR_COMPANIES)))
+            self.features.append(rng.sample(CAR_FEATURES, k=3))
+            self.options.append(sum(bit for bit, rate, _ in CAR_OPTIONS.values() if rng.random() < rate))
+            self.price.append(int(round(CAR_BASE_PRICES[CAR_MODELS[model][1]] * rng.uniform(0.85, 1.25) / 100) * 100))
+
+            # 1~5일 예약 사이에 가동률에 맞춘 빈 시간 (시간 단위), 오늘 이전에 시작해 진행 중인 예약도 포함
+            intervals = []
+            t = -rng.randrange(0, 7 * 24) * 60
+            while t < horizon:
+                length = rng.randint(1, 5) * 24 * 60 + rng.randrange(0, 24) * 60
+                intervals.append((t, t + length))
+                t += length + int(rng.expovariate(utilization / (1 - utilization) / length) / 60 + 1) * 60
+            self.reservations.append(intervals)
+
+        # 차종별 (+ 전체) 차량 번호, 가격순
+        by_price = sorted(range(count), key=lambda i: (self.price[i], i))
+        self.by_type = {"": by_price}
+        for car_type in CAR_BASE_PRICES:
+            self.by_type[car_type] = [i for i in by_price if CAR_MODELS[self.model[i]][1] == car_type]
+
+        # 비트셋 색인 (비트 위치 = 가격 순위)
+        self.rank = [0] * count
+        for rank, vehicle in enumerate(by_price):
+            self.rank[vehicle] = rank
+        self.type_masks = {
+            car_type: self._mask(self.rank[i] for i in vehicles) for car_type, vehicles in self.by_type.items()
+        }
+        self.option_masks = {
+            bit: self._mask(self.rank[i] for i in range(count) if self.options[i] & bit)
+            for bit, _, _ in CAR_OPTIONS.values()
+        }
+        # 버킷 번호 → 예약이 걸친 차량 비트셋
+        buckets: dict[int, bytearray] = {}
+        size = (count + 7) // 8
+        for vehicle, intervals in enumerate(self.reservations):
+            rank = self.rank[vehicle]
+            for start, end in intervals:
+                for b in self._buckets(start, end):
+                    bitmap = buckets.get(b)
+                    if bitmap is None:
+                        bitmap = buckets[b] = bytearray(size)
+                    bitmap[rank >> 3] |= 1 << (rank & 7)
+        self.busy = {b: int.from_bytes(bitmap, "little") for b, bitmap in buckets.items()}
+        # 예약이 걸친 적 있는 버킷 범위 (밖의 버킷은 비어 있음)
+        self.bucket_min = min(self.busy, default=0)
+        self.bucket_max = max(self.busy, default=-1)
+
+    @staticmethod
+    def _mask(ranks) -> int:
+        mask = 0
+        for rank in ranks:
+            mask |= 1 << rank
+        return mask
+
+    @staticmethod
+    def _buckets(start: int, end: int) -> range:
+        """[start, end)가 걸친 버킷 번호"""
+        return range(start // CAR_BUCKET_MINUTES, (end - 1) // CAR_BUCKET_MINUTES + 1)
+
+    def __len__(self) -> int:
+        return len(self.model)
+
+    def is_free(self, vehicle: int, start: int, end: int) -> bool:
+        """[start, end)에 겹치는 예약이 없는지 (O(log k))"""
+        intervals = self.reservations[vehicle]
+        # 종료 > start인 첫 예약 (그 앞의 예약은 모두 start 전에 끝남)
+        i = bisect.bisect_right(intervals, start, key=_END)
+        return i == len(intervals) or intervals[i][0] >= end
+
+    def free_vehicles(self, car_type: str, start: int, end: int, options: int = 0, limit: int | None = None) -> list[int]:
+        """[start, end)에 빌릴 수 있는 차량 번호 (가격순, limit개가 모이면 중단)
+
+        버킷 비트셋으로 후보를 먼저 좁히고, 양 끝 버킷에만 예약이 걸친 차량만 is_free로 확인한다.
+        """
+        candidates = self.type_masks.get(car_type or "", 0)
+        for bit, mask in self.option_masks.items():
+            if options & bit:
+                candidates &= mask
+        if options & ~sum(self.option_masks) or end <= start:
+            return []
+
+        touched = inside = 0
+        # 예약이 있는 버킷 범위 밖은 비어 있으므로 건너뜀 (긴 대여 기간이어도 버킷 수는 제한됨)
+        span = self._buckets(start, end)
+        for b in range(max(span.start, self.bucket_min), min(span.stop, self.bucket_max + 1)):
+            busy = self.busy.get(b, 0)
+            touched |= busy
+            if b * CAR_BUCKET_MINUTES >= start and (b + 1) * CAR_BUCKET_MINUTES <= end:
+                inside |= busy  # 구간 안에 완전히 포함된 버킷에 예약이 걸치면 확실히 겹침
+        candidates &= ~inside
+        size = (len(self) + 7) // 8
+        candidate_bytes = candidates.to_bytes(size, "little")
+        boundary_bytes = (candidates & touched).to_bytes(size, "little")
+
+        order = self.by_type[""]
+        found = []
+        for i, byte in enumerate(candidate_bytes):
+            if not byte:
+                continue
+            boundary = boundary_bytes[i]
+            for bit in _BYTE_BITS[byte]:
+                vehicle = order[i * 8 + bit]
+                if boundary >> bit & 1 and not self.is_free(vehicle, start, end):
+                    continue
+                found.append(vehicle)
+                if limit is not None and len(found) >= limit:
+                    return found
+        return found
+
+    def reserve(self, vehicle: int, start: int, end: int) -> bool:
+        """예약 추가 (이미 겹치는 예약이 있으면 False)
+
+        확인과 삽입을 지점 락 안에서 함께 해 동시 예약이 같은 시간대를 이중으로 잡지 않는다.
+        조회는 락을 잡지 않음 (삽입은 리스트 한 번의 insert라 조회가 반쯤 바뀐 목록을 보지 않음).
+        버킷 비트를 예약 목록보다 먼저 켜서, 조회가 비트 없이 새 예약만 보는 순간이 없도록 한다.
+        """
+        if end <= start:
+            return False
+        bit = 1 << self.rank[vehicle]
+        with self._lock:
+            if not self.is_free(vehicle, start, end):
+                return False
+            span = self._buckets(start, end)
+            for b in span:
+                self.busy[b] = self.busy.get(b, 0) | bit
+            self.bucket_min = min(self.bucket_min, span.start)
+            self.bucket_max = max(self.bucket_max, span.stop - 1)
+            bisect.insort(self.reservations[vehicle], (start, end))
+        return True
+
+    def release(self, vehicle: int, start: int, end: int) -> bool:
+        """예약 취소"""
+        with self._lock:
+            intervals = self.reservations[vehicle]
+            i = bisect.bisect_left(intervals, (start, end))
+            if i == len(intervals) or intervals[i] != (start, end):
+                return False
+            del intervals[i]
+            # 같은 버킷에 걸친 다른 예약이 없으면 비트 해제
+            bit = 1 << self.rank[vehicle]
+            for b in self._buckets(start, end):
+                if self.is_free(vehicle, b * CAR_BUCKET_MINUTES, (b + 1) * CAR_BUCKET_MINUTES):
+                    self.busy[b] = self.busy.get(b, 0) & ~bit
+        return True
+
+
+class CarAvailability:
+    """지점별 렌터카 가용성"""
+
+    def __init__(
+        self,
+        locations: list[str] = LOCATIONS,
+        count: int = CAR_FLEET_SIZE,
+        days: int = CAR_AVAILABILITY_DAYS,
+        utilization: float = CAR_UTILIZATION,
+        start: date | None = None,
+    ):
+        self.epoch = datetime.combine(start or date.today(), datetime.min.time())
+        self.fleets = {location: LocationFleet(location, count, days, utilization) for location in locations}
+
+    def __len__(self) -> int:
+        return sum(len(fleet) for fleet in self.fleets.values())
+
+    def minutes(self, moment: datetime) -> int:
+        return int((moment - self.epoch).total_seconds() // 60)
+
+    def vehicle_id(self, location: str, vehicle: int) -> str:
+        return f"{location}-V{vehicle:05d}"
+
+    def parse_vehicle_id(self, vehicle_id: str) -> tuple[str, int] | None:
+        location, _, number = vehicle_id.rpartition("-V")
+        if location not in self.fleets or not number.isdigit() or int(number) >= len(self.fleets[location]):
+            return None
+        return location, int(number)
+
+    def search(
+        self,
+        location: str,
+        pickup: datetime,
+        dropoff: datetime,
+        car_type: str = "",
+        options: list[str] | None = None,
+        insurance: list[str] | None = None,
+        limit: int = CAR_CANDIDATES,
+    ) -> list[dict]:
+        """[pickup, dropoff)에 빌릴 수 있는 차량 (1일 요금순)
+
+        1일 요금에는 선택한 보험(가장 높은 보장)과 유료 옵션 요금이 포함된다.
+        대여 기간이 CAR_MAX_RENTAL_DAYS를 넘으면 빈 목록.
+        """
+        fleet = self.fleets.get(location)
+        if fleet is None or dropoff <= pickup:
+            return []
+        if dropoff - pickup > timedelta(days=CAR_MAX_RENTAL_DAYS):
+            print(f"[CarAvailability] Rental {pickup} → {dropoff} exceeds {CAR_MAX_RENTAL_DAYS} days")
+            return []
+        required = 0
+        option_fee = 0
+        for name in options or []:
+            bit, _, fee = CAR_OPTIONS.get(name, (0, 0, 0))
+            required |= bit
+            option_fee += fee
+        chosen = [CAR_INSURANCE[name] for name in insurance or [] if name in CAR_INSURANCE]
+        insurance_label, insurance_fee = max(chosen, key=itemgetter(1)) if chosen else (None, 0)
+        # 24시간 단위 올림
+        days = max(1, -(-int((dropoff - pickup).total_seconds()) // 86400))
+
+        rows = []
+        for vehicle in fleet.free_vehicles(car_type, self.minutes(pickup), self.minutes(dropoff), required, limit):
+            model, model_type = CAR_MODELS[fleet.model[vehicle]]
+            rows.append({
+                "id": self.vehicle_id(location, vehicle),
+                "model": model,
+                "type": model_type,
+                "company": CAR_COMPANIES[fleet.company[vehicle]],
+                "location": location,
+                "features": fleet.features[vehicle],
+                "pricePerDay": fleet.price[vehicle] + insurance_fee + option_fee,
+                "days": days,
+                "insurance": insurance_label,
+            })
+        return rows
+
+    def reserve(self, vehicle_id: str, pickup: datetime, dropoff: datetime) -> bool:
+        """차량 예약 (이미 예약된 시간대와 겹치면 False)"""
+        parsed = self.parse_vehicle_id(vehicle_id)
+        if parsed is None:
+            return False
+        location, vehicle = parsed
+        return self.fleets[location].reserve(vehicle, self.minutes(pickup), self.minutes(dropoff))
+
+    def release(self, vehicle_id: str, pickup: datetime, dropoff: datetime) -> bool:
+        """예약 취소"""
+        parsed = self.parse_vehicle_id(vehicle_id)
+        if parsed is None:
+            return False
+        location, vehicle = parsed
+        return self.fleets[location].release(vehicle, self.minutes(pickup), self.minutes(dropoff))
+
+
+def _parse_datetime(value) -> datetime | None:
+    try:
+        return datetime.fromisoformat(str(value).rstrip("Z")[:16]) if value else None
+    except ValueError:
+        return None
+
+
+def search_cars(params: dict, availability: "CarAvailability | None" = None) -> list[dict]:
+    """/car 데이터 모델 조건으로 빈 차량 조회 (pickupLocation, pickupDateTime, dropoffDateTime, type, insurance, options)"""
+    availability = availability or get_car_availability()
+    location = params.get("pickupLocation") or "CJU"
+    pickup = _parse_datetime(params.get("pickupDateTime")) or availability.epoch + timedelta(days=1, hours=10)
+    dropoff = _parse_datetime(params.get("dropoffDateTime"))
+    if not dropoff or dropoff <= pickup:
+        dropoff = pickup + timedelta(days=1)
+    return availability.search(
+        location, pickup, dropoff,
+        car_type=params.get("type") or "",
+        options=params.get("options") or [],
+        insurance=params.get("insurance") or [],
+    )
+
+
+_car_availability: CarAvailability | None = None
+_lock = threading.Lock()
+
+
+def get_car_availability() -> CarAvailability:
+    """렌터카 가용성 싱글톤 (처음 호출 시 차량/기존 예약 생성)"""
+    global _car_availability
+    if _car_availability is None:
+        with _lock:
+            if _car_availability is None:
+                started = time.perf_counter()
+                availability = CarAvailability()
+                reservations = sum(len(r) for fleet in availability.fleets.values() for r in fleet.reservations)
+                print(
+                    f"[CarAvailability] {len(availability):,} vehicles in {len(availability.fleets)} locations, "
+                    f"{reservations:,} reservations ({(time.perf_counter() - started) * 1000:.0f}ms)"
+                )
+                _car_availability = availability
+    return _car_availability
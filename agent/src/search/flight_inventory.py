@@ -0,0 +1,327 @@
+"""항공편 인벤토리 - 대용량 합성 스케줄을 열(column) 단위 array에 저장하고 노선/날짜로 색인
+
+레그(편)마다 Python 객체를 만들지 않고 열별 array(출발 시각, 소요 시간, 항공사, 편명, 좌석 등급별 운임/잔여석)에 저장한다.
+레그는 (출발지, 도착지, 날짜, 출발 시각) 순으로 정렬되어 있어, (출발지, 도착지, 날짜) 그룹 키 배열을 이분 탐색해
+구간을 찾고 그 안에서 출발 시각으로 다시 이분 탐색한다 → 조회 O(log n + 결과 수). 결과 행만 dict로 만든다.
+기본 규모: 공항 11개(110개 노선) × 365일 × 노선당 하루 16~32편 ≈ 87만 레그.
+FLIGHT_INVENTORY_MAX_DAILY=96이면 ≈ 260만 레그 (bench_flight_inventory가 두 규모 모두 측정).
+"""
+
+import os
+import json
+import math
+import time
+import bisect
+import hashlib
+import random
+import threading
+from array import array
+from datetime import date, timedelta
+
+
+# 스케줄 기간 (오늘부터 일 수)
+FLIGHT_INVENTORY_DAYS = int(os.getenv("FLIGHT_INVENTORY_DAYS", "365"))
+# 노선별 하루 최대 편수 (노선마다 절반~최대)
+FLIGHT_INVENTORY_MAX_DAILY = int(os.getenv("FLIGHT_INVENTORY_MAX_DAILY", "32"))
+# 인벤토리 파일 (지정하면 있을 때 불러오고, 없으면 생성 후 저장)
+FLIGHT_INVENTORY_PATH = os.getenv("FLIGHT_INVENTORY_PATH", "")
+
+DEFAULT_AIRPORTS = ["ICN", "GMP", "CJU", "PUS", "NRT", "HND", "KIX", "FUK", "BKK", "SIN", "HKG"]
+# 공항 좌표 (위도, 경도) - 노선 소요 시간 계산용
+AIRPORT_COORDS = {
+    "ICN": (37.46, 126.44), "GMP": (37.56, 126.79), "CJU": (33.51, 126.49), "PUS": (35.18, 128.94),
+    "NRT": (35.77, 140.39), "HND": (35.55, 139.78), "KIX": (34.43, 135.24), "FUK": (33.59, 130.45),
+    "BKK": (13.69, 100.75), "SIN": (1.36, 103.99), "HKG": (22.31, 113.91),
+}
+AIRLINES = [
+    ("대한항공", "KE"), ("아시아나항공", "OZ"), ("진에어", "LJ"),
+    ("제주항공", "7C"), ("티웨이항공", "TW"), ("에어부산", "BX"),
+]
+CABINS = ("economy", "business", "first")
+CABIN_MULTIPLIERS = (1.0, 2.8, 4.5)
+CABIN_MAX_SEATS = (180, 24, 8)
+
+# 열 이름 → array typecode (저장/불러오기 순서)
+COLUMNS = {
+    "group_keys": "q", "group_starts": "q",
+    "dep": "H", "duration": "H", "airline": "B", "number": "H",
+    "fare_economy": "I", "fare_business": "I", "fare_first": "I",
+    "seats_economy": "B", "seats_business": "B", "seats_first": "B",
+}
+
+
+def _route_rng(origin: str, dest: str) -> random.Random:
+    digest = hashlib.sha256(f"schedule|{origin}|{dest}".encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def _route_minutes(origin: str, dest: str) -> int:
+    """노선 소요 시간 (분, 방향 무관)
+
+    대권 거리 기준 순항(약 750km/h) + 지상 이동/이착륙 35분에 노선별 고정 편차(±10분)를 더해 5분 단위로 맞춘다.
+    좌표가 없는 공항은 노선별 고정 난수.
+    """
+    rng = _route_rng(*sorted((origin, dest)))
+    if origin not in AIRPORT_COORDS or dest not in AIRPORT_COORDS:
+        return 55 + rng.randrange(0, 73) * 5
+    (lat1, lon1), (lat2, lon2) = (map(math.radians, AIRPORT_COORDS[code]) for code in (origin, dest))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    km = 2 * 6371 * math.asin(math.sqrt(a))
+    minutes = 35 + km / 12.5 + rng.randint(-2, 2) * 5
+    return max(45, int(round(minutes / 5)) * 5)
+
+
+class FlightInventory:
+    """열 단위 항공편 인벤토리"""
+
+    def __init__(self, airports: list[str], start: date, days: int, columns: dict[str, array]):
+        self.airports = airports
+        self.start = start
+        self.days = days
+        self._airport_index = {code: i for i, code in enumerate(airports)}
+        for name in COLUMNS:
+            setattr(self, name, columns[name])
+        self.fares = (self.fare_economy, self.fare_business, self.fare_first)
+        self.seats = (self.seats_economy, self.seats_business, self.seats_first)
+
+    def __len__(self) -> int:
+        return len(self.dep)
+
+    @property
+    def nbytes(self) -> int:
+        """열 데이터 크기 (바이트)"""
+        return sum(len(column) * column.itemsize for column in (getattr(self, name) for name in COLUMNS))
+
+    # ----- 생성 / 저장 -----
+
+    @classmethod
+    def build(
+        cls,
+        airports: list[str] = DEFAULT_AIRPORTS,
+        start: date | None = None,
+        days: int = FLIGHT_INVENTORY_DAYS,
+        max_daily: int = FLIGHT_INVENTORY_MAX_DAILY,
+    ) -> "FlightInventory":
+        """합성 스케줄 생성 (노선별 주간 운항 패턴 + 날짜별 운임/잔여석)"""
+        start = start or date.today()
+        columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+        dep, duration, airline, number = columns["dep"], columns["duration"], columns["airline"], columns["number"]
+        fares = (columns["fare_economy"], columns["fare_business"], columns["fare_first"])
+        seats = (columns["seats_economy"], columns["seats_business"], columns["seats_first"])
+        group_keys, group_starts = columns["group_keys"], columns["group_starts"]
+        start_weekday = start.weekday()
+        count = len(airports)
+
+        for o, origin in enumerate(airports):
+            for d, dest in enumerate(airports):
+                if o == d:
+                    continue
+                rng = _route_rng(origin, dest)
+                minutes = _route_minutes(origin, dest)
+                flights = []
+                for _ in range(rng.randint(max(1, max_daily // 2), max_daily)):
+                    airline_index = rng.randrange(len(AIRLINES))
+                    # 운항 요일 (대부분 매일, 일부는 주 3~5회)
+                    mask = 0x7F if rng.random() < 0.7 else sum(1 << w for w in rng.sample(range(7), rng.randint(3, 5)))
+                    base_fare = (60000 + minutes * 900) * rng.uniform(0.75, 1.25)
+                    flights.append((rng.randrange(6 * 60, 23 * 60, 5), airline_index, rng.randint(100, 9999), mask, base_fare))
+                flights.sort()
+                # 요일별 운항편 (출발 시각순)
+                by_weekday = [[f for f in flights if f[3] >> w & 1] for w in range(7)]
+                weekday_columns = [
+                    (
+                        array("H", [f[0] for f in legs]),
+                        array("H", [minutes] * len(legs)),
+                        array("B", [f[1] for f in legs]),
+                        array("H", [f[2] for f in legs]),
+                        [f[4] for f in legs],
+                    )
+                    for legs in by_weekday
+                ]
+                route_id = o * count + d
+                for day in range(days):
+                    legs_dep, legs_duration, legs_airline, legs_number, base_fares = weekday_columns[(start_weekday + day) % 7]
+                    if not legs_dep:
+                        continue
+                    group_keys.append(route_id * days + day)
+                    group_starts.append(len(dep))
+                    dep.extend(legs_dep)
+                    duration.extend(legs_duration)
+                    airline.extend(legs_airline)
+                    number.extend(legs_number)
+                    # 날짜별 운임 변동 (0.75~1.39배)과 잔여석은 정수 해시로 계산 (레그마다 난수 생성 없이)
+                    h = [(day * 2654435761 + i * 40503 + route_id * 97) & 0xFFFFFFFF for i in range(len(base_fares))]
+                    factors = [0.75 + (x % 65) / 100 for x in h]
+                    for cabin in range(3):
+                        fares[cabin].extend([int(b * f * CABIN_MULTIPLIERS[cabin]) // 100 * 100 for b, f in zip(base_fares, factors)])
+                        seats[cabin].extend([(x >> (8 + cabin * 6)) % (CABIN_MAX_SEATS[cabin] + 1) for x in h])
+        group_starts.append(len(dep))
+        return cls(list(airports), start, days, columns)
+
+    def save(self, path: str) -> None:
+        """헤더(JSON 한 줄) + 열별 원시 바이트로 저장"""
+        header = {
+            "airports": self.airports,
+            "start": self.start.isoformat(),
+            "days": self.days,
+            "lengths": {name: len(getattr(self, name)) for name in COLUMNS},
+        }
+        with open(path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            for name in COLUMNS:
+                getattr(self, name).tofile(f)
+
+    @classmethod
+    def load(cls, path: str) -> "FlightInventory":
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            columns = {}
+            for name, typecode in COLUMNS.items():
+                column = array(typecode)
+                column.fromfile(f, header["lengths"][name])
+                columns[name] = column
+        return cls(header["airports"], date.fromisoformat(header["start"]), header["days"], columns)
+
+    # ----- 조회 -----
+
+    def _group(self, origin: str, dest: str, day: int) -> tuple[int, int]:
+        """(출발지, 도착지, 날짜) 레그 구간 [lo, hi)"""
+        o = self._airport_index.get(origin)
+        d = self._airport_index.get(dest)
+        if o is None or d is None or o == d or not 0 <= day < self.days:
+            return 0, 0
+        key = (o * len(self.airports) + d) * self.days + day
+        i = bisect.bisect_left(self.group_keys, key)
+        if i == len(self.group_keys) or self.group_keys[i] != key:
+            return 0, 0
+        return self.group_starts[i], self.group_starts[i + 1]
+
+    def query(
+        self,
+        origin: str,
+        dest: str,
+        on: date,
+        cabin: str = "economy",
+        seats: int = 1,
+        depart_after: int = 0,
+        depart_before: int = 24 * 60,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """노선/날짜의 예약 가능한 레그 (출발 시각순)
+
+        Args:
+            depart_after, depart_before: 출발 시각 범위 (자정 기준 분)
+            seats: 필요한 좌석 수 (잔여석이 부족한 편 제외)
+        """
+        lo, hi = self._group(origin, dest, (on - self.start).days)
+        if lo == hi:
+            return []
+        # 그룹 안에서는 출발 시각순 정렬
+        lo = bisect.bisect_left(self.dep, depart_after, lo, hi)
+        hi = bisect.bisect_left(self.dep, depart_before, lo, hi)
+
+        cabin_index = CABINS.index(cabin) if cabin in CABINS else 0
+        fares, available = self.fares[cabin_index], self.seats[cabin_index]
+        day = on.isoformat()
+        rows = []
+        for i in range(lo, hi):
+            if available[i] < seats:
+                continue
+            name, code = AIRLINES[self.airline[i]]
+            flight_no = f"{code}{self.number[i]}"
+            depart, arrive = self.dep[i], (self.dep[i] + self.duration[i]) % (24 * 60)
+            rows.append({
+                "id": f"{flight_no}-{day}",
+                "airline": name,
+                "flightNo": flight_no,
+                "departure": origin,
+                "arrival": dest,
+                "departureDate": day,
+                "departureTime": f"{depart // 60:02d}:{depart % 60:02d}",
+                "arrivalTime": f"{arrive // 60:02d}:{arrive % 60:02d}",
+                "durationMinutes": self.duration[i],
+                "cabin": CABINS[cabin_index],
+                "seatsLeft": available[i],
+                "price": fares[i],
+            })
+            if limit is not None and len(rows) >= limit:
+                break
+        return rows
+
+
+def _parse_date(value) -> date | None:
+    try:
+        return date.fromisoformat(str(value)[:10]) if value else None
+    except ValueError:
+        return None
+
+
+def search_flights(params: dict, inventory: "FlightInventory | None" = None) -> list[dict]:
+    """/flight 데이터 모델 조건으로 항공편 조회
+
+    왕복이면 귀국일의 가장 싼 귀국편을 각 가는편에 붙이고 가격은 왕복 합계 (1인 기준).
+    귀국일에 예약 가능한 편이 없으면 가는편만 편도 가격으로 반환하고 returnFlight에 unavailable 표시.
+    """
+    inventory = inventory or get_flight_inventory()
+    origin = params.get("departure") or "ICN"
+    dest = params.get("arrival") or "KIX"
+    cabin = params.get("class") or "economy"
+    passengers = params.get("passengers") or {}
+    try:
+        # 유아는 좌석을 차지하지 않음
+        seats = max(1, int(passengers.get("adults", 1) or 0) + int(passengers.get("children", 0) or 0))
+    except (TypeError, ValueError):
+        seats = 1
+    outbound_date = _parse_date(params.get("departureDate")) or inventory.start + timedelta(days=1)
+
+    outbound = inventory.query(origin, dest, outbound_date, cabin, seats)
+    return_date = _parse_date(params.get("returnDate"))
+    if params.get("tripType", "roundtrip") != "roundtrip" or not return_date or not outbound:
+        return outbound
+
+    inbound = inventory.query(dest, origin, return_date, cabin, seats)
+    if not inbound:
+        print(f"[FlightInventory] No return flights {dest}→{origin} on {return_date}, showing one-way fares")
+        for leg in outbound:
+            leg["returnFlight"] = {"unavailable": True, "departureDate": return_date.isoformat()}
+        return outbound
+    back = min(inbound, key=lambda leg: leg["price"])
+    for leg in outbound:
+        leg["id"] = f"{leg['id']}+{back['id']}"
+        leg["price"] += back["price"]
+        leg["returnFlight"] = {
+            "flightNo": back["flightNo"],
+            "departureDate": back["departureDate"],
+            "departureTime": back["departureTime"],
+            "arrivalTime": back["arrivalTime"],
+        }
+    return outbound
+
+
+_flight_inventory: FlightInventory | None = None
+_lock = threading.Lock()
+
+
+def get_flight_inventory() -> FlightInventory:
+    """항공편 인벤토리 싱글톤 (처음 호출 시 파일에서 불러오거나 생성)"""
+    global _flight_inventory
+    if _flight_inventory is None:
+        with _lock:
+            if _flight_inventory is None:
+                started = time.perf_counter()
+                if FLIGHT_INVENTORY_PATH and os.path.exists(FLIGHT_INVENTORY_PATH):
+                    inventory = FlightInventory.load(FLIGHT_INVENTORY_PATH)
+                    # 지난 날짜부터 시작하는 파일이면 새로 생성
+                    if inventory.start != date.today():
+                        inventory = FlightInventory.build()
+                        inventory.save(FLIGHT_INVENTORY_PATH)
+                else:
+                    inventory = FlightInventory.build()
+                    if FLIGHT_INVENTORY_PATH:
+                        inventory.save(FLIGHT_INVENTORY_PATH)
+                print(
+                    f"[FlightInventory] {len(inventory):,} legs, {inventory.nbytes / 1e6:.1f} MB "
+                    f"({(time.perf_counter() - started) * 1000:.0f}ms)"
+                )
+                _flight_inventory = inventory
+    return _flight_inventory
@@ -0,0 +1,230 @@
+"""호텔 색인 - 도시별 숙소를 NumPy 열 배열에 저장하고 필터/정렬을 벡터 연산으로 처리
+
+도시 코드(SEL, TYO 등 CITY_CODE_MAP과 같은 코드)마다 숙소 수만 개를 열 배열(브랜드, 지역, 평점, 편의시설 비트셋,
+평일/주말 1박 요금, 객실당 최대 인원, 잔여 객실)로 저장한다.
+조회 시 편의시설은 비트 AND, 인원/객실 조건은 배열 비교로 한 번에 거르고, 숙박 총액(요금 × 날짜별 수요 × 박수 × 객실 수)도
+배열 연산으로 계산한 뒤 argpartition으로 상위 결과만 고른다. 결과 행만 dict로 만든다.
+"""
+
+import os
+import time
+import hashlib
+import threading
+from datetime import date, timedelta
+
+import numpy as np
+
+
+# 도시별 숙소 수
+HOTEL_INDEX_SIZE = int(os.getenv("HOTEL_INDEX_SIZE", "20000"))
+# 요금 달력 기간 (오늘부터 일 수)
+HOTEL_INDEX_DAYS = int(os.getenv("HOTEL_INDEX_DAYS", "365"))
+# 조회 한 번에 공급자에 넘길 후보 수 (공급자별 판매 비율로 줄어들므로 최대 결과 수보다 넉넉하게)
+HOTEL_INDEX_CANDIDATES = int(os.getenv("HOTEL_INDEX_CANDIDATES", "60"))
+
+HOTEL_BRANDS = [
+    "신라스테이", "롯데시티호텔", "노보텔 앰배서더", "이비스 스타일", "힐튼 가든 인",
+    "머큐어", "호텔 그레이스리", "토요코인", "코트야드 메리어트", "글래드",
+]
+HOTEL_AREAS = {
+    "SEL": ["강남", "명동", "홍대", "여의도", "잠실"],
+    "PUS": ["해운대", "서면", "광안리"],
+    "CJU": ["제주시", "서귀포", "중문"],
+    "TYO": ["신주쿠", "시부야", "긴자", "우에노"],
+    "OSA": ["난바", "우메다", "신사이바시"],
+    "FUK": ["하카타", "텐진", "나카스"],
+    "BKK": ["수쿰빗", "실롬", "카오산"],
+    "SGN": ["1군", "3군", "빈탄"],
+    "HAN": ["호안끼엠", "서호", "바딘"],
+    "SIN": ["마리나 베이", "오차드", "센토사"],
+    "HKG": ["침사추이", "센트럴", "코즈웨이 베이"],
+}
+# 편의시설 → 비트 위치 (순서 = 비트 번호)
+HOTEL_AMENITIES = ["조식", "무료 WiFi", "피트니스", "수영장", "주차", "스파", "라운지", "공항 셔틀"]
+AMENITY_BITS = {name: 1 << i for i, name in enumerate(HOTEL_AMENITIES)}
+# 편의시설별 보유 확률 (평점이 높을수록 조금 더 높아짐)
+AMENITY_RATES = [0.55, 0.95, 0.45, 0.25, 0.5, 0.15, 0.2, 0.15]
+
+SORT_KEYS = ("price", "rating")
+
+
+def _seed(*parts: str) -> int:
+    return int.from_bytes(hashlib.sha256("|".join(parts).encode("utf-8")).digest()[:8], "big")
+
+
+class CityHotels:
+    """도시 하나의 숙소 열 배열"""
+
+    def __init__(self, city: str, count: int, start: date, days: int):
+        rng = np.random.default_rng(_seed("hotels", city))
+        self.city = city
+        self.areas = HOTEL_AREAS.get(city, ["시내", "역 앞", "공항 인근"])
+
+        self.brand = rng.integers(0, len(HOTEL_BRANDS), count, dtype=np.uint8)
+        self.area = rng.integers(0, len(self.areas), count, dtype=np.uint8)
+        # 평점은 0.1 단위 정수 (30 = 3.0)
+        self.rating = np.clip(np.rint(rng.normal(41, 4, count)), 30, 50).astype(np.uint8)
+        quality = (self.rating.astype(np.float32) - 30) / 20
+
+        bits = np.zeros(count, dtype=np.uint16)
+        for i, rate in enumerate(AMENITY_RATES):
+            bits |= ((rng.random(count) < rate + quality * 0.25) << i).astype(np.uint16)
+        self.amenities = bits
+
+        weekday = (50000 + quality * 180000) * rng.lognormal(0, 0.25, count)
+        self.weekday_rate = (np.rint(weekday / 100) * 100).astype(np.int32)
+        self.weekend_rate = (np.rint(weekday * rng.uniform(1.1, 1.4, count) / 100) * 100).astype(np.int32)
+        self.max_guests = rng.choice(np.array([2, 3, 4], dtype=np.uint8), count, p=[0.6, 0.25, 0.15])
+        self.rooms_left = rng.integers(0, 11, count, dtype=np.uint8)
+
+        # 날짜별 수요 배율 (계절 변동 + 잡음)과 주말 박(금/토) 여부
+        day = np.arange(days)
+        self.demand = (1 + 0.15 * np.sin((day + rng.integers(0, 365)) / 365 * 2 * np.pi)
+                       + rng.normal(0, 0.05, days)).astype(np.float32)
+        self.weekend = np.array([(start + timedelta(days=int(d))).weekday() in (4, 5) for d in day])
+
+    def __len__(self) -> int:
+        return len(self.rating)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in (
+            "brand", "area", "rating", "amenities", "weekday_rate", "weekend_rate", "max_guests", "rooms_left", "demand",
+        ))
+
+    def stay_totals(self, first: int, last: int, hotels: np.ndarray) -> np.ndarray:
+        """[first, last) 박의 객실 1개 숙박 총액 (hotels 순서, 원 단위 정수)"""
+        demand = self.demand[first:last]
+        weekend = self.weekend[first:last]
+        weekday_factor = float(demand[~weekend].sum(dtype=np.float64))
+        weekend_factor = float(demand[weekend].sum(dtype=np.float64))
+        return np.rint(self.weekday_rate[hotels] * weekday_factor + self.weekend_rate[hotels] * weekend_factor).astype(np.int64)
+
+    def match(self, rooms: int, guests: int, required: int) -> np.ndarray:
+        """조건에 맞는 숙소 마스크 (편의시설 비트 포함, 객실당 인원, 잔여 객실)"""
+        mask = (self.amenities & required) == required
+        mask &= self.rooms_left >= rooms
+        # 객실당 인원 = ceil(인원 / 객실 수)
+        mask &= self.max_guests >= -(-guests // rooms)
+        return mask
+
+
+class HotelIndex:
+    """도시별 호텔 색인"""
+
+    def __init__(self, cities: list[str], count: int = HOTEL_INDEX_SIZE, start: date | None = None, days: int = HOTEL_INDEX_DAYS):
+        self.start = start or date.today()
+        self.days = days
+        self.cities = {city: CityHotels(city, count, self.start, days) for city in cities}
+
+    def __len__(self) -> int:
+        return sum(len(hotels) for hotels in self.cities.values())
+
+    @property
+    def nbytes(self) -> int:
+        return sum(hotels.nbytes for hotels in self.cities.values())
+
+    def search(
+        self,
+        city: str,
+        checkin: date,
+        checkout: date,
+        rooms: int = 1,
+        guests: int = 2,
+        amenities: list[str] | None = None,
+        sort: str = "price",
+        limit: int = HOTEL_INDEX_CANDIDATES,
+    ) -> list[dict]:
+        """조건에 맞는 숙소 상위 limit개
+
+        Args:
+            amenities: 반드시 있어야 하는 편의시설 (예: ["조식", "수영장"])
+            sort: "price" (숙박 총액 오름차순) 또는 "rating" (평점 내림차순, 같으면 총액 오름차순)
+        """
+        hotels = self.cities.get(city)
+        first, last = (checkin - self.start).days, (checkout - self.start).days
+        if hotels is None or first < 0 or last > self.days or last <= first:
+            return []
+        rooms = max(1, rooms)
+        required = 0
+        for name in amenities or []:
+            required |= AMENITY_BITS.get(name, 0)
+
+        candidates = np.flatnonzero(hotels.match(rooms, guests, required))
+        if not len(candidates):
+            return []
+        totals = hotels.stay_totals(first, last, candidates)
+        # 정렬 키를 정수 하나로: (평점 내림차순) → 총액 오름차순 → 숙소 번호 (같은 값이어도 순서가 고정되도록, 도시당 2^20개까지)
+        keys = np.minimum(totals, 2**32 - 1) << 20 | candidates
+        if sort == "rating":
+            keys |= (50 - hotels.rating[candidates]).astype(np.int64) << 52
+        if len(candidates) > limit:
+            top = np.argpartition(keys, limit - 1)[:limit]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(keys[top])]
+
+        nights = last - first
+        rows = []
+        for position in top:
+            i = int(candidates[position])
+            area = hotels.areas[hotels.area[i]]
+            bits = int(hotels.amenities[i])
+            rows.append({
+                "id": f"{city}-{i:05d}",
+                "name": f"{HOTEL_BRANDS[hotels.brand[i]]} {area} {i % 97 + 1}호점",
+                "rating": int(hotels.rating[i]) / 10,
+                "city": city,
+                "area": area,
+                "amenities": [name for name, bit in AMENITY_BITS.items() if bits & bit],
+                "pricePerNight": int(round(float(totals[position]) / nights / 100) * 100),
+                "nights": nights,
+                "rooms": rooms,
+            })
+        return rows
+
+
+def _parse_date(value) -> date | None:
+    try:
+        return date.fromisoformat(str(value)[:10]) if value else None
+    except ValueError:
+        return None
+
+
+def search_hotels(params: dict, index: "HotelIndex | None" = None) -> list[dict]:
+    """/hotel 데이터 모델 조건으로 호텔 조회 (destination, checkinDate, checkoutDate, rooms, guests, breakfast)"""
+    index = index or get_hotel_index()
+    city = params.get("destination") or "SEL"
+    checkin = _parse_date(params.get("checkinDate")) or index.start + timedelta(days=1)
+    checkout = _parse_date(params.get("checkoutDate"))
+    if not checkout or checkout <= checkin:
+        checkout = checkin + timedelta(days=1)
+    guests = params.get("guests") or {}
+    try:
+        rooms = int(params.get("rooms") or 1)
+        people = max(1, int(guests.get("adults", 2) or 0) + int(guests.get("children", 0) or 0))
+    except (TypeError, ValueError):
+        rooms, people = 1, 2
+    amenities = ["조식"] if params.get("breakfast") else []
+    sort = params.get("sort") if params.get("sort") in SORT_KEYS else "price"
+    return index.search(city, checkin, checkout, rooms, people, amenities, sort)
+
+
+_hotel_index: HotelIndex | None = None
+_lock = threading.Lock()
+
+
+def get_hotel_index() -> HotelIndex:
+    """호텔 색인 싱글톤 (처음 호출 시 생성)"""
+    global _hotel_index
+    if _hotel_index is None:
+        with _lock:
+            if _hotel_index is None:
+                started = time.perf_counter()
+                index = HotelIndex(list(HOTEL_AREAS))
+                print(
+                    f"[HotelIndex] {len(index):,} hotels in {len(index.cities)} cities, {index.nbytes / 1e6:.1f} MB "
+                    f"({(time.perf_counter() - started) * 1000:.0f}ms)"
+                )
+                _hotel_index = index
+    return _hotel_index
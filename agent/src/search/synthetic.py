@@ -0,0 +1,105 @@
+"""로컬 합성 검색 공급자 - 외부 API 없이 실제 공급자와 비슷한 지연/부분 응답/실패를 흉내냄
+
+같은 조건이면 항상 같은 인벤토리(항공편/호텔/렌터카 색인 조회)를 쓰고, 공급자마다 그중 일부를 조금씩 다른 가격으로 판매한다.
+색인 조회는 검색 요청당 한 번 이벤트 루프 밖(스레드)에서 실행하고 모든 공급자가 결과를 공유한다.
+응답은 여러 페이지로 나뉘어 도착하며, 페이지 지연은 로그정규 분포(긴 꼬리)를 따른다.
+"""
+
+import os
+import asyncio
+import hashlib
+import random
+from typing import AsyncIterator
+
+from .base import PRICE_FIELDS, ProviderError, SearchProvider, SearchQuery
+from .flight_inventory import search_flights
+from .hotel_index import search_hotels
+from .car_availability import search_cars
+
+
+# 모든 합성 지연에 곱하는 배율 (0 = 지연 없음, 테스트/벤치마크용)
+SEARCH_LATENCY_SCALE = float(os.getenv("SEARCH_LATENCY_SCALE", "1.0"))
+
+
+def _rng(*parts: str) -> random.Random:
+    """문자열 조합으로 고정 시드 난수 생성기 (프로세스가 달라도 같은 결과)"""
+    digest = hashlib.sha256("|".join(parts).encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def _round_price(value: float) -> int:
+    return int(round(value / 100) * 100)
+
+
+INVENTORIES = {
+    "flights": search_flights,
+    "hotels": search_hotels,
+    "cars": search_cars,
+}
+
+
+async def load_inventory(query: SearchQuery) -> list[dict]:
+    """조건에 맞는 인벤토리 (첫 호출만 스레드에서 조회하고 나머지 공급자는 같은 결과를 기다림)"""
+    if query.inventory is None:
+        query.inventory = asyncio.ensure_future(asyncio.to_thread(INVENTORIES[query.kind], query.params))
+    # 한 공급자가 시간 초과로 취소돼도 공유 조회는 계속 진행
+    return await asyncio.shield(query.inventory)
+
+
+class SyntheticProvider(SearchProvider):
+    """합성 데이터 공급자
+
+    Args:
+        latency_ms: 첫 페이지까지 지연 중앙값 (이후 페이지는 30%)
+        jitter: 지연 로그정규 분포의 sigma (클수록 꼬리 지연이 길어짐)
+        coverage: 전체 인벤토리 중 이 공급자가 판매하는 비율
+        markup: 가격 가산율 (음수면 할인)
+        fail_rate: 호출 실패 확률
+    """
+
+    def __init__(
+        self,
+        name: str,
+        latency_ms: float = 300,
+        jitter: float = 0.5,
+        pages: int = 2,
+        coverage: float = 0.7,
+        markup: float = 0.0,
+        fail_rate: float = 0.0,
+        timeout: float = 1.5,
+        kinds: tuple[str, ...] = ("flights", "hotels", "cars"),
+        seed: int | None = None,
+    ):
+        super().__init__(name, kinds, timeout)
+        self.latency_ms = latency_ms
+        self.jitter = jitter
+        self.pages = max(1, pages)
+        self.coverage = coverage
+        self.markup = markup
+        self.fail_rate = fail_rate
+        # 지연/실패는 요청마다 달라짐 (seed를 주면 재현 가능)
+        self._random = random.Random(seed)
+
+    def _delay(self, scale: float) -> float:
+        return self.latency_ms / 1000 * scale * self._random.lognormvariate(0, self.jitter) * SEARCH_LATENCY_SCALE
+
+    async def search(self, query: SearchQuery) -> AsyncIterator[dict]:
+        if query.kind not in INVENTORIES:
+            return
+        # 판매 상품/가격은 (공급자, 조건)별로 고정
+        rng = _rng(self.name, query.key)
+        price_field = PRICE_FIELDS[query.kind]
+        offers = [item for item in await load_inventory(query) if rng.random() < self.coverage]
+
+        if self._random.random() < self.fail_rate:
+            await asyncio.sleep(self._delay(1.0))
+            raise ProviderError(f"{self.name}: upstream error")
+
+        page_size = -(-len(offers) // self.pages)
+        for page in range(self.pages):
+            await asyncio.sleep(self._delay(1.0 if page == 0 else 0.3))
+            for item in offers[page * page_size:(page + 1) * page_size]:
+                offer = dict(item)
+                offer[price_field] = _round_price(item[price_field] * (1 + self.markup) * rng.uniform(0.95, 1.05))
+                offer["provider"] = self.name
+                yield offer
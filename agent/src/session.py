@@ -0,0 +1,101 @@
+"""클라이언트 세션 관리 - LRU + 유휴 TTL 기반 에이전트/체크포인트 정리"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+
+from . import metrics
+from .agent import TravelAgent
+from .graph import get_checkpointer
+
+
+# 최대 동시 세션 수 (초과 시 가장 오래 사용하지 않은 세션부터 제거)
+SESSION_MAX = int(os.getenv("SESSION_MAX", "1000"))
+# 유휴 세션 만료 시간 (초)
+SESSION_IDLE_TTL = float(os.getenv("SESSION_IDLE_TTL", "1800"))
+# 백그라운드 정리 주기 (초)
+SESSION_SWEEP_INTERVAL = float(os.getenv("SESSION_SWEEP_INTERVAL", "60"))
+
+
+class SessionManager:
+    """X-Client-ID별 TravelAgent 레지스트리
+
+    세션 제거 시 TravelAgent 인스턴스와 체크포인터의 해당 thread를 함께 삭제한다.
+    """
+
+    def __init__(self, max_sessions: int = SESSION_MAX, idle_ttl: float = SESSION_IDLE_TTL):
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        # client_id → (agent, 마지막 접근 시각), 접근 순서대로 정렬 (LRU)
+        self._sessions: OrderedDict[str, tuple[TravelAgent, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get_or_create(self, client_id: str) -> TravelAgent:
+        """세션 조회 (없으면 생성), 접근 시각 갱신"""
+        now = time.monotonic()
+        evicted = []
+        with self._lock:
+            entry = self._sessions.get(client_id)
+            if entry and now - entry[1] <= self.idle_ttl:
+                agent = entry[0]
+                self._sessions.move_to_end(client_id)
+            else:
+                if entry:
+                    # 만료된 세션은 기존 대화 기록을 버리고 새로 시작
+                    self._sessions.pop(client_id)
+                    evicted.append((client_id, "idle"))
+                agent = TravelAgent(thread_id=client_id)
+
+            self._sessions[client_id] = (agent, now)
+
+            # 최대 세션 수 초과 시 LRU 제거
+            while len(self._sessions) > self.max_sessions:
+                old_id, _ = self._sessions.popitem(last=False)
+                evicted.append((old_id, "lru"))
+
+        self._finalize_evictions(evicted)
+        return agent
+
+    def sweep(self) -> int:
+        """유휴 TTL이 지난 세션 정리, 제거된 세션 수 반환"""
+        now = time.monotonic()
+        evicted = []
+        with self._lock:
+            # OrderedDict가 접근 순서이므로 앞에서부터 만료된 것만 확인
+            for client_id, (_, last_seen) in list(self._sessions.items()):
+                if now - last_seen <= self.idle_ttl:
+                    break
+                self._sessions.pop(client_id)
+                evicted.append((client_id, "idle"))
+
+        self._finalize_evictions(evicted)
+        return len(evicted)
+
+    def _finalize_evictions(self, evicted: list[tuple[str, str]]) -> None:
+        """제거된 세션의 체크포인트 삭제 및 메트릭 갱신 (락 밖에서 실행)"""
+        checkpointer = get_checkpointer()
+        for client_id, reason in evicted:
+            try:
+                checkpointer.delete_thread(client_id)
+            except Exception as e:
+                print(f"[Session] Failed to delete checkpoint for {client_id}: {e}")
+            metrics.inc(f"sessions_evicted_{reason}")
+            print(f"[Session] Evicted {client_id} ({reason})")
+
+        metrics.set_gauge("sessions_live", len(self._sessions))
+
+
+# 싱글톤 세션 매니저
+_session_manager: SessionManager | None = None
+
+
+def get_session_manager() -> SessionManager:
+    """싱글톤 세션 매니저 반환"""
+    global _session_manager
+    if _session_manager is None:
+        _session_manager = SessionManager()
+    return _session_manager
@@ -0,0 +1,149 @@
+"""SSE 스트림 유틸리티 - 답변 토큰 묶음 전송, 연결 끊김 시 취소
+
+conversation_stream은 모델 토큰마다 answer 이벤트를 내보내므로 그대로 쓰면 토큰 수만큼 인코딩/소켓 쓰기가 발생한다.
+coalesce_answers는 연속된 answer 이벤트를 모아 최대 지연(ANSWER_FLUSH_MS) 또는 최대 바이트(ANSWER_FLUSH_BYTES)에
+도달하면 한 이벤트로 내보낸다. status/thought/done 등 다른 이벤트가 오면 모아둔 답변을 먼저 보내 순서를 유지한다.
+
+cancel_on_disconnect는 다음 이벤트를 기다리는 동안 클라이언트 연결을 주기적으로 확인해, 끊겼으면 원본 스트림
+(그래프 실행 포함)을 취소한다. 쓰기가 없는 구간(검색 등)에서도 끊긴 요청이 끝까지 실행되지 않도록 한다.
+"""
+
+import os
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable
+
+from . import metrics
+
+
+# 답변 묶음 최대 지연 (ms, 0이면 묶지 않음)
+ANSWER_FLUSH_MS = float(os.getenv("ANSWER_FLUSH_MS", "30"))
+# 답변 묶음 최대 크기 (UTF-8 바이트)
+ANSWER_FLUSH_BYTES = int(os.getenv("ANSWER_FLUSH_BYTES", "512"))
+# 이벤트 대기 중 클라이언트 연결 확인 주기 (초)
+DISCONNECT_CHECK_INTERVAL = float(os.getenv("DISCONNECT_CHECK_INTERVAL", "0.5"))
+
+_END = object()
+
+
+class _SourceError:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+async def coalesce_answers(
+    source: AsyncIterator[dict],
+    max_delay_ms: float = ANSWER_FLUSH_MS,
+    max_bytes: int = ANSWER_FLUSH_BYTES,
+) -> AsyncIterator[dict]:
+    """연속된 answer 이벤트를 지연/크기 기준으로 묶어서 전달 (다른 이벤트는 그대로, 순서 유지)"""
+    if max_delay_ms <= 0:
+        async for event in source:
+            yield event
+        return
+
+    loop = asyncio.get_running_loop()
+    max_delay = max_delay_ms / 1000
+    # 원본 스트림은 별도 태스크에서 읽으며 답변을 모으고, 내보낼 이벤트만 큐에 넣음
+    # (원본이 멈춰 있어도 타이머로 지연 기준 flush 가능, 토큰당 비용은 리스트 추가뿐)
+    queue: asyncio.Queue = asyncio.Queue()
+    parts: list[str] = []
+    size = 0
+    timer: asyncio.TimerHandle | None = None
+    tokens_in = 0
+
+    def flush() -> None:
+        nonlocal parts, size, timer
+        if timer is not None:
+            timer.cancel()
+            timer = None
+        if parts:
+            queue.put_nowait({"type": "answer", "text": "".join(parts)})
+            metrics.inc("sse_answer_batches")
+            parts, size = [], 0
+
+    async def pump() -> None:
+        nonlocal size, timer, tokens_in
+        try:
+            async for event in source:
+                if event.get("type") == "answer":
+                    text = event.get("text", "")
+                    parts.append(text)
+                    size += len(text.encode("utf-8"))
+                    tokens_in += 1
+                    if size >= max_bytes:
+                        flush()
+                    elif timer is None:
+                        timer = loop.call_later(max_delay, flush)
+                    continue
+                # 다른 이벤트 앞에서는 모아둔 답변을 먼저 전송
+                flush()
+                queue.put_nowait(event)
+            flush()
+        except Exception as e:
+            flush()
+            queue.put_nowait(_SourceError(e))
+        finally:
+            if timer is not None:
+                timer.cancel()
+            queue.put_nowait(_END)
+
+    task = asyncio.create_task(pump())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END:
+                break
+            if isinstance(item, _SourceError):
+                raise item.error
+            yield item
+    finally:
+        metrics.inc("sse_answer_tokens", tokens_in)
+        if not task.done():
+            task.cancel()
+
+
+
+async def cancel_on_disconnect(
+    source: AsyncIterator[dict],
+    is_disconnected: Callable[[], Awaitable[bool]],
+    interval: float = DISCONNECT_CHECK_INTERVAL,
+) -> AsyncIterator[dict]:
+    """클라이언트 연결이 끊기면 source(그래프 실행 포함)를 취소하고 스트림 종료
+
+    source는 태스크 하나에서 끝까지 읽고, 감시 태스크가 interval마다 연결을 확인한다.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump() -> None:
+        try:
+            async for event in source:
+                queue.put_nowait(event)
+        except Exception as e:
+            queue.put_nowait(_SourceError(e))
+        finally:
+            queue.put_nowait(_END)
+
+    async def watch() -> None:
+        while True:
+            await asyncio.sleep(interval)
+            if await is_disconnected():
+                print("[Stream] Client disconnected, cancelling")
+                metrics.inc("stream_disconnect_cancelled")
+                # pump 취소 → 원본 제너레이터(그래프 실행)까지 취소 전파, pump가 _END를 넣어 스트림 종료
+                task.cancel()
+                return
+
+    task = asyncio.create_task(pump())
+    watcher = asyncio.create_task(watch())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END:
+                break
+            if isinstance(item, _SourceError):
+                raise item.error
+            yield item
+    finally:
+        watcher.cancel()
+        if not task.done():
+            task.cancel()
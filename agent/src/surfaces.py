@@ -0,0 +1,125 @@
+"""Surface 정의(컴포넌트 트리) 버전 관리 및 참조 전송
+
+정적 컴포넌트 트리는 내용 해시로 버전을 붙여 GET /catalog/{catalogId}/surfaces/{surfaceId}로도 제공한다.
+채팅 응답의 updateComponents에는 version이 함께 실리고, 클라이언트가 X-Known-Surfaces 헤더로
+이미 가진 버전을 알려주면 컴포넌트 대신 참조({"surfaceId", "definitionRef"})만 보낸다.
+"""
+
+import hashlib
+import threading
+from typing import Any, Callable
+
+from . import metrics
+from .payload import EncodedPayload, dumps
+
+
+class SurfaceDefinition:
+    """버전이 붙은 Surface 컴포넌트 트리"""
+
+    def __init__(self, catalog_id: str, surface_id: str, components: list[dict]):
+        self.catalog_id = catalog_id
+        self.surface_id = surface_id
+        self.components = components
+        self.version = hashlib.sha256(dumps([catalog_id, surface_id, components])).hexdigest()[:16]
+        self.etag = f'"{self.version}"'
+        # GET 응답 본문
+        self.encoded = dumps({
+            "catalogId": catalog_id,
+            "surfaceId": surface_id,
+            "version": self.version,
+            "components": components,
+        })
+        # 채팅 응답용 메시지 (전체 / 참조)
+        self.message = SurfaceMessage(self, {
+            "updateComponents": {"surfaceId": surface_id, "components": components, "version": self.version}
+        })
+        self.ref_message = EncodedPayload({
+            "updateComponents": {
+                "surfaceId": surface_id,
+                "definitionRef": {"catalogId": catalog_id, "version": self.version},
+            }
+        })
+
+
+class SurfaceMessage(EncodedPayload):
+    """정의를 가리키는 updateComponents 메시지 (참조로 바꿀 수 있음)"""
+
+    def __init__(self, definition: SurfaceDefinition, message: dict):
+        super().__init__(message)
+        self.definition = definition
+
+
+class SurfaceRegistry:
+    """코드에서 정의하는 Surface(결과 화면, 초기 UI) 정의 저장소
+
+    JSON 설정 기반 폼은 FormRegistry가 관리한다.
+    """
+
+    def __init__(self):
+        self._definitions: dict[tuple[str, str], tuple[Any, SurfaceDefinition]] = {}
+        self._lock = threading.Lock()
+
+    def define(
+        self, catalog_id: str, surface_id: str, version_key: Any, build_components: Callable[[], list[dict]]
+    ) -> SurfaceDefinition:
+        """정의 반환 (version_key가 바뀌었을 때만 build_components()로 다시 생성)"""
+        key = (catalog_id, surface_id)
+        entry = self._definitions.get(key)
+        if entry is not None and entry[0] == version_key:
+            return entry[1]
+        definition = SurfaceDefinition(catalog_id, surface_id, build_components())
+        with self._lock:
+            self._definitions[key] = (version_key, definition)
+        return definition
+
+    def get(self, catalog_id: str, surface_id: str) -> SurfaceDefinition | None:
+        entry = self._definitions.get((catalog_id, surface_id))
+        return entry[1] if entry else None
+
+
+def parse_known_surfaces(header: str | None) -> dict[str, str]:
+    """X-Known-Surfaces 헤더 파싱 ("flight-booking=abc123,hotel-booking=def456")"""
+    known = {}
+    if not header:
+        return known
+    for item in header.split(","):
+        surface_id, sep, version = item.strip().partition("=")
+        if sep and surface_id and version:
+            known[surface_id] = version
+    return known
+
+
+def compact_messages(messages: list, known: dict[str, str]) -> list:
+    """클라이언트가 이미 가진 버전의 updateComponents를 참조 메시지로 교체"""
+    if not known:
+        return messages
+    compacted = []
+    for message in messages:
+        if isinstance(message, SurfaceMessage):
+            definition = message.definition
+            if known.get(definition.surface_id) == definition.version:
+                metrics.inc("surface_definitions_referenced")
+                message = definition.ref_message
+        compacted.append(message)
+    return compacted
+
+
+def get_surface_definition(catalog_id: str, surface_id: str) -> SurfaceDefinition | None:
+    """GET /catalog/{catalogId}/surfaces/{surfaceId}용 정의 조회 (폼 설정 → 코드 정의 순)"""
+    from .forms import get_form_registry
+
+    form = get_form_registry().get_by_surface(surface_id)
+    if form is not None and form.definition.catalog_id == catalog_id:
+        return form.definition
+    return get_surface_registry().get(catalog_id, surface_id)
+
+
+_surface_registry: SurfaceRegistry | None = None
+
+
+def get_surface_registry() -> SurfaceRegistry:
+    """코드 정의 Surface 저장소 싱글톤"""
+    global _surface_registry
+    if _surface_registry is None:
+        _surface_registry = SurfaceRegistry()
+    return _surface_registry
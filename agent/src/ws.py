@@ -0,0 +1,227 @@
+"""WebSocket 전송 - 클라이언트당 연결 하나로 채팅/userAction/스트리밍 이벤트를 주고받음
+
+요청마다 POST + 새 SSE 응답을 여는 대신, 연결 하나에서 handle_message_stream과 같은 이벤트를 보낸다.
+
+프로토콜 (JSON 텍스트 프레임):
+- 클라이언트 → 서버
+  {"id": "r1", "text": ..., "currentData": ..., "surfaceId": ..., "knownSurfaces": "flight-booking=abc,..."}
+  {"id": "r2", "userAction": {...}}
+  {"type": "cancel"}  진행 중 요청 취소
+  {"type": "ping"} / {"type": "pong"}
+- 서버 → 클라이언트
+  SSE와 같은 이벤트(status/thought/answer/message/done/error)에 요청 id를 붙여 전송
+  {"type": "ping"}  WS_PING_INTERVAL 동안 수신이 없으면 전송, 이후 WS_PING_TIMEOUT 안에 응답이 없으면 연결 종료
+
+요청은 연결당 하나씩 처리하며, 진행 중에 새 요청이 오면 이전 요청을 취소한다 (SSE 클라이언트의 abort와 동일).
+전송 큐는 WS_SEND_QUEUE개로 제한되어 느린 클라이언트는 에이전트 스트림을 멈추게 하고(backpressure),
+WS_SEND_TIMEOUT 동안 큐에 넣지 못하면 연결을 끊는다.
+"""
+
+import os
+import json
+import time
+import asyncio
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from . import metrics
+from .payload import encode_response
+from .streaming import coalesce_answers
+from .surfaces import compact_messages, parse_known_surfaces
+from .session import get_session_manager
+
+
+# 서버 ping 주기 (초, 이 시간 동안 수신이 없을 때만 전송)
+WS_PING_INTERVAL = float(os.getenv("WS_PING_INTERVAL", "20"))
+# ping 후 응답 대기 시간 (초)
+WS_PING_TIMEOUT = float(os.getenv("WS_PING_TIMEOUT", "20"))
+# 연결별 전송 큐 크기 (이벤트 수)
+WS_SEND_QUEUE = int(os.getenv("WS_SEND_QUEUE", "64"))
+# 전송 큐가 가득 찬 상태로 기다릴 최대 시간 (초, 초과 시 연결 종료)
+WS_SEND_TIMEOUT = float(os.getenv("WS_SEND_TIMEOUT", "10"))
+
+# 애플리케이션 close code
+CLOSE_REPLACED = 4000       # 같은 clientId로 새 연결이 열림
+CLOSE_SLOW_CONSUMER = 4001  # 전송 큐가 비워지지 않음
+CLOSE_PING_TIMEOUT = 4002   # ping 응답 없음
+
+_PING = encode_response({"type": "ping"}).decode("utf-8")
+_PONG = encode_response({"type": "pong"}).decode("utf-8")
+
+
+class _SlowConsumer(Exception):
+    pass
+
+
+class ChatConnection:
+    """clientId 하나의 WebSocket 연결"""
+
+    def __init__(self, websocket: WebSocket, client_id: str):
+        self.websocket = websocket
+        self.client_id = client_id
+        self._outbox: asyncio.Queue = asyncio.Queue(maxsize=WS_SEND_QUEUE)
+        self._request: asyncio.Task | None = None
+        self._last_received = time.monotonic()
+        self._closed = False
+
+    async def run(self) -> None:
+        """수신 루프 (연결이 끊길 때까지), 전송/ping은 별도 태스크"""
+        writer = asyncio.create_task(self._writer())
+        pinger = asyncio.create_task(self._pinger())
+        try:
+            while True:
+                text = await self.websocket.receive_text()
+                self._last_received = time.monotonic()
+                try:
+                    frame = json.loads(text)
+                except ValueError:
+                    self._send_control({"type": "error", "error": "invalid JSON"})
+                    continue
+                if not isinstance(frame, dict):
+                    continue
+
+                control = frame.get("type")
+                if control == "pong":
+                    continue
+                if control == "ping":
+                    self._send_control(_PONG)
+                elif control == "cancel":
+                    self._cancel_request()
+                elif "text" in frame or "userAction" in frame:
+                    # 이전 요청이 남아 있으면 취소 후 새 요청 시작
+                    self._cancel_request()
+                    self._request = asyncio.create_task(self._handle_request(frame))
+        except (WebSocketDisconnect, RuntimeError):
+            # RuntimeError: 서버 쪽에서 먼저 닫은 뒤의 수신 (ping 타임아웃, 새 연결로 교체)
+            pass
+        finally:
+            self._closed = True
+            self._cancel_request()
+            writer.cancel()
+            pinger.cancel()
+
+    async def close(self, code: int, reason: str) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self.websocket.close(code=code, reason=reason)
+        except Exception:
+            pass
+
+    def _cancel_request(self) -> None:
+        if self._request is not None and not self._request.done():
+            self._request.cancel()
+            metrics.inc("ws_requests_cancelled")
+        self._request = None
+
+    async def _handle_request(self, frame: dict) -> None:
+        """요청 하나를 처리하며 이벤트를 전송 큐에 넣음 (/chat/stream과 같은 이벤트)"""
+        request_id = frame.get("id")
+        message = {}
+        if frame.get("text"):
+            message["text"] = frame["text"]
+            if frame.get("currentData"):
+                message["currentData"] = frame["currentData"]
+            if frame.get("surfaceId"):
+                message["surfaceId"] = frame["surfaceId"]
+        elif frame.get("userAction"):
+            message["userAction"] = frame["userAction"]
+        known_surfaces = parse_known_surfaces(frame.get("knownSurfaces"))
+        metrics.inc("ws_requests")
+
+        agent = get_session_manager().get_or_create(self.client_id)
+        try:
+            # 연속된 answer 토큰은 묶어서 전송 (프레임 수 감소)
+            async for event in coalesce_answers(agent.handle_message_stream(message)):
+                # 클라이언트가 가진 Surface 정의는 참조로 대체
+                if known_surfaces:
+                    if "messages" in event:
+                        event = {**event, "messages": compact_messages(event["messages"], known_surfaces)}
+                    elif "message" in event:
+                        event = {**event, "message": compact_messages([event["message"]], known_surfaces)[0]}
+                await self._send({**event, "id": request_id})
+        except _SlowConsumer:
+            return
+        except Exception as e:
+            print(f"[WebSocket] Request error ({self.client_id}): {e}")
+            self._send_control({"type": "error", "error": str(e), "id": request_id})
+
+    async def _send(self, item) -> None:
+        """전송 큐에 추가 (가득 차 있으면 대기 = backpressure, 너무 오래 걸리면 연결 종료)"""
+        if self._closed:
+            raise _SlowConsumer()
+        if isinstance(item, dict):
+            item = encode_response(item).decode("utf-8")
+        try:
+            self._outbox.put_nowait(item)
+            return
+        except asyncio.QueueFull:
+            metrics.inc("ws_send_waits")
+        try:
+            await asyncio.wait_for(self._outbox.put(item), WS_SEND_TIMEOUT)
+        except asyncio.TimeoutError:
+            print(f"[WebSocket] Slow consumer, closing ({self.client_id})")
+            metrics.inc("ws_slow_consumer_closed")
+            await self.close(CLOSE_SLOW_CONSUMER, "slow consumer")
+            raise _SlowConsumer()
+
+    def _send_control(self, item) -> None:
+        """제어/오류 프레임 전송 (큐가 가득 차 있으면 생략, 수신 루프를 막지 않음)"""
+        if isinstance(item, dict):
+            item = encode_response(item).decode("utf-8")
+        try:
+            self._outbox.put_nowait(item)
+        except asyncio.QueueFull:
+            pass
+
+    async def _writer(self) -> None:
+        try:
+            while True:
+                text = await self._outbox.get()
+                await self.websocket.send_text(text)
+                metrics.inc("ws_frames_sent")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # 전송 실패 = 연결 끊김 (수신 루프가 정리)
+            self._closed = True
+
+    async def _pinger(self) -> None:
+        while not self._closed:
+            idle = time.monotonic() - self._last_received
+            if idle < WS_PING_INTERVAL:
+                await asyncio.sleep(WS_PING_INTERVAL - idle)
+                continue
+            if idle >= WS_PING_INTERVAL + WS_PING_TIMEOUT:
+                print(f"[WebSocket] Ping timeout, closing ({self.client_id})")
+                metrics.inc("ws_ping_timeouts")
+                await self.close(CLOSE_PING_TIMEOUT, "ping timeout")
+                return
+            # 큐가 가득 차 있으면 ping 생략 (응답 대기 시간은 그대로 적용)
+            self._send_control(_PING)
+            await asyncio.sleep(WS_PING_TIMEOUT)
+
+
+# clientId → 현재 연결 (clientId당 연결 하나)
+_connections: dict[str, ChatConnection] = {}
+
+
+async def serve_websocket(websocket: WebSocket, client_id: str) -> None:
+    """/ws 연결 처리 (같은 clientId의 이전 연결은 종료)"""
+    await websocket.accept()
+    connection = ChatConnection(websocket, client_id)
+    previous = _connections.get(client_id)
+    _connections[client_id] = connection
+    if previous is not None:
+        metrics.inc("ws_connections_replaced")
+        await previous.close(CLOSE_REPLACED, "replaced by new connection")
+
+    metrics.inc("ws_connections")
+    metrics.set_gauge("ws_connections_open", len(_connections))
+    try:
+        await connection.run()
+    finally:
+        if _connections.get(client_id) is connection:
+            del _connections[client_id]
+        metrics.set_gauge("ws_connections_open", len(_connections))
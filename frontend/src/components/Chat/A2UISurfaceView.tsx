@@ -8,6 +8,7 @@
 
 import type { Surface } from "../../hooks/useA2UI";
 import type { A2UIComponent } from "../../types/a2ui";
+import { resolveCatalog, useCatalogRevision } from "../../services/catalog";
 import "../../components/A2UI/A2UIRenderer.css";
 
 interface A2UISurfaceRendererProps {
@@ -18,6 +19,8 @@ interface A2UISurfaceRendererProps {
 
 export function A2UISurfaceRenderer({ surface, onAction, onValueChange }: A2UISurfaceRendererProps) {
   const activeSurface = surface;
+  // 옵션 카탈로그가 로드되면 다시 렌더링
+  useCatalogRevision();
 
   if (!activeSurface) {
     return (
@@ -111,7 +114,7 @@ function ComponentRenderer({ component, surface, onAction, onValueChange }: Comp
   const getOptions = (): Array<{ value: string; label: string }> => {
     if (!component.options) return [];
     if (typeof component.options === "string") {
-      const opts = getBoundValue(component.options);
+      const opts = resolveCatalog(getBoundValue(component.options));
       return Array.isArray(opts) ? opts : [];
     }
     return component.options;
@@ -456,6 +459,9 @@ function ResultCard({ item, template, onSelect }: ResultCardProps) {
               <span className="airport">{item.arrival as string}</span>
             </div>
           </div>
+          {typeof item.returnFlight === 'string' && (
+            <div className="flight-return">{item.returnFlight}</div>
+          )}
         </div>
         <div className="result-card-footer">
           <span className="price">{formatPrice(item.price as number)}</span>
@@ -476,6 +482,9 @@ function ResultCard({ item, template, onSelect }: ResultCardProps) {
         </div>
         <div className="result-card-body">
           <div className="hotel-location">📍 {item.location as string}</div>
+          {typeof item.stay === 'string' && (
+            <div className="hotel-stay">{item.stay}</div>
+          )}
           <div className="hotel-amenities">
             {amenities.slice(0, 3).map((amenity, idx) => (
               <span key={idx} className="amenity-tag">{amenity}</span>
@@ -501,6 +510,9 @@ function ResultCard({ item, template, onSelect }: ResultCardProps) {
         </div>
         <div className="result-card-body">
           <div className="car-company">🚗 {item.company as string}</div>
+          {typeof item.rental === 'string' && (
+            <div className="car-rental">{item.rental}</div>
+          )}
           <div className="car-features">
             {features.slice(0, 3).map((feature, idx) => (
               <span key={idx} className="feature-tag">{feature}</span>
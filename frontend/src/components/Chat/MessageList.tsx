@@ -65,8 +65,9 @@ function A2UIPreview({ message, onAction }: A2UIPreviewProps) {
 
   // updateComponents 메시지 처리
   if ("updateComponents" in msg) {
-    const update = msg.updateComponents as { surfaceId: string; components: Array<{ id: string; component: string; text?: string; action?: string; children?: string[] }> };
-    const components = update.components;
+    const update = msg.updateComponents as { surfaceId: string; components?: Array<{ id: string; component: string; text?: string; action?: string; children?: string[] }> };
+    // 참조(definitionRef)만 온 경우 미리보기할 컴포넌트 없음
+    const components = update.components ?? [];
     const surfaceId = update.surfaceId;
 
     // 간단한 미리보기 렌더링
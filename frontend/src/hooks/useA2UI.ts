@@ -12,6 +12,9 @@ import type {
   UpdateDataModelMessage,
   DeleteSurfaceMessage,
 } from "../types/a2ui";
+import { ensureCatalog, isCatalogRef } from "../services/catalog";
+import { getApiService } from "../services/api";
+import { getSurfaceDefinition, rememberSurfaceDefinition } from "../services/surfaces";
 
 export interface Surface {
   surfaceId: string;
@@ -35,6 +38,37 @@ export function useA2UI() {
    * A2UI 메시지 처리
    */
   const processMessage = useCallback((message: A2UIMessage) => {
+    // Surface 정의: 버전이 있으면 보관, 참조만 왔으면 보관본(없으면 서버에서 조회)으로 대체
+    if ("updateComponents" in message) {
+      const { surfaceId, components, version, definitionRef } = (message as UpdateComponentsMessage).updateComponents;
+      if (components && version) {
+        rememberSurfaceDefinition(surfaceId, version, components);
+      } else if (!components && definitionRef) {
+        const cached = getSurfaceDefinition(surfaceId, definitionRef.version);
+        if (!cached) {
+          getApiService()
+            .getSurfaceDefinition(definitionRef.catalogId, surfaceId, definitionRef.version)
+            .then((fetched) => {
+              processMessage({ updateComponents: { surfaceId, components: fetched, version: definitionRef.version } });
+            })
+            .catch((error) => {
+              console.error("Failed to load surface definition:", surfaceId, error);
+            });
+          return;
+        }
+        message = { updateComponents: { surfaceId, components: cached } };
+      }
+    }
+
+    // 옵션 카탈로그 참조는 렌더링 전에 미리 로드
+    if ("updateDataModel" in message) {
+      for (const op of (message as UpdateDataModelMessage).updateDataModel.operations) {
+        if (isCatalogRef(op.value)) {
+          ensureCatalog(op.value);
+        }
+      }
+    }
+
     setState((prev) => {
       const newSurfaces = new Map(prev.surfaces);
       let newActiveSurfaceId = prev.activeSurfaceId;
@@ -55,7 +89,7 @@ export function useA2UI() {
       // updateComponents 처리
       if ("updateComponents" in message) {
         const msg = message as UpdateComponentsMessage;
-        const { surfaceId, components } = msg.updateComponents;
+        const { surfaceId, components = [] } = msg.updateComponents;
         const surface = newSurfaces.get(surfaceId);
         if (surface) {
           const newComponents = new Map(surface.components);
@@ -221,15 +255,53 @@ function applyOperation(
   dataModel: Record<string, unknown>,
   op: { op: string; path: string; value?: unknown }
 ) {
-  const path = op.path.split("/").filter(Boolean);
+  // JSON Pointer(RFC 6901) 토큰 분리 + 이스케이프 해제
+  const path = op.path
+    .split("/")
+    .slice(1)
+    .map((token) => token.replace(/~1/g, "/").replace(/~0/g, "~"));
+  if (path.length === 0) return;
+
+  // 경로상의 객체/배열은 복사 후 수정 (이전 상태 객체를 직접 변경하지 않음)
+  let current: Record<string, unknown> | unknown[] = dataModel;
+  for (let i = 0; i < path.length - 1; i++) {
+    const key = path[i];
+    const child = Array.isArray(current) ? current[Number(key)] : current[key];
+    const copy =
+      Array.isArray(child) ? [...child] : child && typeof child === "object" ? { ...(child as object) } : {};
+    if (Array.isArray(current)) {
+      current[Number(key)] = copy;
+    } else {
+      current[key] = copy;
+    }
+    current = copy as Record<string, unknown> | unknown[];
+  }
+
+  const last = path[path.length - 1];
+  // RFC 6902: 배열 add는 삽입("-"는 끝에 추가), remove는 원소 제거
+  if (Array.isArray(current)) {
+    const index = last === "-" ? current.length : Number(last);
+    switch (op.op) {
+      case "add":
+        current.splice(index, 0, op.value);
+        break;
+      case "replace":
+        current[index] = op.value;
+        break;
+      case "remove":
+        current.splice(index, 1);
+        break;
+    }
+    return;
+  }
 
   switch (op.op) {
     case "add":
     case "replace":
-      setNestedValue(dataModel, path, op.value);
+      current[last] = op.value;
       break;
     case "remove":
-      removeNestedValue(dataModel, path);
+      delete current[last];
       break;
   }
 }
@@ -265,20 +337,6 @@ function getNestedValue(obj: Record<string, unknown>, path: string[]): unknown {
   return current;
 }
 
-/**
- * 중첩 객체에서 값 제거
- */
-function removeNestedValue(obj: Record<string, unknown>, path: string[]) {
-  if (path.length === 0) return;
-
-  let current = obj;
-  for (let i = 0; i < path.length - 1; i++) {
-    if (!(path[i] in current)) return;
-    current = current[path[i]] as Record<string, unknown>;
-  }
-  delete current[path[path.length - 1]];
-}
-
 /**
  * 컴포넌트 트리 빌드
  */
@@ -151,6 +151,11 @@ export function useChat() {
         }));
         break;
 
+      case "message":
+        // 완료 전에 먼저 도착한 A2UI 메시지 (폼 골격, 노드가 만든 메시지) 즉시 반영
+        processServerMessages([event.message as A2UIMessage]);
+        break;
+
       case "done":
         // 최종 메시지 처리
         if (event.messages && Array.isArray(event.messages)) {
@@ -213,30 +218,13 @@ export function useChat() {
       };
 
       setError(null);
+      resetStreaming();
       setIsLoading(true);
-      try {
-        const response = await api.sendMessage(actionMessage);
 
-        if (response.success && response.data) {
-          const responseData = response.data as { messages?: A2UIMessage[] };
-
-          // 여러 메시지 처리 (assistantMessage 포함)
-          if (responseData.messages && Array.isArray(responseData.messages)) {
-            processServerMessages(responseData.messages);
-          }
-        } else if (!response.success) {
-          if (response.error !== "aborted") {
-            setError("요청 처리에 실패했습니다. 다시 시도해주세요.");
-          }
-        }
-      } catch (err) {
-        console.error("Failed to send action:", err);
-        setError("요청 처리에 실패했습니다. 다시 시도해주세요.");
-      } finally {
-        setIsLoading(false);
-      }
+      // 스트리밍으로 전송 (상태 표시 후 이전 결과 삭제 → 새 Surface 순서로 바로 반영)
+      await api.sendMessageStream(actionMessage, handleStreamEvent);
     },
-    [api, processServerMessages]
+    [api, handleStreamEvent, resetStreaming]
   );
 
   return {
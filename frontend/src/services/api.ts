@@ -2,6 +2,10 @@
  * REST API 서비스 - Agent 서버와 통신
  */
 
+import { knownSurfacesHeader } from "./surfaces";
+import { ChatSocket } from "./socket";
+import type { A2UIComponent } from "../types/a2ui";
+
 // UUID 생성 함수 (crypto.randomUUID 폴백)
 function generateUUID(): string {
   if (typeof crypto !== "undefined" && crypto.randomUUID) {
@@ -35,6 +39,7 @@ export type StreamEvent =
   | { type: "status"; text: string }           // 상태 변경 (예: "검색 중...", "분석 중...")
   | { type: "thought"; text: string }          // 사고 로그 추가
   | { type: "answer"; text: string }           // 답변 토큰 (스트리밍)
+  | { type: "message"; message: unknown }      // 완료 전 먼저 적용할 A2UI 메시지 (폼 골격, 안내 문구, 폼/데이터 변경)
   | { type: "done"; messages: unknown[]; reasoning?: string }  // 완료
   | { type: "error"; error: string };
 
@@ -42,22 +47,54 @@ class ApiService {
   private baseUrl: string;
   private clientId: string;
   private currentAbortController: AbortController | null = null;
+  private socket: ChatSocket | null = null;
 
   constructor(baseUrl: string) {
     this.baseUrl = baseUrl;
     this.clientId = generateUUID();
   }
 
+  /**
+   * WebSocket 연결 시작 (연결되어 있는 동안 스트리밍 요청은 WebSocket으로 전송)
+   */
+  connectSocket(): void {
+    if (!this.socket) {
+      const wsUrl = this.baseUrl.replace(/^http/, "ws");
+      this.socket = new ChatSocket(`${wsUrl}/ws?clientId=${encodeURIComponent(this.clientId)}`);
+    }
+    this.socket.connect();
+  }
+
+  isSocketOpen(): boolean {
+    return this.socket?.isOpen() ?? false;
+  }
+
   /**
    * 현재 진행 중인 요청 취소
    */
   abortCurrentRequest(): boolean {
+    const socketAborted = this.socket?.cancel() ?? false;
     if (this.currentAbortController) {
       this.currentAbortController.abort();
       this.currentAbortController = null;
       return true;
     }
-    return false;
+    return socketAborted;
+  }
+
+  /**
+   * 채팅 요청 헤더 (이미 가진 Surface 정의 버전 포함 → 서버가 컴포넌트 대신 참조만 전송)
+   */
+  private chatHeaders(): Record<string, string> {
+    const headers: Record<string, string> = {
+      "Content-Type": "application/json",
+      "X-Client-ID": this.clientId,
+    };
+    const known = knownSurfacesHeader();
+    if (known) {
+      headers["X-Known-Surfaces"] = known;
+    }
+    return headers;
   }
 
   async getInitialUI(): Promise<ChatResponse> {
@@ -94,10 +131,7 @@ class ApiService {
     try {
       const response = await fetch(`${this.baseUrl}/chat`, {
         method: "POST",
-        headers: {
-          "Content-Type": "application/json",
-          "X-Client-ID": this.clientId,
-        },
+        headers: this.chatHeaders(),
         body: JSON.stringify(request),
         signal: this.currentAbortController.signal,
       });
@@ -129,12 +163,19 @@ class ApiService {
   }
 
   /**
-   * SSE 스트리밍으로 메시지 전송
+   * 스트리밍으로 메시지 전송 (WebSocket이 연결되어 있으면 WebSocket, 아니면 SSE)
    */
   async sendMessageStream(
     request: ChatRequest,
     onEvent: (event: StreamEvent) => void
   ): Promise<void> {
+    if (this.socket?.isOpen()) {
+      // 진행 중인 SSE 요청만 취소 (WebSocket 이전 요청은 새 요청이 대체)
+      this.currentAbortController?.abort();
+      this.currentAbortController = null;
+      return this.socket.send(request, onEvent);
+    }
+
     // 이전 요청이 있으면 취소
     this.abortCurrentRequest();
     this.currentAbortController = new AbortController();
@@ -142,10 +183,7 @@ class ApiService {
     try {
       const response = await fetch(`${this.baseUrl}/chat/stream`, {
         method: "POST",
-        headers: {
-          "Content-Type": "application/json",
-          "X-Client-ID": this.clientId,
-        },
+        headers: this.chatHeaders(),
         body: JSON.stringify(request),
         signal: this.currentAbortController.signal,
       });
@@ -202,6 +240,34 @@ class ApiService {
     }
   }
 
+  /**
+   * 옵션 카탈로그 조회 (버전별 URL이라 브라우저 HTTP 캐시/ETag 재검증 사용)
+   */
+  async getOptionCatalog(name: string, version: string): Promise<unknown[]> {
+    const response = await fetch(
+      `${this.baseUrl}/options/${encodeURIComponent(name)}?v=${encodeURIComponent(version)}`
+    );
+    if (!response.ok) {
+      throw new Error(`HTTP error! status: ${response.status}`);
+    }
+    const data = (await response.json()) as { options?: unknown[] };
+    return Array.isArray(data.options) ? data.options : [];
+  }
+
+  /**
+   * Surface 정의 조회 (definitionRef를 가진 정의가 없을 때)
+   */
+  async getSurfaceDefinition(catalogId: string, surfaceId: string, version: string): Promise<A2UIComponent[]> {
+    const response = await fetch(
+      `${this.baseUrl}/catalog/${encodeURIComponent(catalogId)}/surfaces/${encodeURIComponent(surfaceId)}?v=${encodeURIComponent(version)}`
+    );
+    if (!response.ok) {
+      throw new Error(`HTTP error! status: ${response.status}`);
+    }
+    const data = (await response.json()) as { components?: A2UIComponent[] };
+    return Array.isArray(data.components) ? data.components : [];
+  }
+
   getClientId(): string {
     return this.clientId;
   }
@@ -214,6 +280,10 @@ export function getApiService(): ApiService {
   if (!apiService) {
     const apiUrl = import.meta.env.VITE_API_URL || "http://localhost:8003";
     apiService = new ApiService(apiUrl);
+    // VITE_TRANSPORT=sse면 WebSocket을 쓰지 않음
+    if (import.meta.env.VITE_TRANSPORT !== "sse") {
+      apiService.connectSocket();
+    }
   }
   return apiService;
 }
@@ -0,0 +1,85 @@
+/**
+ * 옵션 카탈로그 저장소
+ *
+ * 서버는 폼 데이터 모델에 옵션 목록 대신 {"$catalog": 이름, "version": 해시} 참조를 보낸다.
+ * 목록은 버전별로 한 번만 받아 메모리에 보관하고, 렌더링 시 참조를 목록으로 해석한다.
+ */
+
+import { useSyncExternalStore } from "react";
+import { getApiService } from "./api";
+
+export interface CatalogRef {
+  $catalog: string;
+  version: string;
+}
+
+const catalogs = new Map<string, unknown[]>();
+const pending = new Set<string>();
+const listeners = new Set<() => void>();
+let revision = 0;
+
+function keyOf(ref: CatalogRef): string {
+  return `${ref.$catalog}@${ref.version}`;
+}
+
+export function isCatalogRef(value: unknown): value is CatalogRef {
+  return (
+    !!value &&
+    typeof value === "object" &&
+    typeof (value as CatalogRef).$catalog === "string" &&
+    typeof (value as CatalogRef).version === "string"
+  );
+}
+
+function notify() {
+  revision += 1;
+  listeners.forEach((listener) => listener());
+}
+
+/**
+ * 카탈로그 로드 (이미 있거나 요청 중이면 무시)
+ */
+export function ensureCatalog(ref: CatalogRef): void {
+  const key = keyOf(ref);
+  if (catalogs.has(key) || pending.has(key)) return;
+  pending.add(key);
+  getApiService()
+    .getOptionCatalog(ref.$catalog, ref.version)
+    .then((options) => {
+      catalogs.set(key, options);
+      notify();
+    })
+    .catch((error) => {
+      console.error("Failed to load option catalog:", ref, error);
+    })
+    .finally(() => {
+      pending.delete(key);
+    });
+}
+
+/**
+ * 값이 카탈로그 참조면 목록으로 해석 (아직 로드 전이면 빈 배열)
+ */
+export function resolveCatalog(value: unknown): unknown {
+  if (!isCatalogRef(value)) return value;
+  const options = catalogs.get(keyOf(value));
+  if (!options) {
+    ensureCatalog(value);
+    return [];
+  }
+  return options;
+}
+
+function subscribe(listener: () => void) {
+  listeners.add(listener);
+  return () => {
+    listeners.delete(listener);
+  };
+}
+
+/**
+ * 카탈로그 로드 시 리렌더링 트리거
+ */
+export function useCatalogRevision(): number {
+  return useSyncExternalStore(subscribe, () => revision);
+}
@@ -0,0 +1,119 @@
+/**
+ * WebSocket 채팅 연결 (/ws)
+ *
+ * 클라이언트당 연결 하나로 텍스트/userAction 요청을 보내고 /chat/stream과 같은 이벤트를 받는다.
+ * 서버 이벤트에는 요청 id가 붙어 오며, 현재 요청이 아닌 이벤트(취소된 요청 등)는 버린다.
+ * 연결이 끊기면 지수 백오프로 다시 연결하고, 그동안 ApiService는 SSE로 전송한다.
+ */
+
+import { knownSurfacesHeader } from "./surfaces";
+import type { ChatRequest, StreamEvent } from "./api";
+
+// 서버가 같은 clientId의 새 연결로 교체한 경우 (재연결하지 않음)
+const CLOSE_REPLACED = 4000;
+const MAX_RETRY_DELAY = 30000;
+
+interface PendingRequest {
+  id: string;
+  onEvent: (event: StreamEvent) => void;
+  resolve: () => void;
+}
+
+export class ChatSocket {
+  private url: string;
+  private socket: WebSocket | null = null;
+  private pending: PendingRequest | null = null;
+  private nextId = 0;
+  private retryDelay = 1000;
+
+  constructor(url: string) {
+    this.url = url;
+  }
+
+  connect(): void {
+    if (this.socket) return;
+    const socket = new WebSocket(this.url);
+    this.socket = socket;
+
+    socket.onopen = () => {
+      this.retryDelay = 1000;
+    };
+
+    socket.onmessage = (event) => {
+      this.handleFrame(event.data as string);
+    };
+
+    socket.onclose = (event) => {
+      this.socket = null;
+      // 진행 중 요청은 실패 처리
+      this.finish({ type: "error", error: "connection closed" });
+      if (event.code === CLOSE_REPLACED) return;
+      setTimeout(() => this.connect(), this.retryDelay);
+      this.retryDelay = Math.min(this.retryDelay * 2, MAX_RETRY_DELAY);
+    };
+  }
+
+  isOpen(): boolean {
+    return this.socket?.readyState === WebSocket.OPEN;
+  }
+
+  /**
+   * 요청 전송 (done/error 이벤트까지 대기, 이전 요청은 서버에서 취소됨)
+   */
+  send(request: ChatRequest, onEvent: (event: StreamEvent) => void): Promise<void> {
+    this.finish({ type: "error", error: "aborted" });
+    const id = `r${++this.nextId}`;
+    return new Promise((resolve) => {
+      this.pending = { id, onEvent, resolve };
+      const frame: Record<string, unknown> = { ...request, id };
+      const known = knownSurfacesHeader();
+      if (known) {
+        frame.knownSurfaces = known;
+      }
+      this.socket?.send(JSON.stringify(frame));
+    });
+  }
+
+  /**
+   * 진행 중 요청 취소
+   */
+  cancel(): boolean {
+    if (!this.pending) return false;
+    if (this.isOpen()) {
+      this.socket?.send(JSON.stringify({ type: "cancel" }));
+    }
+    this.finish({ type: "error", error: "aborted" });
+    return true;
+  }
+
+  private handleFrame(data: string): void {
+    let event: StreamEvent & { id?: string };
+    try {
+      event = JSON.parse(data);
+    } catch (e) {
+      console.error("Failed to parse WebSocket frame:", e, data);
+      return;
+    }
+
+    // 서버 ping (연결 유지 확인)
+    if ((event.type as string) === "ping") {
+      this.socket?.send(JSON.stringify({ type: "pong" }));
+      return;
+    }
+    if (!this.pending || event.id !== this.pending.id) return;
+
+    if (event.type === "done" || event.type === "error") {
+      this.finish(event);
+    } else {
+      this.pending.onEvent(event);
+    }
+  }
+
+  private finish(event: StreamEvent): void {
+    const pending = this.pending;
+    if (!pending) return;
+    this.pending = null;
+    pending.onEvent(event);
+    pending.resolve();
+  }
+}
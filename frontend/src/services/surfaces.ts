@@ -0,0 +1,28 @@
+/**
+ * Surface 정의(컴포넌트 트리) 저장소
+ *
+ * 서버는 updateComponents에 version을 붙여 보내고, 요청 헤더(X-Known-Surfaces)로 알려준
+ * 버전은 컴포넌트 대신 definitionRef만 보낸다. 받은 정의는 surfaceId별 최신 버전만 보관한다.
+ */
+
+import type { A2UIComponent } from "../types/a2ui";
+
+const definitions = new Map<string, { version: string; components: A2UIComponent[] }>();
+
+export function rememberSurfaceDefinition(surfaceId: string, version: string, components: A2UIComponent[]) {
+  definitions.set(surfaceId, { version, components });
+}
+
+export function getSurfaceDefinition(surfaceId: string, version: string): A2UIComponent[] | null {
+  const definition = definitions.get(surfaceId);
+  return definition && definition.version === version ? definition.components : null;
+}
+
+/**
+ * X-Known-Surfaces 헤더 값 ("flight-booking=abc123,hotel-booking=def456")
+ */
+export function knownSurfacesHeader(): string {
+  return Array.from(definitions.entries())
+    .map(([surfaceId, { version }]) => `${surfaceId}=${version}`)
+    .join(",");
+}
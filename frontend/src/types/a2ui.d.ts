@@ -41,7 +41,9 @@ export interface CreateSurfaceMessage {
 export interface UpdateComponentsMessage {
   updateComponents: {
     surfaceId: string;
-    components: A2UIComponent[];
+    components?: A2UIComponent[];
+    version?: string;  // 정의 버전 (클라이언트 캐시 키)
+    definitionRef?: { catalogId: string; version: string };  // 캐시된 정의 참조 (components 대신)
   };
 }
 